@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dict-based model conversion vs schema-driven page decoding.
+
+Compares ``json.loads`` + ``Assignment.from_canvas_api`` (the path used by
+``CanvasClient``) with ``decode_assignments`` on the same page bytes.
+
+Usage:
+    python benchmarks/bench_decoder.py                 # synthetic pages
+    python benchmarks/bench_decoder.py pages/*.json    # recorded API pages
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from canvas_toolkit.models import Assignment
+from canvas_toolkit.models.decoder import decode_assignments, has_fast_decoder
+
+COURSE_ID = "12345"
+COURSE_NAME = "Strategy and Competitive Advantage"
+
+
+def synthetic_page(page_number: int, per_page: int = 100) -> bytes:
+    """Build a page shaped like /courses/:id/assignments with rubric and description."""
+    records = []
+    for i in range(per_page):
+        assignment_id = page_number * per_page + i
+        records.append({
+            "id": assignment_id,
+            "name": f"Week {i % 14 + 1} Case Analysis",
+            "description": "<p>" + "Read the case and prepare a two-page memo. " * 40 + "</p>",
+            "due_at": f"2026-03-{i % 28 + 1:02d}T23:59:00Z",
+            "lock_at": None,
+            "unlock_at": "2026-01-15T05:00:00Z",
+            "points_possible": 100.0,
+            "grading_type": "points",
+            "submission_types": ["online_upload", "online_text_entry"],
+            "has_submitted_submissions": bool(i % 2),
+            "html_url": f"https://school.instructure.com/courses/{COURSE_ID}/assignments/{assignment_id}",
+            "rubric": [
+                {
+                    "id": f"r{j}",
+                    "points": 25,
+                    "description": f"Criterion {j}",
+                    "long_description": "Detailed rating guidance. " * 10,
+                    "ratings": [{"id": f"r{j}_{k}", "points": k * 5, "description": "Rating"} for k in range(5)],
+                }
+                for j in range(4)
+            ],
+            "allowed_extensions": [],
+            "lock_info": {"asset_string": f"assignment_{assignment_id}"},
+        })
+    return json.dumps(records).encode("utf-8")
+
+
+def dict_path(pages):
+    """Current path: bytes -> dicts -> from_canvas_api."""
+    models = []
+    for page in pages:
+        for record in json.loads(page):
+            record["_course_id"] = COURSE_ID
+            record["_course_name"] = COURSE_NAME
+            models.append(Assignment.from_canvas_api(record))
+    return models
+
+
+def decoder_path(pages):
+    """Schema-driven path: bytes -> models."""
+    models = []
+    for page in pages:
+        models.extend(decode_assignments(page, COURSE_ID, COURSE_NAME))
+    return models
+
+
+def bench(label, func, pages, repeat=5):
+    """Run func over all pages and report the best throughput."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(func(pages))
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {count:>8} records  {best * 1000:>8.1f} ms  {count / best:>12,.0f} records/s")
+    return best
+
+
+def main():
+    if len(sys.argv) > 1:
+        pages = [Path(p).read_bytes() for p in sys.argv[1:]]
+    else:
+        pages = [synthetic_page(n) for n in range(100)]
+
+    size_mb = sum(len(p) for p in pages) / 1e6
+    print(f"{len(pages)} pages, {size_mb:.1f} MB, msgspec available: {has_fast_decoder()}")
+    baseline = bench("json + from_canvas_api", dict_path, pages)
+    fast = bench("decode_assignments", decoder_path, pages)
+    print(f"speedup: {baseline / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,23 @@
 """Canvas Assignment Exporter - Streamlit GUI"""
 
+import io
+import multiprocessing
 import streamlit as st
 from pathlib import Path
 from canvas_toolkit.client import CanvasClient, AuthenticationError, CanvasAPIError
 from canvas_toolkit.models import Assignment
 from canvas_toolkit.models.announcement import Announcement
 from canvas_toolkit.models.module import Module, ModuleItem
-from canvas_toolkit.writers import ExcelWriter, CSVWriter, JSONWriter
+from canvas_toolkit.utils.sorting import posted_date_key
+from canvas_toolkit.writers import ExcelWriter, CSVWriter, JSONWriter, ZipBundleWriter
+
+
+# Worker processes for converting large announcement batches. Kept small:
+# the server is shared by every session, and each export starts its own pool.
+CONVERSION_WORKERS = 2
+
+# Required for process pools in the PyInstaller build (no-op otherwise)
+multiprocessing.freeze_support()
 
 
 # Page config
@@ -214,14 +225,15 @@ def main():
                     )
 
                     # Convert to Announcement objects
-                    announcements = [
-                        Announcement.from_canvas_api(a)
-                        for a in announcements_data
-                    ]
+                    announcements = Announcement.from_canvas_api_batch(
+                        announcements_data,
+                        workers=CONVERSION_WORKERS,
+                        text_limit=Announcement.PREVIEW_LENGTH
+                    )
 
                     # Sort by posted date (newest first) for consistent display
                     if announcements:
-                        announcements.sort(key=lambda a: a.posted_at or "", reverse=True)
+                        announcements.sort(key=posted_date_key)
 
                     if not announcements:
                         st.info("No announcements found in the last 30 days")
@@ -251,36 +263,41 @@ def main():
                     st.error("No content found to export")
                     st.stop()
 
-                # Export to selected format
+                # Export to selected format (downloads are built in memory)
+                download_name = filename
+                bundled = False
                 if export_format == "Excel":
-                    writer = ExcelWriter(filename)
-                    output_path = writer.write(
+                    writer = ExcelWriter(io.BytesIO())
+                    output_buffer = writer.write(
                         assignments=assignments,
                         announcements=announcements,
                         modules=modules
                     )
                 elif export_format == "CSV":
-                    # Generate separate CSV files for each content type
-                    output_paths = []
-                    if assignments:
-                        csv_filename = filename.replace(".csv", "_assignments.csv")
-                        writer = CSVWriter(csv_filename)
-                        writer.write(assignments)
-                        output_paths.append(csv_filename)
-                    if announcements:
-                        csv_filename = filename.replace(".csv", "_announcements.csv")
-                        writer = CSVWriter(csv_filename)
-                        writer.write(announcements)
-                        output_paths.append(csv_filename)
-                    if modules:
-                        csv_filename = filename.replace(".csv", "_modules.csv")
-                        writer = CSVWriter(csv_filename)
-                        writer.write(modules)
-                        output_paths.append(csv_filename)
-                    output_path = output_paths[0]  # For download button
+                    csv_exports = [
+                        (content, items) for content, items in [
+                            ("assignments", assignments),
+                            ("announcements", announcements),
+                            ("modules", modules),
+                        ] if items
+                    ]
+                    if len(csv_exports) == 1:
+                        content, items = csv_exports[0]
+                        download_name = filename.replace(".csv", f"_{content}.csv")
+                        output_buffer = CSVWriter(io.BytesIO()).write(items)
+                    else:
+                        # One CSV per content type, bundled into a single zip
+                        bundled = True
+                        download_name = str(Path(filename).with_suffix(".zip"))
+                        writer = ZipBundleWriter(io.BytesIO(), prefix=Path(filename).stem)
+                        output_buffer = writer.write(
+                            assignments=assignments,
+                            announcements=announcements,
+                            modules=modules
+                        )
                 else:  # JSON
-                    writer = JSONWriter(filename)
-                    output_path = writer.write(
+                    writer = JSONWriter(io.BytesIO())
+                    output_buffer = writer.write(
                         assignments=assignments,
                         announcements=announcements,
                         modules=modules
@@ -312,25 +329,25 @@ def main():
                 else:
                     col3.metric("Module Items", 0)
 
-                # Download button
-                if export_format == "CSV" and len([x for x in [assignments, announcements, modules] if x]) > 1:
-                    # Multiple CSV files created
-                    st.info(f"📁 Created {len(output_paths)} CSV files: " + ", ".join([p for p in output_paths]))
-                    st.markdown("*Files are saved in the current directory*")
+                # Download button, served straight from memory
+                if bundled:
+                    # Multiple CSV files bundled into one archive
+                    label = "📦 Download CSV Files (zip)"
+                    mime = 'application/zip'
                 else:
-                    # Single file download
-                    with open(output_path, 'rb') as f:
-                        st.download_button(
-                            label=f"📄 Download {export_format} File",
-                            data=f.read(),
-                            file_name=filename if export_format != "CSV" else output_path,
-                            mime={
-                                'Excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                                'CSV': 'text/csv',
-                                'JSON': 'application/json'
-                            }[export_format],
-                            use_container_width=True
-                        )
+                    label = f"📄 Download {export_format} File"
+                    mime = {
+                        'Excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                        'CSV': 'text/csv',
+                        'JSON': 'application/json'
+                    }[export_format]
+                st.download_button(
+                    label=label,
+                    data=output_buffer.getvalue(),
+                    file_name=download_name,
+                    mime=mime,
+                    use_container_width=True
+                )
 
                 # Preview
                 with st.expander("📋 Preview"):
@@ -0,0 +1,198 @@
+"""
+Command-line export for scripts and cron jobs.
+
+Usage:
+    canvas-toolkit courses
+    canvas-toolkit export --courses 123 456 --content assignments modules --format csv
+
+The Canvas URL and token are read from CANVAS_BASE_URL and CANVAS_API_TOKEN
+(or --base-url / --token). Only the standard library is imported at startup;
+the client, models and the chosen writer are imported when a command runs,
+and streamlit is never imported.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+CONTENT_TYPES = ("assignments", "announcements", "modules")
+
+# Format -> (writer module, writer class, default file suffix, one file per content type)
+FORMATS = {
+    "csv": ("csv_writer", "CSVWriter", ".csv", True),
+    "excel": ("excel_writer", "ExcelWriter", ".xlsx", False),
+    "json": ("json_writer", "JSONWriter", ".json", False),
+    "ndjson": ("json_writer", "JSONWriter", ".ndjson", False),
+    "parquet": ("parquet_writer", "ParquetWriter", ".parquet", True),
+    "sqlite": ("sqlite_writer", "SQLiteWriter", ".db", False),
+}
+
+# Formats whose announcement output is only the Message Preview column, so
+# HTML parsing can stop at Announcement.PREVIEW_LENGTH. Parquet and SQLite
+# store the full message_text and must not be truncated.
+PREVIEW_FORMATS = ("csv", "excel", "json", "ndjson")
+
+COMPRESSED_SUFFIXES = (".gz", ".zst")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="canvas-toolkit",
+        description="Export Canvas LMS content without the Streamlit app."
+    )
+    parser.add_argument("--base-url", help="Canvas URL (default: $CANVAS_BASE_URL)")
+    parser.add_argument("--token", help="Canvas API token (default: $CANVAS_API_TOKEN)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    courses = commands.add_parser("courses", help="List courses and their IDs")
+    courses.add_argument("--include-concluded", action="store_true", help="Include concluded courses")
+
+    export = commands.add_parser("export", help="Export course content to a file")
+    export.add_argument(
+        "--courses", nargs="+", metavar="ID",
+        help="Course IDs to export (default: all active courses)"
+    )
+    export.add_argument(
+        "--content", nargs="+", choices=CONTENT_TYPES, default=["assignments"],
+        help="Content types to export (default: assignments)"
+    )
+    export.add_argument("--format", choices=tuple(FORMATS), default="csv", help="Output format (default: csv)")
+    export.add_argument(
+        "--output", "-o",
+        help="Output file (default: canvas_export.<ext>). CSV and Parquet write one file "
+             "per content type, named <name>_<content>.<ext>. A .gz or .zst suffix "
+             "compresses CSV and JSON output."
+    )
+    export.add_argument("--days-back", type=int, default=30, help="Days of announcements to include (default: 30)")
+    export.add_argument(
+        "--include-concluded", action="store_true",
+        help="Include concluded courses when --courses is not given"
+    )
+    export.add_argument(
+        "--raw", action="store_true",
+        help="Write the API records unchanged as NDJSON, skipping model conversion (ndjson format only)"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command line interface.
+
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    base_url = args.base_url or os.environ.get("CANVAS_BASE_URL")
+    token = args.token or os.environ.get("CANVAS_API_TOKEN")
+    if not base_url or not token:
+        parser.error("Canvas URL and token are required (set CANVAS_BASE_URL and CANVAS_API_TOKEN)")
+    if getattr(args, "raw", False) and args.format != "ndjson":
+        parser.error("--raw requires --format ndjson")
+
+    from .client import CanvasClient
+    from .client.exceptions import CanvasAPIError
+
+    try:
+        client = CanvasClient(base_url, token)
+        if args.command == "courses":
+            for course in client.get_courses(include_concluded=args.include_concluded):
+                print(f"{course['id']}\t{course['name']}")
+        else:
+            for path in export(client, args):
+                print(path)
+    except (CanvasAPIError, ValueError, ImportError) as e:
+        print(f"canvas-toolkit: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def export(client, args: argparse.Namespace) -> List[Path]:
+    """
+    Fetch the requested content and write it in the requested format.
+
+    Args:
+        client: CanvasClient
+        args: Parsed ``export`` arguments
+
+    Returns:
+        Paths of the files written
+    """
+    import importlib
+
+    module_name, class_name, suffix, per_content = FORMATS[args.format]
+    writer_class = getattr(importlib.import_module(f".writers.{module_name}", __package__), class_name)
+    output = Path(args.output or f"canvas_export{suffix}")
+    # De-duplicate while keeping the order given
+    contents = list(dict.fromkeys(args.content))
+    streams = {
+        content: _fetch(client, content, args, raw=args.raw)
+        for content in contents
+    }
+
+    if per_content:
+        from .writers._streaming import peek
+
+        paths = []
+        for content in contents:
+            items = peek(streams[content])
+            if items is None:
+                print(f"No {content} found", file=sys.stderr)
+                continue
+            path = output if len(contents) == 1 else _content_path(output, content)
+            paths.append(writer_class(str(path)).write(items))
+        if not paths:
+            raise ValueError("No content to export")
+        return paths
+
+    if args.format == "ndjson":
+        writer = writer_class(str(output), ndjson=True)
+        if args.raw:
+            return [writer.write_raw(**streams)]
+        return [writer.write(**streams)]
+    return [writer_class(str(output)).write(**streams)]
+
+
+def _fetch(client, content: str, args: argparse.Namespace, raw: bool = False) -> Iterator:
+    """Stream one content type from Canvas as models (or raw records)."""
+    records = client.iter_raw(
+        content,
+        course_ids=args.courses,
+        days_back=args.days_back,
+        include_concluded=args.include_concluded
+    )
+    if raw:
+        return records
+
+    from . import models
+
+    if content == "assignments":
+        return map(models.Assignment.from_canvas_api, records)
+    if content == "announcements":
+        text_limit = models.Announcement.PREVIEW_LENGTH if args.format in PREVIEW_FORMATS else None
+        return (models.Announcement.from_canvas_api(record, text_limit=text_limit) for record in records)
+    return (
+        item
+        for record in records
+        for item in models.Module.from_canvas_api(record, record["_course_name"]).items
+    )
+
+
+def _content_path(output: Path, content: str) -> Path:
+    """Name the file for one content type, keeping any compression suffix."""
+    suffixes = output.suffixes[-2:] if output.suffix in COMPRESSED_SUFFIXES else output.suffixes[-1:]
+    suffix = "".join(suffixes)
+    stem = output.name[:-len(suffix)] if suffix else output.name
+    return output.with_name(f"{stem}_{content}{suffix}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,8 @@
 """Canvas API client for fetching courses and assignments."""
 
+import sys
 import requests
-from typing import List, Dict, Optional
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 from .exceptions import CanvasAPIError, AuthenticationError, RateLimitError
@@ -10,6 +11,9 @@ from .exceptions import CanvasAPIError, AuthenticationError, RateLimitError
 class CanvasClient:
     """Client for interacting with Canvas LMS API."""
 
+    # Content types available from iter_raw()
+    RAW_CONTENT_TYPES = ("assignments", "announcements", "modules")
+
     def __init__(self, base_url: str, api_token: str):
         """
         Initialize Canvas API client.
@@ -43,16 +47,16 @@ class CanvasClient:
         self.api_token = api_token
         self.headers = {"Authorization": f"Bearer {api_token}"}
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
+    def _iter_responses(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[requests.Response]:
         """
-        Make a GET request to Canvas API with pagination support.
+        Yield each page of a paginated GET request to Canvas API.
 
         Args:
             endpoint: API endpoint (e.g., "/api/v1/courses")
             params: Query parameters
 
-        Returns:
-            List of results from all pages
+        Yields:
+            Successful responses, one per page
 
         Raises:
             AuthenticationError: If authentication fails
@@ -63,8 +67,6 @@ class CanvasClient:
         params = params or {}
         params.setdefault("per_page", 100)
 
-        all_results = []
-
         while url:
             try:
                 response = requests.get(url, headers=self.headers, params=params)
@@ -84,31 +86,168 @@ class CanvasClient:
                     )
 
                 response.raise_for_status()
-                data = response.json()
-
-                # Handle both list and dict responses
-                if isinstance(data, list):
-                    all_results.extend(data)
-                else:
-                    all_results.append(data)
-
-                # Handle pagination via Link header
-                url = None
-                if 'Link' in response.headers:
-                    links = response.headers['Link'].split(',')
-                    for link in links:
-                        if 'rel="next"' in link:
-                            url = link[link.find('<')+1:link.find('>')]
-                            params = None  # Params are in the URL now
-                            break
 
             except requests.RequestException as e:
                 if isinstance(e, (AuthenticationError, RateLimitError, CanvasAPIError)):
                     raise
                 raise CanvasAPIError(f"Canvas API request failed: {str(e)}")
 
+            yield response
+
+            # Handle pagination via Link header
+            url = None
+            if 'Link' in response.headers:
+                links = response.headers['Link'].split(',')
+                for link in links:
+                    if 'rel="next"' in link:
+                        url = link[link.find('<')+1:link.find('>')]
+                        params = None  # Params are in the URL now
+                        break
+
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
+        """
+        Make a GET request to Canvas API with pagination support.
+
+        Args:
+            endpoint: API endpoint (e.g., "/api/v1/courses")
+            params: Query parameters
+
+        Returns:
+            List of results from all pages
+
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+            CanvasAPIError: For other API errors
+        """
+        all_results = []
+
+        for response in self._iter_responses(endpoint, params):
+            try:
+                data = response.json()
+            except ValueError as e:
+                raise CanvasAPIError(f"Canvas API request failed: {str(e)}")
+
+            # Handle both list and dict responses
+            if isinstance(data, list):
+                all_results.extend(data)
+            else:
+                all_results.append(data)
+
         return all_results
 
+    def iter_pages(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[bytes]:
+        """
+        Yield the raw JSON body of each page of a paginated request.
+
+        Lets callers decode pages directly (see ``canvas_toolkit.models.decoder``)
+        without building an intermediate dict per record.
+
+        Args:
+            endpoint: API endpoint (e.g., "/api/v1/courses/123/assignments")
+            params: Query parameters
+
+        Yields:
+            Response body bytes, one per page
+        """
+        for response in self._iter_responses(endpoint, params):
+            yield response.content
+
+    def iter_raw(
+        self,
+        content: str,
+        course_ids: Optional[List[str]] = None,
+        days_back: int = 30,
+        include_concluded: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream raw API records for archival, course by course and page by page.
+
+        Records are yielded as Canvas returns them, plus the ``_course_id``
+        and ``_course_name`` fields the models expect, without building
+        models, formatting or sorting. Pair with ``JSONWriter.write_raw``
+        for bulk backups; ``models.decoder.decode_raw_export`` turns such a
+        file back into models.
+
+        Args:
+            content: "assignments", "announcements" or "modules"
+            course_ids: Optional list of course IDs. If None, uses all active courses.
+            days_back: Days of announcements to include (announcements only)
+            include_concluded: If True and course_ids is None, include concluded courses
+
+        A course whose first page fails is skipped with a warning on stderr.
+        A failure after some of a course's records were yielded is raised,
+        so a backup never silently holds a partial course.
+
+        Yields:
+            Raw record dicts
+
+        Raises:
+            ValueError: If content is not a supported type
+            CanvasAPIError: If a course fails after some of its records were yielded
+        """
+        if content not in self.RAW_CONTENT_TYPES:
+            raise ValueError(f"content must be one of {self.RAW_CONTENT_TYPES}, got: {content}")
+
+        course_ids, course_names = self._resolve_courses(course_ids, include_concluded)
+
+        for course_id in course_ids:
+            course_name = course_names.get(course_id, "Unknown Course")
+            endpoint, params = self._content_request(content, course_id, days_back)
+            label = course_names.get(course_id, f"course {course_id}")
+            yielded = 0
+            try:
+                for response in self._iter_responses(endpoint, params):
+                    try:
+                        page = response.json()
+                    except ValueError as e:
+                        raise CanvasAPIError(f"Canvas API request failed: {str(e)}")
+                    for record in page if isinstance(page, list) else [page]:
+                        record["_course_id"] = course_id
+                        record["_course_name"] = course_name
+                        yielded += 1
+                        yield record
+
+            except CanvasAPIError as e:
+                if yielded:
+                    raise CanvasAPIError(
+                        f"Fetching {content} from {label} failed after {yielded} records: {e}"
+                    ) from e
+                # Nothing from this course was yielded; warn and continue with the others
+                print(f"Warning: Could not fetch {content} from {label}: {e}", file=sys.stderr)
+                continue
+
+    def _resolve_courses(
+        self,
+        course_ids: Optional[List[str]],
+        include_concluded: bool = False
+    ) -> Tuple[List[str], Dict[str, str]]:
+        """Return the course IDs to fetch and a mapping of course ID to name."""
+        if course_ids is None:
+            courses = self.get_courses(include_concluded=include_concluded)
+            return [str(c["id"]) for c in courses], {str(c["id"]): c["name"] for c in courses}
+
+        # Fetch course names for the specified IDs
+        all_courses = self.get_courses(include_concluded=True)
+        return course_ids, {str(c["id"]): c["name"] for c in all_courses if str(c["id"]) in course_ids}
+
+    @staticmethod
+    def _content_request(content: str, course_id: str, days_back: int = 30) -> Tuple[str, Dict]:
+        """Endpoint and query parameters for one course's content."""
+        if content == "assignments":
+            return f"/api/v1/courses/{course_id}/assignments", {}
+        if content == "announcements":
+            # Announcements come from discussion_topics with only_announcements
+            start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+            return f"/api/v1/courses/{course_id}/discussion_topics", {
+                "only_announcements": True,
+                "start_date": start_date
+            }
+        # include[]=items and include[]=content_details get everything in one call
+        return f"/api/v1/courses/{course_id}/modules", {
+            "include[]": ["items", "content_details"]
+        }
+
     def test_connection(self) -> bool:
         """
         Test Canvas API connection and token validity.
@@ -155,8 +294,8 @@ class CanvasClient:
         Returns:
             List of assignment dictionaries
         """
-        endpoint = f"/api/v1/courses/{course_id}/assignments"
-        assignments = self._make_request(endpoint)
+        endpoint, params = self._content_request("assignments", course_id)
+        assignments = self._make_request(endpoint, params)
 
         # Add course_id to each assignment for reference
         for assignment in assignments:
@@ -179,15 +318,7 @@ class CanvasClient:
         Returns:
             List of all assignments with added _course_name field
         """
-        # Get courses if not specified
-        if course_ids is None:
-            courses = self.get_courses(include_concluded=include_concluded)
-            course_ids = [str(c["id"]) for c in courses]
-            course_names = {str(c["id"]): c["name"] for c in courses}
-        else:
-            # Fetch course names for the specified IDs
-            all_courses = self.get_courses(include_concluded=True)
-            course_names = {str(c["id"]): c["name"] for c in all_courses if str(c["id"]) in course_ids}
+        course_ids, course_names = self._resolve_courses(course_ids, include_concluded)
 
         all_assignments = []
 
@@ -221,15 +352,7 @@ class CanvasClient:
         Returns:
             List of announcement dictionaries
         """
-        # Calculate start date
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-
-        endpoint = f"/api/v1/courses/{course_id}/discussion_topics"
-        params = {
-            "only_announcements": True,
-            "start_date": start_date
-        }
-
+        endpoint, params = self._content_request("announcements", course_id, days_back)
         announcements = self._make_request(endpoint, params)
 
         # Add course_id to each announcement for reference
@@ -253,15 +376,7 @@ class CanvasClient:
         Returns:
             List of all announcements with added _course_name field
         """
-        # Get courses if not specified
-        if course_ids is None:
-            courses = self.get_courses(include_concluded=False)
-            course_ids = [str(c["id"]) for c in courses]
-            course_names = {str(c["id"]): c["name"] for c in courses}
-        else:
-            # Fetch course names for the specified IDs
-            all_courses = self.get_courses(include_concluded=True)
-            course_names = {str(c["id"]): c["name"] for c in all_courses if str(c["id"]) in course_ids}
+        course_ids, course_names = self._resolve_courses(course_ids)
 
         all_announcements = []
 
@@ -294,11 +409,7 @@ class CanvasClient:
         Returns:
             List of module dictionaries
         """
-        endpoint = f"/api/v1/courses/{course_id}/modules"
-        params = {
-            "include[]": ["items", "content_details"]
-        }
-
+        endpoint, params = self._content_request("modules", course_id)
         modules = self._make_request(endpoint, params)
 
         # Add course_id to each module for reference
@@ -320,15 +431,7 @@ class CanvasClient:
         Returns:
             List of all modules with added _course_name field
         """
-        # Get courses if not specified
-        if course_ids is None:
-            courses = self.get_courses(include_concluded=False)
-            course_ids = [str(c["id"]) for c in courses]
-            course_names = {str(c["id"]): c["name"] for c in courses}
-        else:
-            # Fetch course names for the specified IDs
-            all_courses = self.get_courses(include_concluded=True)
-            course_names = {str(c["id"]): c["name"] for c in all_courses if str(c["id"]) in course_ids}
+        course_ids, course_names = self._resolve_courses(course_ids)
 
         all_modules = []
 
@@ -1,5 +1,6 @@
 from .assignment import Assignment
 from .announcement import Announcement
 from .module import Module, ModuleItem
+from .context import CourseContext, ModuleContext
 
-__all__ = ["Assignment", "Announcement", "Module", "ModuleItem"]
+__all__ = ["Assignment", "Announcement", "Module", "ModuleItem", "CourseContext", "ModuleContext"]
@@ -1,10 +1,15 @@
 """Announcement data model."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, InitVar
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from functools import partial
+from typing import Optional, Dict, Any, Iterable, List, Sequence
 
+from canvas_toolkit.utils.dates import parse_canvas_datetime
 from canvas_toolkit.utils.html_parser import HTMLTextExtractor
+from .batch import convert_batch
+from .columns import project
+from .context import CourseContext, context_property
 
 
 @dataclass
@@ -13,8 +18,6 @@ class Announcement:
 
     id: str
     title: str
-    course_id: str
-    course_name: str
     posted_at: Optional[str]
     author: str
     html_url: str
@@ -22,46 +25,168 @@ class Announcement:
     message_text: Optional[str] = None
     embedded_links: list = field(default_factory=list)
     attachments: list = field(default_factory=list)
+    course: Optional[CourseContext] = None
+    # Constructor keywords resolved into ``course`` (properties below)
+    course_id: InitVar[Optional[str]]
+    course_name: InitVar[Optional[str]]
+
+    # Title used when the API record has none
+    DEFAULT_TITLE = "Untitled Announcement"
+
+    # Number of message characters included in exports
+    PREVIEW_LENGTH = 500
+
+    # Export columns and how to compute each, in to_dict() order
+    _COLUMN_GETTERS = {
+        "Course": lambda a: a.course_name,
+        "Title": lambda a: a.title,
+        "Posted Date": lambda a: a.posted_date_formatted,
+        "Author": lambda a: a.author,
+        "Message Preview": lambda a: a.message_preview,
+        "Embedded Links": lambda a: len(a.embedded_links),
+        "Attachments": lambda a: len(a.attachments),
+        "Canvas Link": lambda a: a.html_url,
+        "Canvas ID": lambda a: a.id,
+    }
+
+    # Export column names, in to_dict() order
+    EXPORT_COLUMNS = tuple(_COLUMN_GETTERS)
 
     @classmethod
-    def from_canvas_api(cls, api_response: Dict[str, Any]) -> "Announcement":
+    def from_canvas_api(cls, api_response: Dict[str, Any], text_limit: Optional[int] = None) -> "Announcement":
         """
         Create Announcement from Canvas API response.
 
         Args:
             api_response: Raw announcement dict from Canvas API
+            text_limit: Optional maximum length of ``message_text``. Pass
+                ``Announcement.PREVIEW_LENGTH`` when only the export preview
+                is needed to skip text extraction for the rest of the message.
 
         Returns:
             Announcement instance
         """
-        # Extract HTML message
-        message_html = api_response.get("message", "")
+        return cls.from_fields(
+            id=api_response["id"],
+            course=CourseContext.get(
+                api_response.get("_course_id", ""),
+                api_response.get("_course_name", "Unknown Course")
+            ),
+            title=api_response.get("title", cls.DEFAULT_TITLE),
+            posted_at=api_response.get("posted_at"),
+            author=api_response.get("author", {}),
+            html_url=api_response.get("html_url", ""),
+            message_html=api_response.get("message", ""),
+            attachments=api_response.get("attachments", []),
+            text_limit=text_limit,
+        )
+
+    @classmethod
+    def from_fields(
+        cls,
+        id: Any,
+        course: CourseContext,
+        title: Optional[str],
+        posted_at: Optional[str],
+        author: Any,
+        html_url: Optional[str],
+        message_html: Optional[str],
+        attachments: Any,
+        text_limit: Optional[int] = None
+    ) -> "Announcement":
+        """
+        Create Announcement from fields already read from an API record.
+
+        Shared by ``from_canvas_api`` and the schema decoder
+        (``models.decoder``), so both paths convert identically.
 
-        # Parse HTML to plain text and extract links
+        Args:
+            id: Canvas announcement ID
+            course: Course context
+            title: Announcement title
+            posted_at: ISO timestamp, or None
+            author: Raw author object (dict with ``display_name``)
+            html_url: Canvas link
+            message_html: HTML message, parsed here to text and links
+            attachments: Raw attachment list
+            text_limit: Optional maximum length of ``message_text``
+
+        Returns:
+            Announcement instance
+        """
+        # Parse HTML to plain text and extract links in a single pass
         message_text = None
         embedded_links = []
         if message_html:
-            message_text = HTMLTextExtractor.extract(message_html)
-            embedded_links = HTMLTextExtractor.extract_links(message_html)
+            message_text, embedded_links = HTMLTextExtractor.parse(message_html, max_chars=text_limit)
 
         # Get author name
-        author_data = api_response.get("author", {})
-        author = author_data.get("display_name", "Unknown") if isinstance(author_data, dict) else "Unknown"
+        author_name = author.get("display_name", "Unknown") if isinstance(author, dict) else "Unknown"
 
         return cls(
-            id=str(api_response["id"]),
-            title=api_response.get("title", "Untitled Announcement"),
-            course_id=str(api_response.get("_course_id", "")),
-            course_name=api_response.get("_course_name", "Unknown Course"),
-            posted_at=api_response.get("posted_at"),
-            author=author,
-            html_url=api_response.get("html_url", ""),
+            id=str(id),
+            title=title,
+            course=course,
+            posted_at=posted_at,
+            author=author_name,
+            html_url=html_url,
             message_html=message_html,
             message_text=message_text,
             embedded_links=embedded_links,
-            attachments=api_response.get("attachments", []),
+            attachments=attachments,
         )
 
+    @classmethod
+    def from_canvas_api_batch(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        workers: int = 1,
+        text_limit: Optional[int] = None
+    ) -> List["Announcement"]:
+        """
+        Create Announcements from many API records, optionally in parallel.
+
+        HTML parsing dominates conversion cost, so with ``workers`` > 1 big
+        batches are sharded across a process pool (see ``convert_batch``).
+        Small batches are always converted in-process.
+
+        Args:
+            records: Raw announcement dicts from Canvas API
+            workers: Number of worker processes (default: 1, in-process)
+            text_limit: Optional maximum length of ``message_text``
+
+        Returns:
+            List of Announcement instances in input order
+        """
+        converter = partial(cls.from_canvas_api, text_limit=text_limit)
+        return convert_batch(converter, records, workers=workers)
+
+    def __post_init__(self, course_id: Optional[str], course_name: Optional[str]) -> None:
+        self.course = CourseContext.resolve(self.course, course_id, course_name)
+
+    @context_property
+    def course_id(self) -> str:
+        """Return the Canvas course ID."""
+        return self.course.id
+
+    @course_id.setter
+    def course_id(self, value: str) -> None:
+        self.course = CourseContext.resolve(self.course, course_id=value)
+
+    @context_property
+    def course_name(self) -> str:
+        """Return the course name."""
+        return self.course.name
+
+    @course_name.setter
+    def course_name(self, value: str) -> None:
+        self.course = CourseContext.resolve(self.course, name=value)
+
+    @property
+    def posted_datetime(self) -> Optional[datetime]:
+        """Return parsed posted date, or None if missing or invalid."""
+        return parse_canvas_datetime(self.posted_at)
+
     @property
     def posted_date_formatted(self) -> str:
         """Return formatted posted date or 'Unknown'."""
@@ -78,7 +203,7 @@ class Announcement:
         """Return first 500 characters of message text."""
         if not self.message_text:
             return ""
-        return self.message_text[:500]
+        return self.message_text[:self.PREVIEW_LENGTH]
 
     @property
     def is_recent(self) -> bool:
@@ -92,16 +217,14 @@ class Announcement:
         except (ValueError, AttributeError):
             return False
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for export."""
-        return {
-            "Course": self.course_name,
-            "Title": self.title,
-            "Posted Date": self.posted_date_formatted,
-            "Author": self.author,
-            "Message Preview": self.message_preview,
-            "Embedded Links": len(self.embedded_links),
-            "Attachments": len(self.attachments),
-            "Canvas Link": self.html_url,
-            "Canvas ID": self.id,
-        }
+    def to_dict(self, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary for export.
+
+        Args:
+            columns: Optional subset of EXPORT_COLUMNS, in output order. Only
+                those values are computed. Default: all columns.
+        """
+        if columns is None:
+            columns = self.EXPORT_COLUMNS
+        return project(self, self._COLUMN_GETTERS, columns)
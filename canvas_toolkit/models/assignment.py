@@ -1,8 +1,12 @@
 """Assignment data model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, InitVar
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
+
+from canvas_toolkit.utils.dates import parse_canvas_datetime
+from .columns import project
+from .context import CourseContext, context_property
 
 
 @dataclass
@@ -11,8 +15,6 @@ class Assignment:
 
     id: str
     name: str
-    course_id: str
-    course_name: str
     due_at: Optional[str]
     points_possible: Optional[float]
     html_url: str
@@ -21,6 +23,27 @@ class Assignment:
     lock_at: Optional[str] = None
     unlock_at: Optional[str] = None
     has_submitted_submissions: bool = False
+    course: Optional[CourseContext] = None
+    # Constructor keywords resolved into ``course`` (properties below)
+    course_id: InitVar[Optional[str]]
+    course_name: InitVar[Optional[str]]
+
+    # Name used when the API record has none
+    DEFAULT_NAME = "Untitled Assignment"
+
+    # Export columns and how to compute each, in to_dict() order
+    _COLUMN_GETTERS = {
+        "Course": lambda a: a.course_name,
+        "Assignment": lambda a: a.name,
+        "Due Date": lambda a: a.due_date_formatted,
+        "Points": lambda a: a.points_possible if a.points_possible else "N/A",
+        "Submission Type": lambda a: a.submission_types_formatted,
+        "Canvas Link": lambda a: a.html_url,
+        "Canvas ID": lambda a: a.id,
+    }
+
+    # Export column names, in to_dict() order
+    EXPORT_COLUMNS = tuple(_COLUMN_GETTERS)
 
     @classmethod
     def from_canvas_api(cls, api_response: Dict[str, Any]) -> "Assignment":
@@ -33,11 +56,13 @@ class Assignment:
         Returns:
             Assignment instance
         """
-        return cls(
-            id=str(api_response["id"]),
-            name=api_response.get("name", "Untitled Assignment"),
-            course_id=str(api_response.get("_course_id", "")),
-            course_name=api_response.get("_course_name", "Unknown Course"),
+        return cls.from_fields(
+            id=api_response["id"],
+            course=CourseContext.get(
+                api_response.get("_course_id", ""),
+                api_response.get("_course_name", "Unknown Course")
+            ),
+            name=api_response.get("name", cls.DEFAULT_NAME),
             due_at=api_response.get("due_at"),
             points_possible=api_response.get("points_possible"),
             html_url=api_response.get("html_url", ""),
@@ -48,6 +73,83 @@ class Assignment:
             has_submitted_submissions=api_response.get("has_submitted_submissions", False),
         )
 
+    @classmethod
+    def from_fields(
+        cls,
+        id: Any,
+        course: CourseContext,
+        name: Optional[str],
+        due_at: Optional[str],
+        points_possible: Optional[float],
+        html_url: Optional[str],
+        submission_types: Optional[list],
+        description: Optional[str] = None,
+        lock_at: Optional[str] = None,
+        unlock_at: Optional[str] = None,
+        has_submitted_submissions: Optional[bool] = False
+    ) -> "Assignment":
+        """
+        Create Assignment from fields already read from an API record.
+
+        Shared by ``from_canvas_api`` and the schema decoder
+        (``models.decoder``), so both paths convert identically.
+
+        Args:
+            id: Canvas assignment ID
+            course: Course context
+            name: Assignment name
+            due_at: ISO timestamp, or None
+            points_possible: Points, or None
+            html_url: Canvas link
+            submission_types: Raw submission type list
+            description: Optional HTML description
+            lock_at: Optional lock timestamp
+            unlock_at: Optional unlock timestamp
+            has_submitted_submissions: Whether anyone has submitted
+
+        Returns:
+            Assignment instance
+        """
+        return cls(
+            id=str(id),
+            name=name,
+            course=course,
+            due_at=due_at,
+            points_possible=points_possible,
+            html_url=html_url,
+            submission_types=submission_types,
+            description=description,
+            lock_at=lock_at,
+            unlock_at=unlock_at,
+            has_submitted_submissions=has_submitted_submissions,
+        )
+
+    def __post_init__(self, course_id: Optional[str], course_name: Optional[str]) -> None:
+        self.course = CourseContext.resolve(self.course, course_id, course_name)
+
+    @context_property
+    def course_id(self) -> str:
+        """Return the Canvas course ID."""
+        return self.course.id
+
+    @course_id.setter
+    def course_id(self, value: str) -> None:
+        self.course = CourseContext.resolve(self.course, course_id=value)
+
+    @context_property
+    def course_name(self) -> str:
+        """Return the course name."""
+        return self.course.name
+
+    @course_name.setter
+    def course_name(self, value: str) -> None:
+        self.course = CourseContext.resolve(self.course, name=value)
+
+    @property
+    def due_datetime(self) -> Optional[datetime]:
+        """Return parsed due date, or None if missing or invalid."""
+        return parse_canvas_datetime(self.due_at)
+
     @property
     def due_date_formatted(self) -> str:
         """Return formatted due date or 'No due date'."""
@@ -92,14 +194,14 @@ class Assignment:
         except (ValueError, AttributeError):
             return False
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for export."""
-        return {
-            "Course": self.course_name,
-            "Assignment": self.name,
-            "Due Date": self.due_date_formatted,
-            "Points": self.points_possible if self.points_possible else "N/A",
-            "Submission Type": self.submission_types_formatted,
-            "Canvas Link": self.html_url,
-            "Canvas ID": self.id,
-        }
+    def to_dict(self, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary for export.
+
+        Args:
+            columns: Optional subset of EXPORT_COLUMNS, in output order. Only
+                those values are computed. Default: all columns.
+        """
+        if columns is None:
+            columns = self.EXPORT_COLUMNS
+        return project(self, self._COLUMN_GETTERS, columns)
@@ -0,0 +1,90 @@
+"""Parallel batch conversion of Canvas API records into models."""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from canvas_toolkit.utils.html_cache import HTMLCache
+from canvas_toolkit.utils.html_parser import HTMLTextExtractor
+
+# Below this many records, process start-up and pickling cost more than
+# the conversion itself, so the batch is converted in-process.
+MIN_PARALLEL_BATCH = 2000
+
+# Target number of shards per worker (keeps workers busy when shards vary)
+SHARDS_PER_WORKER = 4
+
+# Cache keys each worker already holds (seeded or sent back to the parent)
+_known_keys = set()
+
+
+def convert_batch(
+    converter: Callable[[Dict[str, Any]], Any],
+    records: Iterable[Dict[str, Any]],
+    workers: int = 1,
+    min_batch: int = MIN_PARALLEL_BATCH
+) -> List[Any]:
+    """
+    Convert API records with a process pool, preserving input order.
+
+    Pooling only pays off when conversion is expensive (HTML parsing), so it
+    is opt-in. Workers start with a copy of ``HTMLTextExtractor.cache`` (same
+    size, same ``cache_dir``, current in-memory entries), and the entries
+    they parse are merged back into it, so repeated exports still skip
+    parsing. Callers running from a frozen executable must call
+    ``multiprocessing.freeze_support()`` in their main module.
+
+    Args:
+        converter: Picklable callable turning one record into a model
+            (e.g. ``Announcement.from_canvas_api``)
+        records: Raw record dicts from the Canvas API
+        workers: Number of worker processes (default: 1, converting
+            in-process); keep it small in shared servers
+        min_batch: Smallest batch worth sending to the pool
+
+    Returns:
+        List of models in the same order as ``records``
+    """
+    records = list(records)
+    workers = min(workers, len(records))
+
+    if workers <= 1 or len(records) < max(min_batch, 2):
+        return [converter(record) for record in records]
+
+    chunk_size = max(1, math.ceil(len(records) / (workers * SHARDS_PER_WORKER)))
+    shards = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+
+    cache = HTMLTextExtractor.cache
+    cache_config = (cache.maxsize, cache.cache_dir, cache.entries()) if cache is not None else None
+
+    models = []
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(cache_config,)
+    ) as pool:
+        for shard_models, entries in pool.map(_convert_shard, [converter] * len(shards), shards):
+            models.extend(shard_models)
+            if cache is not None:
+                cache.merge(entries)
+    return models
+
+
+def _init_worker(cache_config: Optional[Tuple[int, Any, list]]) -> None:
+    """Give a worker the parent's parse cache configuration and contents."""
+    if cache_config is None:
+        HTMLTextExtractor.cache = None
+        return
+    maxsize, cache_dir, entries = cache_config
+    HTMLTextExtractor.cache = HTMLCache(maxsize=maxsize, cache_dir=cache_dir)
+    HTMLTextExtractor.cache.merge(entries)
+    _known_keys.update(key for key, _ in entries)
+
+
+def _convert_shard(converter: Callable, records: List[Dict[str, Any]]) -> Tuple[List[Any], list]:
+    """Convert one shard in a worker, returning the models and new cache entries."""
+    models = [converter(record) for record in records]
+    cache = HTMLTextExtractor.cache
+    if cache is None:
+        return models, []
+    new_entries = [(key, value) for key, value in cache.entries() if key not in _known_keys]
+    _known_keys.update(key for key, _ in new_entries)
+    return models, new_entries
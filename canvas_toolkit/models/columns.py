@@ -0,0 +1,42 @@
+"""Column projection for model exports."""
+
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+def check_columns(model_type: type, columns: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """
+    Validate a column selection against a model's export columns.
+
+    Args:
+        model_type: Model class with EXPORT_COLUMNS
+        columns: Requested columns in output order, or None for all
+
+    Returns:
+        The columns as a tuple, or None for all columns
+
+    Raises:
+        ValueError: If a column is unknown, repeated, or none are selected
+    """
+    if columns is None:
+        return None
+    columns = tuple(columns)
+    if not columns:
+        raise ValueError("columns must name at least one column")
+    unknown = [column for column in columns if column not in model_type.EXPORT_COLUMNS]
+    if unknown:
+        raise ValueError(
+            f"Unknown {model_type.__name__} column(s) {unknown}; choose from {model_type.EXPORT_COLUMNS}"
+        )
+    if len(set(columns)) != len(columns):
+        raise ValueError(f"Duplicate columns in {columns}")
+    return columns
+
+
+def project(item: Any, getters: Dict[str, Callable[[Any], Any]], columns: Sequence[str]) -> Dict[str, Any]:
+    """Build an export row with only the requested columns, computing nothing else."""
+    try:
+        return {column: getters[column](item) for column in columns}
+    except KeyError as e:
+        raise ValueError(
+            f"Unknown {type(item).__name__} column {e.args[0]!r}; choose from {tuple(getters)}"
+        ) from None
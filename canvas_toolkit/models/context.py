@@ -0,0 +1,181 @@
+"""Shared course and module descriptors referenced by content models."""
+
+import sys
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Optional
+
+
+_lock = threading.Lock()
+_courses = weakref.WeakValueDictionary()
+_modules = weakref.WeakValueDictionary()
+
+
+def _intern(value):
+    """Intern strings so equal names share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True)
+class CourseContext:
+    """
+    Interned course descriptor.
+
+    Every model from the same course references one shared instance instead
+    of carrying its own copies of the course id and name. Use ``get()``
+    rather than the constructor so instances are shared.
+    """
+
+    id: str
+    name: str
+
+    @classmethod
+    def get(cls, course_id: str, name: str) -> "CourseContext":
+        """
+        Return the shared descriptor for a course, creating it if needed.
+
+        Args:
+            course_id: Canvas course ID
+            name: Course name
+
+        Returns:
+            CourseContext instance shared by all callers
+        """
+        key = (str(course_id), name)
+        with _lock:
+            context = _courses.get(key)
+            if context is None:
+                context = cls(_intern(key[0]), _intern(name))
+                _courses[key] = context
+            return context
+
+    @classmethod
+    def resolve(
+        cls,
+        course: Optional["CourseContext"],
+        course_id: Optional[str] = None,
+        name: Optional[str] = None
+    ) -> "CourseContext":
+        """
+        Apply ``course_id``/``course_name`` model keywords to a context.
+
+        Args:
+            course: Current descriptor, or None
+            course_id: New course ID, or None to keep the current one
+            name: New course name, or None to keep the current one
+
+        Returns:
+            Shared descriptor with the requested values
+
+        Raises:
+            TypeError: If there is no current descriptor and either value is missing
+        """
+        if course is None:
+            if course_id is None or name is None:
+                raise TypeError("course= or both course_id= and course_name= are required")
+            return cls.get(course_id, name)
+        if course_id is None and name is None:
+            return course
+        return cls.get(
+            course.id if course_id is None else course_id,
+            course.name if name is None else name
+        )
+
+    def __reduce__(self):
+        """Re-intern on unpickling (e.g. results from worker processes)."""
+        return (CourseContext.get, (self.id, self.name))
+
+
+@dataclass(frozen=True)
+class ModuleContext:
+    """
+    Interned module descriptor.
+
+    Shared by all ModuleItems of a module; references its CourseContext.
+    """
+
+    id: str
+    name: str
+    course: CourseContext
+
+    @classmethod
+    def get(cls, module_id: str, name: str, course: CourseContext) -> "ModuleContext":
+        """
+        Return the shared descriptor for a module, creating it if needed.
+
+        Args:
+            module_id: Canvas module ID
+            name: Module name
+            course: Parent course descriptor
+
+        Returns:
+            ModuleContext instance shared by all callers
+        """
+        key = (str(module_id), name, course)
+        with _lock:
+            context = _modules.get(key)
+            if context is None:
+                context = cls(_intern(key[0]), _intern(name), course)
+                _modules[key] = context
+            return context
+
+    @classmethod
+    def resolve(
+        cls,
+        module: Optional["ModuleContext"],
+        module_id: Optional[str] = None,
+        name: Optional[str] = None,
+        course_id: Optional[str] = None,
+        course_name: Optional[str] = None
+    ) -> "ModuleContext":
+        """
+        Apply ``module_id``/``module_name``/``course_id``/``course_name``
+        model keywords to a context.
+
+        Args:
+            module: Current descriptor, or None
+            module_id: New module ID, or None to keep the current one
+            name: New module name, or None to keep the current one
+            course_id: New course ID, or None to keep the current one
+            course_name: New course name, or None to keep the current one
+
+        Returns:
+            Shared descriptor with the requested values
+
+        Raises:
+            TypeError: If there is no current descriptor and a value is missing
+        """
+        if module is None:
+            if module_id is None or name is None:
+                raise TypeError("module= or module_id=, module_name=, course_id= and course_name= are required")
+            return cls.get(module_id, name, CourseContext.resolve(None, course_id, course_name))
+        if module_id is None and name is None and course_id is None and course_name is None:
+            return module
+        return cls.get(
+            module.id if module_id is None else module_id,
+            module.name if name is None else name,
+            CourseContext.resolve(module.course, course_id, course_name)
+        )
+
+    def __reduce__(self):
+        """Re-intern on unpickling (e.g. results from worker processes)."""
+        return (ModuleContext.get, (self.id, self.name, self.course))
+
+
+class context_property(property):
+    """
+    Property over a shared context that is also a dataclass ``InitVar``.
+
+    Declaring ``course_name: InitVar[Optional[str]]`` and defining the
+    property under the same name keeps ``Model(course_name=...)``,
+    ``dataclasses.replace(model, course_name=...)`` and attribute assignment
+    working. On the class the descriptor reads as None, which dataclasses
+    takes as the InitVar default; on an instance it reads and writes
+    through the getter and setter.
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return None
+        return super().__get__(obj, objtype)
@@ -0,0 +1,205 @@
+"""
+Schema-driven decoding of Canvas API pages straight into models.
+
+The default path turns every page into a list of dicts (``response.json()``)
+and then looks up each field with ``.get()`` in ``from_canvas_api``. When the
+optional ``msgspec`` package is installed, the functions here instead decode
+the raw page bytes against typed schemas that list only the fields the models
+use, so large unused fields (assignment ``rubric`` and ``description``,
+discussion ``permissions``, ...) are skipped without being materialized.
+Without ``msgspec`` they fall back to ``json.loads`` + ``from_canvas_api``.
+
+Example:
+    >>> for page in client.iter_pages(f"/api/v1/courses/{course_id}/assignments"):
+    ...     assignments.extend(decode_assignments(page, course_id, course_name))
+
+Raw NDJSON backups (``JSONWriter.write_raw``) are turned back into models
+with ``decode_raw_export``.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .assignment import Assignment
+from .announcement import Announcement
+from .context import CourseContext
+from .module import Module
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised when msgspec is absent
+    msgspec = None
+
+
+if msgspec is not None:
+
+    class _AssignmentRecord(msgspec.Struct):
+        """Assignment fields used by the Assignment model."""
+
+        id: Union[int, str]
+        name: Optional[str] = Assignment.DEFAULT_NAME
+        due_at: Optional[str] = None
+        points_possible: Optional[Union[int, float]] = None
+        html_url: Optional[str] = ""
+        submission_types: Optional[List[str]] = msgspec.field(default_factory=list)
+        lock_at: Optional[str] = None
+        unlock_at: Optional[str] = None
+        has_submitted_submissions: Optional[bool] = False
+
+    class _AnnouncementRecord(msgspec.Struct):
+        """Announcement fields used by the Announcement model."""
+
+        id: Union[int, str]
+        title: Optional[str] = Announcement.DEFAULT_TITLE
+        posted_at: Optional[str] = None
+        author: Any = msgspec.field(default_factory=dict)
+        html_url: Optional[str] = ""
+        message: Optional[str] = ""
+        attachments: Any = msgspec.field(default_factory=list)
+
+    _assignment_page_decoder = msgspec.json.Decoder(List[_AssignmentRecord])
+    _announcement_page_decoder = msgspec.json.Decoder(List[_AnnouncementRecord])
+
+
+def has_fast_decoder() -> bool:
+    """Return True if pages are decoded with msgspec schemas."""
+    return msgspec is not None
+
+
+def _enriched_records(page: bytes, course_id: str, course_name: str) -> List[Dict[str, Any]]:
+    """Decode a page with json and add the course fields the client would add."""
+    records = json.loads(page)
+    if not isinstance(records, list):
+        records = [records]
+    for record in records:
+        record["_course_id"] = course_id
+        record["_course_name"] = course_name
+    return records
+
+
+def decode_assignments(page: bytes, course_id: str, course_name: str) -> List[Assignment]:
+    """
+    Decode one page of ``/courses/:id/assignments`` into Assignment models.
+
+    Args:
+        page: Raw JSON response body (a list of assignment objects)
+        course_id: Canvas course ID the page belongs to
+        course_name: Course name
+
+    Returns:
+        List of Assignment instances in page order
+
+    Raises:
+        ValueError: If the page is not valid JSON
+        KeyError: If a record lacks an id (ValueError when using msgspec)
+    """
+    if msgspec is None:
+        return [
+            Assignment.from_canvas_api(record)
+            for record in _enriched_records(page, course_id, course_name)
+        ]
+
+    course = CourseContext.get(course_id, course_name)
+    return [
+        Assignment.from_fields(
+            id=record.id,
+            course=course,
+            name=record.name,
+            due_at=record.due_at,
+            points_possible=record.points_possible,
+            html_url=record.html_url,
+            submission_types=record.submission_types,
+            lock_at=record.lock_at,
+            unlock_at=record.unlock_at,
+            has_submitted_submissions=record.has_submitted_submissions,
+        )
+        for record in _assignment_page_decoder.decode(page)
+    ]
+
+
+def decode_announcements(
+    page: bytes,
+    course_id: str,
+    course_name: str,
+    text_limit: Optional[int] = None
+) -> List[Announcement]:
+    """
+    Decode one page of announcement discussion topics into Announcement models.
+
+    Args:
+        page: Raw JSON response body (a list of discussion topic objects)
+        course_id: Canvas course ID the page belongs to
+        course_name: Course name
+        text_limit: Optional maximum length of ``message_text``
+
+    Returns:
+        List of Announcement instances in page order
+
+    Raises:
+        ValueError: If the page is not valid JSON
+        KeyError: If a record lacks an id (ValueError when using msgspec)
+    """
+    if msgspec is None:
+        return [
+            Announcement.from_canvas_api(record, text_limit=text_limit)
+            for record in _enriched_records(page, course_id, course_name)
+        ]
+
+    course = CourseContext.get(course_id, course_name)
+    return [
+        Announcement.from_fields(
+            id=record.id,
+            course=course,
+            title=record.title,
+            posted_at=record.posted_at,
+            author=record.author,
+            html_url=record.html_url,
+            message_html=record.message,
+            attachments=record.attachments,
+            text_limit=text_limit,
+        )
+        for record in _announcement_page_decoder.decode(page)
+    ]
+
+
+def decode_raw_export(
+    lines: Iterable[Union[str, bytes]],
+    text_limit: Optional[int] = None
+) -> Iterator[Union[Assignment, Announcement, Module]]:
+    """
+    Parse a raw NDJSON export back into models, one line at a time.
+
+    Works on any iterable of lines, so compressed backups can be read with
+    ``gzip.open`` (or a zstandard stream reader) and never loaded whole.
+
+    Example:
+        >>> with gzip.open("backup.ndjson.gz") as f:
+        ...     assignments = [m for m in decode_raw_export(f) if isinstance(m, Assignment)]
+
+    Args:
+        lines: Lines of a file written by ``JSONWriter.write_raw``
+        text_limit: Optional maximum length of announcement ``message_text``
+
+    Yields:
+        Assignment, Announcement and Module instances in file order
+        (the metadata line is skipped)
+
+    Raises:
+        ValueError: If a line is not valid JSON or has an unknown record type
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        record_type = entry.get("type")
+        if record_type == "metadata":
+            continue
+        record = entry.get("data")
+        if record_type == "assignment":
+            yield Assignment.from_canvas_api(record)
+        elif record_type == "announcement":
+            yield Announcement.from_canvas_api(record, text_limit=text_limit)
+        elif record_type == "module":
+            yield Module.from_canvas_api(record, record.get("_course_name", "Unknown Course"))
+        else:
+            raise ValueError(f"Unknown record type {record_type!r} on line {line_number}")
@@ -1,8 +1,12 @@
 """Module and ModuleItem data models."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, InitVar
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
+
+from canvas_toolkit.utils.dates import parse_canvas_datetime
+from .columns import project
+from .context import CourseContext, ModuleContext, context_property
 
 
 @dataclass
@@ -11,14 +15,11 @@ class ModuleItem:
     Standardized module item data model.
 
     Represents individual items within Canvas modules (assignments, pages,
-    files, external URLs, etc.).
+    files, external URLs, etc.). Module and course details live in a shared
+    ModuleContext rather than being copied into every item.
     """
 
     id: str
-    module_id: str
-    module_name: str
-    course_id: str
-    course_name: str
     position: int
     title: str
     type: str
@@ -27,9 +28,37 @@ class ModuleItem:
     indent: int = 0
     due_at: Optional[str] = None
     points_possible: Optional[float] = None
+    module: Optional[ModuleContext] = None
+    # Constructor keywords resolved into ``module`` (properties below)
+    module_id: InitVar[Optional[str]]
+    module_name: InitVar[Optional[str]]
+    course_id: InitVar[Optional[str]]
+    course_name: InitVar[Optional[str]]
+
+    # Export columns and how to compute each, in to_dict() order
+    _COLUMN_GETTERS = {
+        "Course": lambda m: m.course_name,
+        "Module": lambda m: m.module_name,
+        "Item Title": lambda m: m.title_with_indent,
+        "Item Type": lambda m: m.type,
+        "Published": lambda m: "Yes" if m.published else "No",
+        "Due Date": lambda m: m.due_date_formatted,
+        "Points": lambda m: m.points_possible if m.points_possible is not None else "N/A",
+        "Canvas Link": lambda m: m.html_url,
+    }
+
+    # Export column names, in to_dict() order
+    EXPORT_COLUMNS = tuple(_COLUMN_GETTERS)
 
     @classmethod
-    def from_canvas_api(cls, api_response: Dict[str, Any], module_name: str, course_id: str, course_name: str) -> "ModuleItem":
+    def from_canvas_api(
+        cls,
+        api_response: Dict[str, Any],
+        module_name: Optional[str] = None,
+        course_id: Optional[str] = None,
+        course_name: Optional[str] = None,
+        module: Optional[ModuleContext] = None
+    ) -> "ModuleItem":
         """
         Create ModuleItem from Canvas API response.
 
@@ -38,10 +67,19 @@ class ModuleItem:
             module_name: Name of parent module
             course_id: Canvas course ID
             course_name: Course name
+            module: Shared parent module descriptor; replaces the three
+                name/ID arguments when given
 
         Returns:
             ModuleItem instance
         """
+        if module is None:
+            module = ModuleContext.get(
+                api_response.get("module_id", ""),
+                module_name,
+                CourseContext.get(course_id, course_name)
+            )
+
         # Extract content details if available
         content_details = api_response.get("content_details", {})
         due_at = content_details.get("due_at") if content_details else None
@@ -49,10 +87,7 @@ class ModuleItem:
 
         return cls(
             id=str(api_response["id"]),
-            module_id=str(api_response.get("module_id", "")),
-            module_name=module_name,
-            course_id=str(course_id),
-            course_name=course_name,
+            module=module,
             position=api_response.get("position", 0),
             title=api_response.get("title", "Untitled Item"),
             type=api_response.get("type", "Unknown"),
@@ -63,12 +98,62 @@ class ModuleItem:
             points_possible=points_possible,
         )
 
+    def __post_init__(
+        self,
+        module_id: Optional[str],
+        module_name: Optional[str],
+        course_id: Optional[str],
+        course_name: Optional[str]
+    ) -> None:
+        self.module = ModuleContext.resolve(self.module, module_id, module_name, course_id, course_name)
+
+    @context_property
+    def module_id(self) -> str:
+        """Return the Canvas module ID."""
+        return self.module.id
+
+    @module_id.setter
+    def module_id(self, value: str) -> None:
+        self.module = ModuleContext.resolve(self.module, module_id=value)
+
+    @context_property
+    def module_name(self) -> str:
+        """Return the parent module name."""
+        return self.module.name
+
+    @module_name.setter
+    def module_name(self, value: str) -> None:
+        self.module = ModuleContext.resolve(self.module, name=value)
+
+    @context_property
+    def course_id(self) -> str:
+        """Return the Canvas course ID."""
+        return self.module.course.id
+
+    @course_id.setter
+    def course_id(self, value: str) -> None:
+        self.module = ModuleContext.resolve(self.module, course_id=value)
+
+    @context_property
+    def course_name(self) -> str:
+        """Return the course name."""
+        return self.module.course.name
+
+    @course_name.setter
+    def course_name(self, value: str) -> None:
+        self.module = ModuleContext.resolve(self.module, course_name=value)
+
     @property
     def title_with_indent(self) -> str:
         """Return title with indent spacing (2 spaces per indent level)."""
         indent_str = "  " * self.indent
         return f"{indent_str}{self.title}"
 
+    @property
+    def due_datetime(self) -> Optional[datetime]:
+        """Return parsed due date, or None if missing or invalid."""
+        return parse_canvas_datetime(self.due_at)
+
     @property
     def due_date_formatted(self) -> str:
         """Return formatted due date or 'No due date'."""
@@ -80,18 +165,17 @@ class ModuleItem:
         except (ValueError, AttributeError):
             return self.due_at
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for export."""
-        return {
-            "Course": self.course_name,
-            "Module": self.module_name,
-            "Item Title": self.title_with_indent,
-            "Item Type": self.type,
-            "Published": "Yes" if self.published else "No",
-            "Due Date": self.due_date_formatted,
-            "Points": self.points_possible if self.points_possible is not None else "N/A",
-            "Canvas Link": self.html_url,
-        }
+    def to_dict(self, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary for export.
+
+        Args:
+            columns: Optional subset of EXPORT_COLUMNS, in output order. Only
+                those values are computed. Default: all columns.
+        """
+        if columns is None:
+            columns = self.EXPORT_COLUMNS
+        return project(self, self._COLUMN_GETTERS, columns)
 
 
 @dataclass
@@ -124,28 +208,24 @@ class Module:
         """
         module_id = str(api_response["id"])
         module_name = api_response.get("name", "Untitled Module")
-        course_id = str(api_response.get("_course_id", ""))
+        course = CourseContext.get(api_response.get("_course_id", ""), course_name)
+        module = ModuleContext.get(module_id, module_name, course)
 
         # Parse nested items if present
         items = []
         raw_items = api_response.get("items", [])
         for item_data in raw_items:
             try:
-                item = ModuleItem.from_canvas_api(
-                    api_response=item_data,
-                    module_name=module_name,
-                    course_id=course_id,
-                    course_name=course_name
-                )
+                item = ModuleItem.from_canvas_api(api_response=item_data, module=module)
                 items.append(item)
             except (KeyError, ValueError) as e:
                 # Skip malformed items
                 continue
 
         return cls(
-            id=module_id,
-            name=module_name,
-            course_id=course_id,
-            course_name=course_name,
+            id=module.id,
+            name=module.name,
+            course_id=course.id,
+            course_name=course.name,
             items=items,
         )
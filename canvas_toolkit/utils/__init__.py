@@ -1,4 +1,5 @@
 # Utilities module
 from .html_parser import HTMLTextExtractor
+from .html_cache import HTMLCache
 
-__all__ = ["HTMLTextExtractor"]
+__all__ = ["HTMLTextExtractor", "HTMLCache"]
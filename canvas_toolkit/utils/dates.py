@@ -0,0 +1,27 @@
+"""Date parsing utilities for Canvas timestamps."""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=4096)
+def parse_canvas_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp from the Canvas API.
+
+    Results are cached because the same due dates recur across many records.
+
+    Args:
+        value: Timestamp string such as "2026-02-15T23:59:00Z", or None
+
+    Returns:
+        datetime (timezone-aware when the string has an offset), or None if
+        the value is missing or not a valid timestamp
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
@@ -0,0 +1,179 @@
+"""Content-hash cache for HTML-to-text conversion."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Union
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+ParseResult = Tuple[str, List[Dict[str, str]]]
+
+
+class HTMLCache:
+    """
+    Bounded LRU cache of parsed HTML, keyed by a hash of the HTML.
+
+    Cross-posted announcements and repeated exports see the same messages
+    again and again; a hit skips HTML parsing entirely. When ``cache_dir``
+    is given, entries are also persisted as small JSON files so they survive
+    between runs (the directory itself is not size-bounded).
+    """
+
+    def __init__(self, maxsize: int = 2048, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory
+            cache_dir: Optional directory for the disk-backed tier
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(html: str, *options) -> str:
+        """
+        Build a cache key from the HTML content and parse options.
+
+        Args:
+            html: HTML string
+            *options: Parse options that change the result (e.g. max_chars)
+
+        Returns:
+            Hex digest identifying the content and options
+        """
+        digest = hashlib.blake2b(html.encode("utf-8"), digest_size=16)
+        digest.update(repr(options).encode("ascii"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[ParseResult]:
+        """
+        Look up a parse result, counting a hit or a miss.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Tuple of (text, links), or None if not cached
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+
+        if value is None and self.cache_dir:
+            value = self._read_disk(key)
+            if value is not None:
+                self._remember(key, value)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        text, links = value
+        # Hand out copies so callers cannot mutate the cached links
+        return text, [dict(link) for link in links]
+
+    def put(self, key: str, value: ParseResult) -> None:
+        """
+        Store a parse result.
+
+        Args:
+            key: Key from make_key()
+            value: Tuple of (text, links)
+        """
+        text, links = value
+        value = (text, [dict(link) for link in links])
+        self._remember(key, value)
+        if self.cache_dir:
+            self._write_disk(key, value)
+
+    def entries(self) -> List[Tuple[str, ParseResult]]:
+        """
+        Snapshot the in-memory entries, oldest first.
+
+        Returns:
+            List of (key, (text, links)) pairs
+        """
+        with self._lock:
+            return list(self._entries.items())
+
+    def merge(self, entries: List[Tuple[str, ParseResult]]) -> None:
+        """
+        Add entries produced elsewhere (e.g. by worker processes) to memory.
+
+        The disk tier is not written; a worker sharing ``cache_dir`` has
+        already persisted its entries.
+
+        Args:
+            entries: (key, (text, links)) pairs, as returned by entries()
+        """
+        for key, value in entries:
+            self._remember(key, value)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def _remember(self, key: str, value: ParseResult) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[ParseResult]:
+        """Load an entry from the disk tier, ignoring unreadable files."""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data["text"], data["links"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_disk(self, key: str, value: ParseResult) -> None:
+        """Persist an entry atomically; failures only cost a future miss."""
+        text, links = value
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"text": text, "links": links}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
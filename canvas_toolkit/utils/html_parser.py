@@ -1,8 +1,9 @@
 """HTML text extraction utilities."""
 
 from html.parser import HTMLParser
-from typing import List, Dict
-import re
+from typing import List, Dict, Optional, Tuple
+
+from .html_cache import HTMLCache, CacheInfo
 
 
 class HTMLTextExtractor(HTMLParser):
@@ -11,17 +12,43 @@ class HTMLTextExtractor(HTMLParser):
 
     Provides static methods for converting HTML to plain text while preserving
     paragraph breaks and extracting embedded hyperlinks.
+
+    Whitespace is normalized as text arrives, so the parser never holds more
+    than the (optionally bounded) output text in memory.
+
+    Results are memoized in ``HTMLTextExtractor.cache`` keyed by a hash of the
+    HTML. Assign a configured ``HTMLCache`` (e.g. disk-backed) to change it,
+    or None to disable caching.
     """
 
-    def __init__(self):
-        """Initialize the parser."""
+    # Size of the slices fed to the parser when early termination is possible
+    FEED_CHUNK_SIZE = 8192
+
+    # Shared memo of parse results, keyed by content hash
+    cache: Optional[HTMLCache] = HTMLCache()
+
+    def __init__(self, max_chars: Optional[int] = None):
+        """
+        Initialize the parser.
+
+        Args:
+            max_chars: Optional character budget for extracted text. Once it is
+                reached, further text is skipped (links are still collected).
+        """
         super().__init__()
+        self.max_chars = max_chars
         self.text_parts = []
+        self.text_length = 0
         self.links = []
         self.in_link = False
         self.current_link_url = None
         self.current_link_text = []
 
+    @property
+    def text_full(self) -> bool:
+        """Return True once the text budget has been reached."""
+        return self.max_chars is not None and self.text_length >= self.max_chars
+
     def handle_starttag(self, tag, attrs):
         """Handle opening HTML tags."""
         if tag == 'a':
@@ -29,8 +56,6 @@ class HTMLTextExtractor(HTMLParser):
             attrs_dict = dict(attrs)
             self.current_link_url = attrs_dict.get('href', '')
             self.current_link_text = []
-        elif tag in ['p', 'br', 'div']:
-            self.text_parts.append('\n')
 
     def handle_endtag(self, tag):
         """Handle closing HTML tags."""
@@ -48,24 +73,36 @@ class HTMLTextExtractor(HTMLParser):
 
     def handle_data(self, data):
         """Handle text data within HTML tags."""
-        clean = data.strip()
-        if clean:
-            self.text_parts.append(clean + ' ')
-            if self.in_link:
+        if self.in_link:
+            clean = data.strip()
+            if clean:
                 self.current_link_text.append(clean)
 
+        if self.text_full:
+            return
+
+        # Collapse whitespace runs to single spaces as the text arrives
+        words = data.split()
+        if not words:
+            return
+        chunk = ' '.join(words)
+        if self.text_parts:
+            self.text_length += 1  # Separator between chunks
+        self.text_parts.append(chunk)
+        self.text_length += len(chunk)
+
     def get_text(self) -> str:
         """
         Get cleaned plain text from parsed HTML.
 
         Returns:
-            Plain text with preserved paragraph breaks and cleaned whitespace
+            Plain text with cleaned whitespace, truncated to ``max_chars``
+            when a budget was given
         """
-        text = ''.join(self.text_parts)
-        # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n\s+', '\n', text)
-        return text.strip()
+        text = ' '.join(self.text_parts)
+        if self.max_chars is not None:
+            text = text[:self.max_chars]
+        return text
 
     def get_links(self) -> List[Dict[str, str]]:
         """
@@ -77,7 +114,67 @@ class HTMLTextExtractor(HTMLParser):
         return self.links
 
     @staticmethod
-    def extract(html: str) -> str:
+    def parse(
+        html: str,
+        max_chars: Optional[int] = None,
+        collect_links: bool = True
+    ) -> Tuple[str, List[Dict[str, str]]]:
+        """
+        Extract plain text and links from HTML in a single pass.
+
+        When ``max_chars`` is given and links are not needed, parsing stops
+        as soon as the text budget is reached.
+
+        Args:
+            html: HTML string to parse
+            max_chars: Optional maximum length of the returned text
+            collect_links: If False, skip the rest of the document once the
+                text budget is reached
+
+        Returns:
+            Tuple of (plain text, list of link dicts)
+        """
+        if not html:
+            return "", []
+
+        cache = HTMLTextExtractor.cache
+        if cache is not None:
+            key = cache.make_key(html, max_chars, collect_links)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        parser = HTMLTextExtractor(max_chars=max_chars)
+        if max_chars is None or collect_links:
+            parser.feed(html)
+        else:
+            # Cut slices just before a tag so no text run is split in two
+            start = 0
+            while start < len(html) and not parser.text_full:
+                end = html.find('<', start + HTMLTextExtractor.FEED_CHUNK_SIZE)
+                if end < 0:
+                    end = len(html)
+                parser.feed(html[start:end])
+                start = end
+
+        result = parser.get_text(), parser.get_links()
+        if cache is not None:
+            cache.put(key, result)
+        return result
+
+    @staticmethod
+    def cache_info() -> Optional[CacheInfo]:
+        """
+        Get hit/miss counters of the shared parse cache.
+
+        Returns:
+            CacheInfo tuple, or None if caching is disabled
+        """
+        cache = HTMLTextExtractor.cache
+        return cache.info() if cache is not None else None
+
+    @staticmethod
+    def extract(html: str, max_chars: Optional[int] = None) -> str:
         """
         Extract plain text from HTML.
 
@@ -86,16 +183,14 @@ class HTMLTextExtractor(HTMLParser):
 
         Args:
             html: HTML string to parse
+            max_chars: Optional maximum length of the returned text; parsing
+                stops early once it is reached
 
         Returns:
             Plain text extracted from HTML
         """
-        if not html:
-            return ""
-
-        parser = HTMLTextExtractor()
-        parser.feed(html)
-        return parser.get_text()
+        text, _ = HTMLTextExtractor.parse(html, max_chars=max_chars, collect_links=False)
+        return text
 
     @staticmethod
     def extract_links(html: str) -> List[Dict[str, str]]:
@@ -108,9 +203,6 @@ class HTMLTextExtractor(HTMLParser):
         Returns:
             List of dicts with 'text' and 'url' keys for each <a> tag
         """
-        if not html:
-            return []
-
-        parser = HTMLTextExtractor()
-        parser.feed(html)
-        return parser.get_links()
+        # A zero budget skips all text bookkeeping
+        _, links = HTMLTextExtractor.parse(html, max_chars=0)
+        return links
@@ -1,5 +1,36 @@
-from .excel_writer import ExcelWriter
-from .csv_writer import CSVWriter
-from .json_writer import JSONWriter
+"""
+Export writers.
 
-__all__ = ["ExcelWriter", "CSVWriter", "JSONWriter"]
+Writer modules are imported on first use (PEP 562 module ``__getattr__``),
+so ``from canvas_toolkit.writers import CSVWriter`` does not pay for
+xlsxwriter or pyarrow.
+"""
+
+import importlib
+
+# Public name -> submodule defining it
+_WRITER_MODULES = {
+    "ExcelWriter": "excel_writer",
+    "CSVWriter": "csv_writer",
+    "JSONWriter": "json_writer",
+    "ParquetWriter": "parquet_writer",
+    "SQLiteWriter": "sqlite_writer",
+    "FanOutWriter": "fanout_writer",
+    "ZipBundleWriter": "zip_writer",
+}
+
+__all__ = ["ExcelWriter", "CSVWriter", "JSONWriter", "ParquetWriter", "SQLiteWriter", "FanOutWriter", "ZipBundleWriter"]
+
+
+def __getattr__(name):
+    if name not in _WRITER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_WRITER_MODULES[name]}", __name__)
+    value = getattr(module, name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
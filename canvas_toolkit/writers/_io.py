@@ -0,0 +1,148 @@
+"""Output targets shared by the writers: filesystem paths or binary streams."""
+
+import gzip
+import io
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, TextIO, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised when zstandard is absent
+    zstandard = None
+
+# What writers accept as output_path
+OutputTarget = Union[str, Path, BinaryIO]
+
+# Streaming compression codecs, and the extensions that select them
+COMPRESSIONS = ("gzip", "zstd")
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+# Moderate levels: repetitive export data compresses well without the
+# CPU cost of the maximum settings
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def is_stream(target) -> bool:
+    """True for file-like objects (e.g. BytesIO), False for paths."""
+    return hasattr(target, "write")
+
+
+def output_target(target: OutputTarget) -> Union[Path, BinaryIO]:
+    """Normalize an output target: paths become Path, streams pass through."""
+    return target if is_stream(target) else Path(target)
+
+
+def target_suffix(target: Union[Path, BinaryIO]) -> str:
+    """
+    Lower-case format extension of a path target ("" for streams).
+
+    A trailing compression extension is skipped: "out.ndjson.gz" -> ".ndjson".
+    """
+    if is_stream(target):
+        return ""
+    suffixes = [suffix.lower() for suffix in target.suffixes]
+    if suffixes and suffixes[-1] in COMPRESSION_SUFFIXES:
+        suffixes.pop()
+    return suffixes[-1] if suffixes else ""
+
+
+def resolve_compression(target: Union[Path, BinaryIO], compression: Optional[str]) -> Optional[str]:
+    """
+    Validate a compression argument.
+
+    Args:
+        target: Output target (used when inferring)
+        compression: "gzip", "zstd", None for no compression, or "infer" to
+            choose from the path's extension (.gz / .zst)
+
+    Returns:
+        Codec name, or None for uncompressed output
+
+    Raises:
+        ValueError: If the codec is not supported
+        ImportError: If zstd is requested and zstandard is not installed
+    """
+    if compression == "infer":
+        if is_stream(target):
+            return None
+        compression = COMPRESSION_SUFFIXES.get(target.suffix.lower())
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"compression must be one of {COMPRESSIONS}, 'infer' or None, got: {compression}")
+    if compression == "zstd" and zstandard is None:
+        raise ImportError(
+            "zstd compression requires zstandard. Install it with: pip install canvas-toolkit[zstd]"
+        )
+    return compression
+
+
+@contextmanager
+def _compressor(raw: BinaryIO, compression: str) -> Iterator[BinaryIO]:
+    """Compress writes into ``raw``, finishing the frame without closing it."""
+    if compression == "gzip":
+        f = gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=GZIP_LEVEL)
+    else:
+        f = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=False)
+    try:
+        yield f
+    finally:
+        f.close()
+
+
+@contextmanager
+def open_binary(
+    target: Union[Path, BinaryIO],
+    buffering: int = -1,
+    compression: Optional[str] = None
+) -> Iterator[BinaryIO]:
+    """
+    Open a target for binary writing, optionally compressing as it is written.
+
+    Streams are written at their current position and left open for the
+    caller; paths are opened (and closed) here.
+    """
+    if is_stream(target):
+        raw_context = _borrowed(target)
+    else:
+        raw_context = open(target, 'wb', buffering=buffering)
+
+    with raw_context as raw:
+        if compression is None:
+            yield raw
+        else:
+            with _compressor(raw, compression) as f:
+                yield f
+
+
+@contextmanager
+def open_text(
+    target: Union[Path, BinaryIO],
+    buffering: int = -1,
+    newline: Optional[str] = None,
+    compression: Optional[str] = None
+) -> Iterator[TextIO]:
+    """
+    Open a target for UTF-8 text writing, optionally compressing.
+
+    Binary streams are wrapped for the duration of the write and detached
+    afterwards, so the caller's stream stays open.
+    """
+    if not is_stream(target) and compression is None:
+        with open(target, 'w', encoding='utf-8', newline=newline, buffering=buffering) as f:
+            yield f
+        return
+
+    with open_binary(target, buffering, compression) as raw:
+        wrapper = io.TextIOWrapper(raw, encoding='utf-8', newline=newline)
+        try:
+            yield wrapper
+        finally:
+            wrapper.flush()
+            wrapper.detach()
+
+
+@contextmanager
+def _borrowed(stream: BinaryIO) -> Iterator[BinaryIO]:
+    """Use a caller's stream without closing it."""
+    yield stream
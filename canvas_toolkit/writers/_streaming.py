@@ -0,0 +1,77 @@
+"""Helpers shared by writers that accept iterators of models."""
+
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, TypeVar
+from ..models import Assignment
+from ..models.announcement import Announcement
+from ..models.columns import check_columns
+from ..models.module import ModuleItem
+
+T = TypeVar("T")
+
+# Content type names used by the multi-content writers, and their models
+CONTENT_MODELS = {
+    "assignments": Assignment,
+    "announcements": Announcement,
+    "modules": ModuleItem,
+}
+
+
+def peek(items: Optional[Iterable[T]]) -> Optional[Iterator[T]]:
+    """
+    Check whether an iterable has any items without losing the first one.
+
+    Args:
+        items: List, generator or other iterable (or None)
+
+    Returns:
+        Iterator over all items, or None if ``items`` is None or empty
+    """
+    if items is None:
+        return None
+    iterator = iter(items)
+    for first in iterator:
+        return chain((first,), iterator)
+    return None
+
+
+def check_shared_rows(rows: Any, presorted: bool, columns: Any) -> None:
+    """
+    Validate precomputed export rows passed to a writer's ``write()``.
+
+    Rows are matched to items by position, so the items must already be in
+    export order, and they hold every column, so no selection may apply.
+
+    Raises:
+        ValueError: If rows are given without presorted input or with columns
+    """
+    if rows is None:
+        return
+    if not presorted:
+        raise ValueError("rows require presorted=True")
+    if columns:
+        raise ValueError("rows cannot be combined with a column selection")
+
+
+def check_content_columns(columns: Optional[Dict[str, Sequence[str]]]) -> Dict[type, tuple]:
+    """
+    Validate a per-content-type column selection.
+
+    Args:
+        columns: Mapping of content type ("assignments", "announcements",
+            "modules") to the columns to export for it, or None
+
+    Returns:
+        Mapping of model class to validated columns (types left out export
+        all columns)
+
+    Raises:
+        ValueError: If a content type or column is unknown
+    """
+    selected = {}
+    for content, content_columns in (columns or {}).items():
+        if content not in CONTENT_MODELS:
+            raise ValueError(f"columns keys must be in {tuple(CONTENT_MODELS)}, got: {content}")
+        model_type = CONTENT_MODELS[content]
+        selected[model_type] = check_columns(model_type, content_columns)
+    return selected
@@ -1,68 +1,114 @@
 """CSV export."""
 
 import csv
+from itertools import chain
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Iterable, Optional, Sequence, Union
 from ..models import Assignment
 from ..models.announcement import Announcement
+from ..models.columns import check_columns
 from ..models.module import ModuleItem
+from ..utils.sorting import due_date_key, posted_date_key
+from ._io import OutputTarget, open_text, output_target, resolve_compression
+from ._streaming import check_shared_rows, peek
 
 
 class CSVWriter:
     """Export assignments to CSV file."""
 
-    def __init__(self, output_path: str = "canvas_assignments.csv"):
+    # Output buffer size; rows are flushed in large blocks
+    BUFFER_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        output_path: OutputTarget = "canvas_assignments.csv",
+        compression: Optional[str] = "infer",
+        columns: Optional[Sequence[str]] = None
+    ):
         """
         Initialize CSV writer.
 
         Args:
-            output_path: Path for output CSV file
+            output_path: Path for output CSV file, or a binary stream (e.g.
+                BytesIO) to write UTF-8 CSV into
+            compression: "gzip" or "zstd" to compress while writing, None for
+                plain CSV, or "infer" (default) to choose from a .gz / .zst
+                extension
+            columns: Optional subset of the model's EXPORT_COLUMNS to write,
+                in output order; other columns are never computed
         """
-        self.output_path = Path(output_path)
+        self.output_path = output_target(output_path)
+        self.compression = resolve_compression(self.output_path, compression)
+        self.columns = tuple(columns) if columns is not None else None
 
-    def write(self, items: List) -> Path:
+    def write(
+        self,
+        items: Iterable,
+        presorted: bool = False,
+        rows: Optional[Iterable[dict]] = None
+    ) -> Union[Path, BinaryIO]:
         """
         Write items to CSV.
 
+        Items may be a list or any iterator; each item is converted exactly
+        once and written straight through a buffered file. Module items (and
+        presorted input) are never materialized, so memory stays constant.
+
         Args:
-            items: List of Assignment, Announcement, or ModuleItem objects
+            items: Iterable of Assignment, Announcement, or ModuleItem objects
+                (all of the same type)
+            presorted: If True, assignments (by due date) and announcements
+                (newest first) are already in export order and are not sorted
+            rows: Optional export rows (``to_dict()``) already computed for
+                ``items``, in the same order; requires presorted input and no
+                column selection (FanOutWriter shares rows between sinks)
 
         Returns:
-            Path to created CSV file
+            Path to created CSV file, or the stream it was written to
         """
-        if not items:
+        check_shared_rows(rows, presorted, self.columns)
+        items = peek(items)
+        if items is None:
             raise ValueError("No items to export")
 
-        # Convert all items to dictionaries using to_dict() method
-        rows = [item.to_dict() for item in items]
-
-        # Determine fieldnames from first item
-        fieldnames = list(rows[0].keys())
+        first = next(items)
+        model_type = type(first)
+        items = self._export_order([first], items, model_type, presorted)
 
-        # Sort if applicable (assignments and announcements have dates)
-        if isinstance(items[0], Assignment):
-            # Sort by due date (assignments without due dates go to end)
-            sorted_items = sorted(
-                items,
-                key=lambda a: (a.due_at is None, a.due_at or '')
-            )
-            rows = [item.to_dict() for item in sorted_items]
-        elif isinstance(items[0], Announcement):
-            # Sort by posted date (newest first)
-            sorted_items = sorted(
-                items,
-                key=lambda a: a.posted_at or '',
-                reverse=True
-            )
-            rows = [item.to_dict() for item in sorted_items]
-        # ModuleItems don't need sorting (maintain module order)
+        # Headers come from the model type, not from converting an item
+        fieldnames = check_columns(model_type, self.columns) or model_type.EXPORT_COLUMNS
 
         # Write CSV
-        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+        with open_text(self.output_path, buffering=self.BUFFER_SIZE, newline='', compression=self.compression) as f:
+            writer = csv.writer(f)
 
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
+            writer.writerow(fieldnames)
+            # to_dict() yields values in EXPORT_COLUMNS order
+            if rows is None:
+                to_row = self._to_row
+                rows = (to_row(item) for item in items)
+            writer.writerows(row.values() for row in rows)
 
         return self.output_path
+
+    def _to_row(self, item) -> dict:
+        """Convert one item to its export row."""
+        if self.columns is None:
+            return item.to_dict()
+        return item.to_dict(self.columns)
+
+    @staticmethod
+    def _export_order(head: list, rest: Iterable, model_type: type, presorted: bool) -> Iterable:
+        """Return all items in export order, sorting only when needed."""
+        if presorted or issubclass(model_type, ModuleItem):
+            # ModuleItems don't need sorting (maintain module order)
+            return chain(head, rest)
+
+        items = head + list(rest)
+        if issubclass(model_type, Assignment):
+            # Sort by due date (assignments without due dates go to end)
+            items.sort(key=due_date_key)
+        elif issubclass(model_type, Announcement):
+            # Sort by posted date (newest first)
+            items.sort(key=posted_date_key)
+        return items
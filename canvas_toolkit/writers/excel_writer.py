@@ -1,47 +1,163 @@
 """Excel export with formatting."""
 
-import pandas as pd
 from pathlib import Path
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
 import xlsxwriter
+from xlsxwriter.utility import xl_col_to_name
+from ._io import OutputTarget, is_stream, output_target
+from ._streaming import check_shared_rows, peek
+from ..utils.sorting import due_date_key, posted_date_key
 from ..models import Assignment
 from ..models.announcement import Announcement
 from ..models.module import ModuleItem
 
 
+def _excel_datetime(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert to the naive UTC time written to date cells (the time the formatted dates show)."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _utc_now_formula() -> str:
+    """
+    Excel expression for the current UTC time.
+
+    NOW() is the local time of whoever opens the file, while date cells
+    hold UTC, so the rules subtract this machine's UTC offset at export
+    time (it is not updated for later daylight-saving changes).
+    """
+    offset = datetime.now().astimezone().utcoffset()
+    minutes = int(offset.total_seconds() // 60) if offset else 0
+    if minutes == 0:
+        return "NOW()"
+    return f"(NOW(){'-' if minutes > 0 else '+'}{abs(minutes)}/1440)"
+
+
 class ExcelWriter:
     """Export assignments to formatted Excel file."""
 
-    def __init__(self, output_path: str = "canvas_assignments.xlsx"):
+    # Display format for date cells, matching the models' formatted dates
+    DATE_FORMAT = 'mm/dd/yyyy hh:mm AM/PM'
+
+    HIGHLIGHT_MODES = ("static", "dynamic")
+
+    # Excel ignores hyperlinks beyond this many per worksheet
+    MAX_URLS_PER_SHEET = 65530
+
+    LINK_OVERFLOW_MODES = ("formula", "text")
+
+    # HYPERLINK() rejects link locations longer than this
+    MAX_FORMULA_URL_LENGTH = 255
+
+    LINK_TEXT = "Open in Canvas"
+
+    LAYOUTS = ("combined", "per_course")
+
+    # Excel's limit on worksheet name length
+    MAX_SHEET_NAME_LENGTH = 31
+
+    def __init__(
+        self,
+        output_path: OutputTarget = "canvas_assignments.xlsx",
+        constant_memory: bool = False,
+        highlight: str = "static",
+        url_limit: int = MAX_URLS_PER_SHEET,
+        link_overflow: str = "formula",
+        layout: str = "combined"
+    ):
         """
         Initialize Excel writer.
 
         Args:
-            output_path: Path for output Excel file
+            output_path: Path for output Excel file, or a binary stream
+                (e.g. BytesIO) to write the workbook into
+            constant_memory: If True, stream each row to disk as soon as the
+                next one starts (xlsxwriter ``constant_memory`` mode) so memory
+                stays flat regardless of sheet size. Rows are always written
+                in order, so all formatting works in this mode.
+            highlight: How overdue/upcoming/recent rows are highlighted.
+                "static" formats each row from the state at export time.
+                "dynamic" adds a few conditional format rules comparing the
+                date cells to NOW(), so the highlighting stays accurate as
+                days pass; the rules shift NOW() by the UTC offset of the
+                machine writing the file. In both modes dates are written
+                as real date cells in UTC, matching the CSV/JSON exports,
+                and points as numbers, so they sort and filter correctly.
+            url_limit: Number of native hyperlinks written per sheet before
+                switching to ``link_overflow`` (capped at Excel's 65,530).
+                Native hyperlinks are the slowest cells to write, so lower
+                values speed up very large sheets.
+            link_overflow: How links past ``url_limit`` are written:
+                "formula" (clickable =HYPERLINK() formulas) or "text"
+                (plain URLs)
+            layout: "combined" writes one sheet per content type ("All
+                Assignments", ...). "per_course" writes one sheet per course
+                (and content type), each sorted on its own.
+
+        Raises:
+            ValueError: If highlight, link_overflow or layout is not a supported mode
         """
-        self.output_path = Path(output_path)
+        if highlight not in self.HIGHLIGHT_MODES:
+            raise ValueError(f"highlight must be one of {self.HIGHLIGHT_MODES}, got: {highlight}")
+        if link_overflow not in self.LINK_OVERFLOW_MODES:
+            raise ValueError(f"link_overflow must be one of {self.LINK_OVERFLOW_MODES}, got: {link_overflow}")
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"layout must be one of {self.LAYOUTS}, got: {layout}")
+
+        self.output_path = output_target(output_path)
+        self.constant_memory = constant_memory
+        self.highlight = highlight
+        self.url_limit = max(0, min(url_limit, self.MAX_URLS_PER_SHEET))
+        self.link_overflow = link_overflow
+        self.layout = layout
 
     def write(
         self,
-        assignments: Optional[List[Assignment]] = None,
-        announcements: Optional[List[Announcement]] = None,
-        modules: Optional[List[ModuleItem]] = None
-    ) -> Path:
+        assignments: Optional[Iterable[Assignment]] = None,
+        announcements: Optional[Iterable[Announcement]] = None,
+        modules: Optional[Iterable[ModuleItem]] = None,
+        presorted: bool = False,
+        rows: Optional[Dict[str, Iterable[dict]]] = None
+    ) -> Union[Path, BinaryIO]:
         """
         Write assignments, announcements, and/or modules to Excel with formatting.
 
+        Any argument may be a list or an iterator. Module items are never
+        sorted, so they are streamed straight through; assignments and
+        announcements are only streamed when ``presorted`` is True. The
+        per_course layout groups items by course before writing.
+
         Args:
-            assignments: Optional list of Assignment objects
-            announcements: Optional list of Announcement objects
-            modules: Optional list of ModuleItem objects
+            assignments: Optional iterable of Assignment objects
+            announcements: Optional iterable of Announcement objects
+            modules: Optional iterable of ModuleItem objects
+            presorted: If True, assignments (by due date) and announcements
+                (newest first) are already in export order and are not sorted
+            rows: Optional mapping of content type ("assignments", ...) to
+                export rows (``to_dict()``) already computed for that input,
+                in the same order; requires presorted input (FanOutWriter
+                shares rows between sinks)
 
         Returns:
-            Path to created Excel file
+            Path to created Excel file, or the stream it was written to
         """
+        check_shared_rows(rows, presorted, None)
+        rows = rows or {}
+        assignments = peek(assignments)
+        announcements = peek(announcements)
+        modules = peek(modules)
         if not any([assignments, announcements, modules]):
             raise ValueError("No content to export")
 
-        workbook = xlsxwriter.Workbook(str(self.output_path))
+        workbook = xlsxwriter.Workbook(
+            self.output_path if is_stream(self.output_path) else str(self.output_path),
+            {
+                'constant_memory': self.constant_memory,
+                'default_date_format': self.DATE_FORMAT,
+            }
+        )
 
         # Define formats (reused across all sheets)
         header_format = workbook.add_format({
@@ -51,84 +167,198 @@ class ExcelWriter:
             'border': 1
         })
 
-        overdue_format = workbook.add_format({
+        overdue_style = {
             'bg_color': '#FFC7CE',
             'font_color': '#9C0006'
-        })
+        }
 
-        upcoming_format = workbook.add_format({
+        upcoming_style = {
             'bg_color': '#FFEB9C',
             'font_color': '#9C6500'
-        })
+        }
 
-        recent_format = workbook.add_format({
+        recent_style = {
             'bg_color': '#E8F5E9',
             'border': 1
-        })
+        }
+
+        overdue_format = workbook.add_format(overdue_style)
+        upcoming_format = workbook.add_format(upcoming_style)
+        recent_format = workbook.add_format(recent_style)
 
         link_format = workbook.add_format({
             'font_color': '#0563C1',
             'underline': True
         })
 
-        # Write assignments sheet if provided
+        # A cell format replaces the row format, so date cells in highlighted
+        # rows need the row colours combined with the date format
+        date_formats = {
+            row_fmt: workbook.add_format({**style, 'num_format': self.DATE_FORMAT})
+            for row_fmt, style in [
+                (overdue_format, overdue_style),
+                (upcoming_format, upcoming_style),
+                (recent_format, recent_style),
+            ]
+        }
+
+        # Per-course sheets are labelled by content type when several are exported
+        labelled = sum(items is not None for items in [assignments, announcements, modules]) > 1
+        used_names = set()
+
+        # Write assignments sheet(s) if provided
         if assignments:
-            worksheet = workbook.add_worksheet("All Assignments")
-            self._write_assignments_sheet(workbook, worksheet, assignments, header_format, overdue_format, upcoming_format, link_format)
+            for name, group in self._sheet_groups(
+                self._with_rows(assignments, rows.get("assignments")), "All Assignments", "Assignments" if labelled else None,
+                used_names, None if presorted else due_date_key
+            ):
+                worksheet = workbook.add_worksheet(name)
+                self._write_assignments_sheet(
+                    workbook, worksheet, group, header_format, overdue_format, upcoming_format, link_format, date_formats
+                )
 
-        # Write announcements sheet if provided
+        # Write announcements sheet(s) if provided
         if announcements:
-            worksheet = workbook.add_worksheet("All Announcements")
-            self._write_announcements_sheet(workbook, worksheet, announcements, header_format, recent_format, link_format)
+            for name, group in self._sheet_groups(
+                self._with_rows(announcements, rows.get("announcements")), "All Announcements", "Announcements" if labelled else None,
+                used_names, None if presorted else posted_date_key
+            ):
+                worksheet = workbook.add_worksheet(name)
+                self._write_announcements_sheet(
+                    workbook, worksheet, group, header_format, recent_format, link_format, date_formats
+                )
 
-        # Write modules sheet if provided
+        # Write modules sheet(s) if provided (never sorted)
         if modules:
-            worksheet = workbook.add_worksheet("All Modules")
-            self._write_modules_sheet(workbook, worksheet, modules, header_format, link_format)
+            for name, group in self._sheet_groups(
+                self._with_rows(modules, rows.get("modules")), "All Modules", "Modules" if labelled else None, used_names
+            ):
+                worksheet = workbook.add_worksheet(name)
+                self._write_modules_sheet(workbook, worksheet, group, header_format, link_format)
 
         workbook.close()
         return self.output_path
 
+    @staticmethod
+    def _with_rows(items: Iterable, rows: Optional[Iterable[dict]]) -> Iterable[Tuple[Any, Optional[dict]]]:
+        """Pair each item with its precomputed row, or None to convert it when written."""
+        if rows is None:
+            return ((item, None) for item in items)
+        return zip(items, rows)
+
+    def _sheet_groups(
+        self,
+        entries: Iterable[Tuple[Any, Optional[dict]]],
+        combined_name: str,
+        label: Optional[str],
+        used_names: set,
+        sort_key: Optional[Callable] = None
+    ) -> Iterator[Tuple[str, Iterable]]:
+        """
+        Split items into worksheets according to the layout.
+
+        The per-course layout groups items by course_id in a single pass,
+        keeping first-seen course order, and sorts each group on its own
+        instead of sorting the full list.
+
+        Args:
+            entries: (model, precomputed row or None) pairs to export
+            combined_name: Sheet name for the combined layout
+            label: Optional content type label appended to per-course names
+            used_names: Names already taken in this workbook (updated)
+            sort_key: Optional sort key; None keeps the input order
+
+        Yields:
+            Tuples of (sheet name, entries for that sheet)
+        """
+        entry_key = None if sort_key is None else (lambda entry: sort_key(entry[0]))
+        if self.layout == "combined":
+            if entry_key is not None:
+                entries = sorted(entries, key=entry_key)
+            used_names.add(combined_name.casefold())
+            yield combined_name, entries
+            return
+
+        groups = {}
+        for entry in entries:
+            groups.setdefault(entry[0].course_id, []).append(entry)
+
+        for course_id, group in groups.items():
+            if entry_key is not None:
+                group.sort(key=entry_key)
+            title = group[0][0].course_name or f"Course {course_id}"
+            yield self._unique_sheet_name(title, label, used_names), group
+
+    def _unique_sheet_name(self, title: str, label: Optional[str], used_names: set) -> str:
+        """
+        Build a valid sheet name that is unique within the workbook.
+
+        Sheet names are compared case-insensitively by Excel, and different
+        course names can collide once truncated to 31 characters, so
+        duplicates get a " (2)", " (3)", ... suffix.
+
+        Args:
+            title: Course name
+            label: Optional content type label (e.g. "Assignments")
+            used_names: Case-folded names already taken (updated)
+
+        Returns:
+            Unique sheet name of at most 31 characters
+        """
+        suffix = f" - {label}" if label else ""
+        base = self._sanitize_sheet_name(title) or "Course"
+        limit = self.MAX_SHEET_NAME_LENGTH - len(suffix)
+        if len(base) > limit:
+            base = base[:limit - 3] + "..."
+
+        name = base + suffix
+        counter = 2
+        while name.casefold() in used_names:
+            tag = f" ({counter})"
+            name = base[:limit - len(tag)] + tag + suffix
+            counter += 1
+
+        used_names.add(name.casefold())
+        return name
+
     def _write_assignments_sheet(
         self,
         workbook,
         worksheet,
-        assignments: List[Assignment],
+        assignments: Iterable[Tuple[Assignment, Optional[dict]]],
         header_format,
         overdue_format,
         upcoming_format,
-        link_format
+        link_format,
+        date_formats
     ):
-        """Write assignments sheet with formatting."""
-        # Convert to DataFrame
-        df = pd.DataFrame([a.to_dict() for a in assignments])
-
-        # Add metadata columns (hidden from export)
-        df['_is_overdue'] = [a.is_overdue for a in assignments]
-        df['_is_upcoming'] = [a.is_upcoming for a in assignments]
-        df['_html_url'] = [a.html_url for a in assignments]
-
-        # Sort by due date (nulls last)
-        df['_sort_key'] = pd.to_datetime(
-            [a.due_at if a.due_at else '9999-12-31' for a in assignments],
-            format='mixed',
-            errors='coerce'
+        """Write assignments sheet (already in export order) with formatting."""
+        def row_format(assignment):
+            # Apply overdue formatting (priority over upcoming)
+            if assignment.is_overdue:
+                return overdue_format
+            if assignment.is_upcoming:
+                return upcoming_format
+            return None
+
+        dynamic = self.highlight == "dynamic"
+
+        # Write header and data rows, Canvas Link in column F
+        row_count, column_count = self._write_rows(
+            worksheet, assignments, header_format, 5, link_format,
+            row_format=None if dynamic else row_format,
+            datetime_columns={2: lambda a: a.due_datetime},
+            number_columns={3: lambda a: a.points_possible},
+            date_formats=date_formats
         )
-        df = df.sort_values('_sort_key').drop('_sort_key', axis=1)
-
-        # Separate metadata columns from visible columns
-        metadata_cols = ['_is_overdue', '_is_upcoming', '_html_url']
-        visible_cols = [col for col in df.columns if col not in metadata_cols]
-        df_visible = df[visible_cols]
-
-        # Write headers with formatting
-        for col_num, value in enumerate(df_visible.columns.values):
-            worksheet.write(0, col_num, value, header_format)
 
-        # Write data rows
-        for row_num, (_, row) in enumerate(df_visible.iterrows(), start=1):
-            for col_num, value in enumerate(row):
-                worksheet.write(row_num, col_num, value)
+        if dynamic:
+            # Due Date is column C
+            now = _utc_now_formula()
+            self._add_highlight_rules(worksheet, row_count, column_count, [
+                (f'AND(ISNUMBER($C2),$C2<{now})', overdue_format),
+                (f'AND(ISNUMBER($C2),$C2>={now})', upcoming_format),
+            ])
 
         # Format columns
         worksheet.set_column('A:A', 30)  # Course
@@ -139,70 +369,42 @@ class ExcelWriter:
         worksheet.set_column('F:F', 50)  # Canvas Link
         worksheet.set_column('G:G', 12)  # Canvas ID
 
-        # Apply conditional formatting
-        for i in range(len(df)):
-            row = df.iloc[i]
-            row_num = i + 1  # Excel rows are 1-indexed, +1 for header
-
-            # Apply overdue formatting (priority over upcoming)
-            if row['_is_overdue']:
-                worksheet.set_row(row_num, None, overdue_format)
-            elif row['_is_upcoming']:
-                worksheet.set_row(row_num, None, upcoming_format)
-
-            # Make Canvas Link clickable
-            if row['_html_url']:
-                worksheet.write_url(
-                    row_num, 5,  # Column F (0-indexed)
-                    row['_html_url'],
-                    link_format,
-                    string="Open in Canvas"
-                )
-
         # Freeze header row
         worksheet.freeze_panes(1, 0)
 
         # Add autofilter
-        worksheet.autofilter(0, 0, len(df), len(df_visible.columns) - 1)
+        worksheet.autofilter(0, 0, row_count, column_count - 1)
 
     def _write_announcements_sheet(
         self,
         workbook,
         worksheet,
-        announcements: List[Announcement],
+        announcements: Iterable[Tuple[Announcement, Optional[dict]]],
         header_format,
         recent_format,
-        link_format
+        link_format,
+        date_formats
     ):
-        """Write announcements sheet with formatting."""
-        # Convert to DataFrame
-        data = []
-        for ann in announcements:
-            ann_dict = ann.to_dict()
-            ann_dict['_is_recent'] = ann.is_recent
-            ann_dict['_html_url'] = ann.html_url
-            data.append(ann_dict)
-
-        df = pd.DataFrame(data)
-
-        # Sort by posted date descending (newest first)
-        df['_sort_key'] = pd.to_datetime(df['Posted Date'], format='mixed', errors='coerce')
-        df = df.sort_values('_sort_key', ascending=False).drop('_sort_key', axis=1)
-
-        # Separate metadata columns from visible columns
-        metadata_cols = ['_is_recent', '_html_url']
-        visible_cols = [col for col in df.columns if col not in metadata_cols]
-        df_visible = df[visible_cols]
-
-        # Write headers with formatting
-        headers = ['Course', 'Title', 'Posted Date', 'Author', 'Message Preview', 'Embedded Links', 'Attachments', 'Canvas Link']
-        for col_num, value in enumerate(headers):
-            worksheet.write(0, col_num, value, header_format)
-
-        # Write data rows
-        for row_num, (_, row) in enumerate(df_visible.iterrows(), start=1):
-            for col_num, value in enumerate(row):
-                worksheet.write(row_num, col_num, value)
+        """Write announcements sheet (already in export order) with formatting."""
+        def row_format(announcement):
+            # Apply recent formatting
+            return recent_format if announcement.is_recent else None
+
+        dynamic = self.highlight == "dynamic"
+
+        # Write header and data rows, Canvas Link in column H
+        row_count, column_count = self._write_rows(
+            worksheet, announcements, header_format, 7, link_format,
+            row_format=None if dynamic else row_format,
+            datetime_columns={2: lambda a: a.posted_datetime},
+            date_formats=date_formats
+        )
+
+        if dynamic:
+            # Posted Date is column C; recent means the last 7 days
+            self._add_highlight_rules(worksheet, row_count, column_count, [
+                (f'AND(ISNUMBER($C2),$C2>{_utc_now_formula()}-7)', recent_format),
+            ])
 
         # Format columns
         worksheet.set_column('A:A', 20)  # Course
@@ -213,65 +415,31 @@ class ExcelWriter:
         worksheet.set_column('F:F', 12)  # Embedded Links
         worksheet.set_column('G:G', 12)  # Attachments
         worksheet.set_column('H:H', 15)  # Canvas Link
-
-        # Apply conditional formatting
-        for i in range(len(df)):
-            row = df.iloc[i]
-            row_num = i + 1  # Excel rows are 1-indexed, +1 for header
-
-            # Apply recent formatting
-            if row['_is_recent']:
-                worksheet.set_row(row_num, None, recent_format)
-
-            # Make Canvas Link clickable
-            if row['_html_url']:
-                worksheet.write_url(
-                    row_num, 7,  # Column H (0-indexed)
-                    row['_html_url'],
-                    link_format,
-                    string="Open in Canvas"
-                )
+        worksheet.set_column('I:I', 12)  # Canvas ID
 
         # Freeze header row
         worksheet.freeze_panes(1, 0)
 
         # Add autofilter
-        worksheet.autofilter(0, 0, len(df), len(headers) - 1)
+        worksheet.autofilter(0, 0, row_count, column_count - 1)
 
     def _write_modules_sheet(
         self,
         workbook,
         worksheet,
-        modules: List[ModuleItem],
+        modules: Iterable[Tuple[ModuleItem, Optional[dict]]],
         header_format,
         link_format
     ):
         """Write modules sheet with formatting."""
-        # Convert to DataFrame
-        data = []
-        for mod in modules:
-            mod_dict = mod.to_dict()
-            mod_dict['_html_url'] = mod.html_url
-            data.append(mod_dict)
-
-        df = pd.DataFrame(data)
-
         # NO sorting - preserve natural API order (module structure)
 
-        # Separate metadata columns from visible columns
-        metadata_cols = ['_html_url']
-        visible_cols = [col for col in df.columns if col not in metadata_cols]
-        df_visible = df[visible_cols]
-
-        # Write headers with formatting
-        headers = ['Course', 'Module', 'Item Title', 'Item Type', 'Published', 'Due Date', 'Points', 'Canvas Link']
-        for col_num, value in enumerate(headers):
-            worksheet.write(0, col_num, value, header_format)
-
-        # Write data rows
-        for row_num, (_, row) in enumerate(df_visible.iterrows(), start=1):
-            for col_num, value in enumerate(row):
-                worksheet.write(row_num, col_num, value)
+        # Write header and data rows, Canvas Link in column H
+        row_count, column_count = self._write_rows(
+            worksheet, modules, header_format, 7, link_format,
+            datetime_columns={5: lambda m: m.due_datetime},
+            number_columns={6: lambda m: m.points_possible}
+        )
 
         # Format columns
         worksheet.set_column('A:A', 20)  # Course
@@ -283,25 +451,136 @@ class ExcelWriter:
         worksheet.set_column('G:G', 8)   # Points
         worksheet.set_column('H:H', 15)  # Canvas Link
 
-        # Apply conditional formatting
-        for i in range(len(df)):
-            row = df.iloc[i]
-            row_num = i + 1  # Excel rows are 1-indexed, +1 for header
-
-            # Make Canvas Link clickable
-            if row['_html_url']:
-                worksheet.write_url(
-                    row_num, 7,  # Column H (0-indexed)
-                    row['_html_url'],
-                    link_format,
-                    string="Open in Canvas"
-                )
-
         # Freeze header row
         worksheet.freeze_panes(1, 0)
 
         # Add autofilter
-        worksheet.autofilter(0, 0, len(df), len(headers) - 1)
+        worksheet.autofilter(0, 0, row_count, column_count - 1)
+
+    def _write_rows(
+        self,
+        worksheet,
+        entries: Iterable[Tuple[Any, Optional[dict]]],
+        header_format,
+        link_col: int,
+        link_format,
+        row_format: Optional[Callable] = None,
+        datetime_columns: Optional[Dict[int, Callable]] = None,
+        number_columns: Optional[Dict[int, Callable]] = None,
+        date_formats: Optional[Dict] = None
+    ) -> Tuple[int, int]:
+        """
+        Stream the header and one row per item, strictly in row order.
+
+        Each row's format is applied with set_row before its cells are
+        written, which keeps the output valid in constant_memory mode.
+        Cells are written left to right, with the link column written as a
+        native hyperlink until ``url_limit`` is reached, then as overflow.
+
+        Args:
+            worksheet: Target worksheet
+            entries: (model, precomputed row or None) pairs in export order
+            header_format: Format for the header row
+            link_col: Column index of the Canvas Link column
+            link_format: Format for hyperlink cells
+            row_format: Optional callable returning a row format (or None) per item
+            datetime_columns: Optional mapping of column index to a callable
+                returning the item's datetime; those cells are written as real
+                dates in UTC (items without a date keep their text value)
+            number_columns: Optional mapping of column index to a callable
+                returning the item's number; those cells are written as
+                numbers (items without one are left blank)
+            date_formats: Optional mapping of row format to the date format
+                used for date cells in rows with that format
+
+        Returns:
+            Tuple of (number of data rows, number of columns)
+        """
+        row_count = 0
+        column_count = 0
+        urls_written = 0
+        to_row = self._to_row
+        for row_num, (item, row) in enumerate(entries, start=1):
+            if row is None:
+                row = to_row(item)
+            if row_num == 1:
+                column_count = len(row)
+                worksheet.write_row(0, 0, list(row.keys()), header_format)
+
+            fmt = row_format(item) if row_format is not None else None
+            if fmt is not None:
+                worksheet.set_row(row_num, None, fmt)
+
+            values = list(row.values())
+            dates = []
+            if datetime_columns:
+                for col, getter in datetime_columns.items():
+                    value = _excel_datetime(getter(item))
+                    if value is not None:
+                        values[col] = value
+                        dates.append(col)
+            if number_columns:
+                for col, getter in number_columns.items():
+                    values[col] = getter(item)
+
+            url = item.html_url
+            if not url:
+                worksheet.write_row(row_num, 0, values)
+            else:
+                worksheet.write_row(row_num, 0, values[:link_col])
+                if urls_written < self.url_limit:
+                    worksheet.write_url(row_num, link_col, url, link_format, string=self.LINK_TEXT)
+                    urls_written += 1
+                else:
+                    self._write_overflow_link(worksheet, row_num, link_col, url, link_format)
+                worksheet.write_row(row_num, link_col + 1, values[link_col + 1:])
+
+            if fmt is not None and date_formats and dates:
+                # Rewrite the row's date cells in the highlighted date format
+                # (same row, so still in order for constant_memory)
+                for col in dates:
+                    worksheet.write_datetime(row_num, col, values[col], date_formats[fmt])
+
+            row_count = row_num
+
+        return row_count, column_count
+
+    @staticmethod
+    def _add_highlight_rules(worksheet, row_count: int, column_count: int, rules: list):
+        """
+        Highlight rows with conditional format formulas covering the whole data range.
+
+        Args:
+            worksheet: Target worksheet
+            row_count: Number of data rows
+            column_count: Number of columns
+            rules: List of (formula relative to row 2, format) tuples, first match wins
+        """
+        cell_range = f"A2:{xl_col_to_name(column_count - 1)}{row_count + 1}"
+        for formula, fmt in rules:
+            worksheet.conditional_format(cell_range, {
+                'type': 'formula',
+                'criteria': f'={formula}',
+                'format': fmt,
+                'stop_if_true': True,
+            })
+
+    def _to_row(self, item) -> dict:
+        """Convert one item to its export row."""
+        return item.to_dict()
+
+    def _write_overflow_link(self, worksheet, row_num: int, col: int, url: str, link_format):
+        """Write a link past the native hyperlink limit as a formula or plain text."""
+        if self.link_overflow == "formula" and len(url) <= self.MAX_FORMULA_URL_LENGTH:
+            escaped = url.replace('"', '""')
+            worksheet.write_formula(
+                row_num, col,
+                f'=HYPERLINK("{escaped}","{self.LINK_TEXT}")',
+                link_format,
+                self.LINK_TEXT
+            )
+        else:
+            worksheet.write_string(row_num, col, url)
 
     @staticmethod
     def _sanitize_sheet_name(name: str) -> str:
@@ -311,13 +590,14 @@ class ExcelWriter:
         Excel sheet names must be:
         - <= 31 characters
         - Cannot contain: \\ / ? * [ ] :
+        - Cannot start or end with an apostrophe
         """
         # Remove invalid characters
         for char in ['\\', '/', '?', '*', '[', ']', ':']:
             name = name.replace(char, ' ')
 
         # Remove multiple spaces and trim
-        name = ' '.join(name.split())
+        name = ' '.join(name.split()).strip("'")
 
         # Truncate to 31 characters
         if len(name) > 31:
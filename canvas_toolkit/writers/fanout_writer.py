@@ -0,0 +1,136 @@
+"""Fan-out export: convert and sort once, write several formats."""
+
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from ..models import Assignment
+from ..models.announcement import Announcement
+from ..models.module import ModuleItem
+from ..utils.sorting import due_date_key, posted_date_key
+from ._streaming import CONTENT_MODELS
+
+CONTENT_TYPES = tuple(CONTENT_MODELS)
+
+# A sink is a multi-content writer (ExcelWriter, JSONWriter, SQLiteWriter) or
+# a (writer, content type) pair for single-type writers (CSVWriter,
+# ParquetWriter), e.g. (CSVWriter("out_assignments.csv"), "assignments")
+Sink = Union[Any, Tuple[Any, str]]
+
+
+class FanOutWriter:
+    """Export the same content to several writers from one materialization."""
+
+    def __init__(self, sinks: Sequence[Sink], max_workers: Optional[int] = None):
+        """
+        Initialize fan-out writer.
+
+        Args:
+            sinks: Writers to feed; single-type writers are given as
+                (writer, content type) pairs
+            max_workers: Threads used to run the sinks concurrently
+                (default: one per sink; 1 writes them one after another)
+
+        Raises:
+            ValueError: If there are no sinks, a content type is unknown, or a
+                single-type writer is given without a content type
+        """
+        if not sinks:
+            raise ValueError("FanOutWriter needs at least one sink")
+
+        self.sinks: List[Tuple[Any, Optional[str]]] = []
+        for sink in sinks:
+            writer, content = sink if isinstance(sink, tuple) else (sink, None)
+            if content is not None and content not in CONTENT_TYPES:
+                raise ValueError(f"content must be one of {CONTENT_TYPES}, got: {content}")
+            if content is None and not self._is_multi_content(writer):
+                raise ValueError(
+                    f"{type(writer).__name__} writes one content type; pass it as ({type(writer).__name__}(...), content)"
+                )
+            self.sinks.append((writer, content))
+        self.max_workers = max_workers
+
+    def write(
+        self,
+        assignments: Optional[Iterable[Assignment]] = None,
+        announcements: Optional[Iterable[Announcement]] = None,
+        modules: Optional[Iterable[ModuleItem]] = None,
+        presorted: bool = False
+    ) -> List[Any]:
+        """
+        Write content to every sink.
+
+        Each input is materialized and sorted once, and each item's export
+        row (``to_dict()``) is computed once and passed to the row-based
+        sinks (Excel, CSV, JSON) through their ``rows`` argument. Sinks then
+        run concurrently, each receiving presorted input.
+
+        Args:
+            assignments: Assignment objects (list or any iterable)
+            announcements: Announcement objects (list or any iterable)
+            modules: ModuleItem objects (list or any iterable)
+            presorted: If True, input is already in export order
+
+        Returns:
+            Each sink's result (path or stream), in sink order
+        """
+        content = {
+            "assignments": list(assignments) if assignments is not None else None,
+            "announcements": list(announcements) if announcements is not None else None,
+            "modules": list(modules) if modules is not None else None,
+        }
+        if not any(content.values()):
+            raise ValueError("No content to export")
+
+        if not presorted:
+            if content["assignments"]:
+                content["assignments"].sort(key=due_date_key)
+            if content["announcements"]:
+                # Sort by posted date (newest first)
+                content["announcements"].sort(key=posted_date_key)
+
+        rows = self._shared_rows(content)
+
+        jobs = [self._job(writer, target, content, rows) for writer, target in self.sinks]
+        if len(jobs) == 1 or self.max_workers == 1:
+            return [job() for job in jobs]
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(jobs)) as pool:
+            futures = [pool.submit(job) for job in jobs]
+            return [future.result() for future in futures]
+
+    def _shared_rows(self, content: Dict[str, Optional[list]]) -> Dict[str, list]:
+        """Convert every item that a row-based sink will write, once."""
+        needed = set()
+        for writer, target in self.sinks:
+            if self._shares_rows(writer):
+                needed.update([target] if target else CONTENT_TYPES)
+
+        # Row lists line up with the (already sorted) item lists
+        return {
+            name: [item.to_dict() for item in content[name]]
+            for name in needed if content[name]
+        }
+
+    @staticmethod
+    def _job(writer, target: Optional[str], content: Dict[str, Optional[list]], rows: Dict[str, list]):
+        """Build a callable that runs one sink on the shared data."""
+        def run():
+            kwargs = {}
+            if FanOutWriter._shares_rows(writer):
+                if target is not None:
+                    kwargs["rows"] = rows.get(target)
+                else:
+                    kwargs["rows"] = {name: rows[name] for name in CONTENT_TYPES if name in rows}
+            if target is not None:
+                return writer.write(content[target], presorted=True, **kwargs)
+            return writer.write(**content, presorted=True, **kwargs)
+        return run
+
+    @staticmethod
+    def _shares_rows(writer) -> bool:
+        """True for writers taking precomputed rows and exporting full rows (no column selection)."""
+        return "rows" in inspect.signature(writer.write).parameters and not getattr(writer, "columns", None)
+
+    @staticmethod
+    def _is_multi_content(writer) -> bool:
+        """True for writers whose write() takes assignments/announcements/modules."""
+        return "assignments" in inspect.signature(writer.write).parameters
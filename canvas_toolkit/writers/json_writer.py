@@ -3,88 +3,235 @@
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Sequence, Union
 from ..models import Assignment
 from ..models.announcement import Announcement
 from ..models.module import ModuleItem
+from ..utils.sorting import due_date_key, posted_date_key
+from ._io import OutputTarget, open_binary, open_text, output_target, resolve_compression, target_suffix
+from ._streaming import check_content_columns, check_shared_rows, peek
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
 
 
 class JSONWriter:
     """Export assignments to JSON file with metadata."""
 
-    def __init__(self, output_path: str = "canvas_assignments.json"):
+    # File extensions that select line-delimited output
+    NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+    # Output buffer size for line-delimited output
+    BUFFER_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        output_path: OutputTarget = "canvas_assignments.json",
+        ndjson: Optional[bool] = None,
+        compression: Optional[str] = "infer",
+        columns: Optional[Dict[str, Sequence[str]]] = None
+    ):
         """
         Initialize JSON writer.
 
         Args:
-            output_path: Path for output JSON file
+            output_path: Path for output JSON file, or a binary stream (e.g.
+                BytesIO) to write UTF-8 JSON into
+            ndjson: If True, write NDJSON / JSON Lines (one record per line)
+                instead of one indented document. None (default) selects
+                NDJSON for .ndjson and .jsonl paths (also when compressed,
+                e.g. .ndjson.gz).
+            compression: "gzip" or "zstd" to compress while writing, None for
+                plain output, or "infer" (default) to choose from a .gz / .zst
+                extension
+            columns: Optional mapping of content type ("assignments",
+                "announcements", "modules") to the EXPORT_COLUMNS to write
+                for it, in output order; other columns are never computed
+
+        Raises:
+            ValueError: If a content type or column in ``columns`` is unknown
         """
-        self.output_path = Path(output_path)
+        self.output_path = output_target(output_path)
+        self.columns = columns
+        self._type_columns = check_content_columns(columns)
+        if ndjson is None:
+            ndjson = target_suffix(self.output_path) in self.NDJSON_SUFFIXES
+        self.ndjson = ndjson
+        self.compression = resolve_compression(self.output_path, compression)
 
     def write(
         self,
-        assignments: Optional[List[Assignment]] = None,
-        announcements: Optional[List[Announcement]] = None,
-        modules: Optional[List[ModuleItem]] = None,
-        include_metadata: bool = True
-    ) -> Path:
+        assignments: Optional[Iterable[Assignment]] = None,
+        announcements: Optional[Iterable[Announcement]] = None,
+        modules: Optional[Iterable[ModuleItem]] = None,
+        include_metadata: bool = True,
+        presorted: bool = False,
+        rows: Optional[Dict[str, Iterable[Dict[str, Any]]]] = None
+    ) -> Union[Path, BinaryIO]:
         """
         Write content to JSON.
 
+        In NDJSON mode the file starts with a metadata line (if requested),
+        followed by one ``{"type": ..., "data": {...}}`` line per record.
+        Records are encoded and written as they are converted; module items
+        and presorted input are never held in memory.
+
         Args:
-            assignments: List of Assignment objects
-            announcements: List of Announcement objects
-            modules: List of ModuleItem objects
+            assignments: Assignment objects (list or any iterable)
+            announcements: Announcement objects (list or any iterable)
+            modules: ModuleItem objects (list or any iterable)
             include_metadata: If True, include export metadata
+            presorted: If True, assignments and announcements are already in
+                export order (e.g. from utils.sorting.external_sort)
+            rows: Optional mapping of content type ("assignments", ...) to
+                export rows (``to_dict()``) already computed for that input,
+                in the same order; requires presorted input and no column
+                selection (FanOutWriter shares rows between sinks)
 
         Returns:
-            Path to created JSON file
+            Path to created JSON file, or the stream it was written to
         """
+        check_shared_rows(rows, presorted, self.columns)
+        rows = rows or {}
+        assignments = peek(assignments)
+        announcements = peek(announcements)
+        modules = peek(modules)
         if not any([assignments, announcements, modules]):
             raise ValueError("No content to export")
 
+        sections = []
+        if assignments:
+            records = rows.get("assignments") or self._assignment_records(assignments, presorted)
+            sections.append(("assignments", "assignment", records))
+        if announcements:
+            records = rows.get("announcements") or self._announcement_records(announcements, presorted)
+            sections.append(("announcements", "announcement", records))
+        if modules:
+            # Maintain original order (module sequence is important)
+            records = rows.get("modules") or map(self._to_row, modules)
+            sections.append(("modules", "module_item", records))
+
+        if self.ndjson:
+            self._write_ndjson(sections, include_metadata)
+            return self.output_path
+
         # Build output structure
         output = {}
 
         if include_metadata:
             output["exported_at"] = datetime.now().isoformat()
 
-        # Add assignments section
-        if assignments:
-            assignments_data = [assignment.to_dict() for assignment in assignments]
-            # Sort by due date (assignments without due dates go to end)
-            assignments_data.sort(
-                key=lambda a: (a.get('Due Date') == 'No due date', a.get('Due Date', ''))
-            )
-            output["assignments"] = {
-                "count": len(assignments),
-                "data": assignments_data
-            }
-
-        # Add announcements section
-        if announcements:
-            announcements_data = [announcement.to_dict() for announcement in announcements]
-            # Sort by posted date (newest first)
-            announcements_data.sort(
-                key=lambda a: a.get('Posted At', ''),
-                reverse=True
-            )
-            output["announcements"] = {
-                "count": len(announcements),
-                "data": announcements_data
-            }
-
-        # Add modules section
-        if modules:
-            modules_data = [module.to_dict() for module in modules]
-            # Maintain original order (module sequence is important)
-            output["modules"] = {
-                "count": len(modules),
-                "data": modules_data
+        for section, _, records in sections:
+            data = list(records)
+            output[section] = {
+                "count": len(data),
+                "data": data
             }
 
         # Write JSON
-        with open(self.output_path, 'w', encoding='utf-8') as f:
+        with open_text(self.output_path, compression=self.compression) as f:
             json.dump(output, f, indent=2, ensure_ascii=False)
 
         return self.output_path
+
+    def write_raw(
+        self,
+        assignments: Optional[Iterable[Dict[str, Any]]] = None,
+        announcements: Optional[Iterable[Dict[str, Any]]] = None,
+        modules: Optional[Iterable[Dict[str, Any]]] = None,
+        include_metadata: bool = True
+    ) -> Union[Path, BinaryIO]:
+        """
+        Stream raw Canvas API records to NDJSON, e.g. for bulk backups.
+
+        Records (such as those from ``CanvasClient.iter_raw``) are written
+        as-is in ``{"type": ..., "data": {...}}`` lines; no models are built,
+        nothing is formatted or sorted. ``models.decoder.decode_raw_export``
+        parses the file back into models.
+
+        Args:
+            assignments: Raw assignment dicts
+            announcements: Raw announcement dicts
+            modules: Raw module dicts (with nested items)
+            include_metadata: If True, start with a metadata line
+
+        Returns:
+            Path to created file, or the stream it was written to
+
+        Raises:
+            ValueError: If the writer is not in NDJSON mode or there is no content
+        """
+        if not self.ndjson:
+            raise ValueError("Raw export requires NDJSON output (a .ndjson/.jsonl path or ndjson=True)")
+
+        sections = [
+            (None, record_type, records)
+            for record_type, records in [
+                ("assignment", peek(assignments)),
+                ("announcement", peek(announcements)),
+                ("module", peek(modules)),
+            ]
+            if records is not None
+        ]
+        if not sections:
+            raise ValueError("No content to export")
+
+        self._write_ndjson(sections, include_metadata, raw=True)
+        return self.output_path
+
+    def _write_ndjson(self, sections: list, include_metadata: bool, raw: bool = False) -> None:
+        """Stream the sections to a line-delimited file."""
+        encode = self._line_encoder()
+
+        with open_binary(self.output_path, buffering=self.BUFFER_SIZE, compression=self.compression) as f:
+            if include_metadata:
+                metadata = {
+                    "type": "metadata",
+                    "exported_at": datetime.now().isoformat(),
+                    "content": [record_type for _, record_type, _ in sections],
+                }
+                if raw:
+                    metadata["raw"] = True
+                f.write(encode(metadata))
+            write = f.write
+            for _, record_type, records in sections:
+                for record in records:
+                    write(encode({"type": record_type, "data": record}))
+
+    @staticmethod
+    def _line_encoder():
+        """Return a function encoding one object as a UTF-8 JSON line."""
+        if orjson is not None:
+            option = orjson.OPT_APPEND_NEWLINE
+
+            def encode(obj: Dict[str, Any]) -> bytes:
+                return orjson.dumps(obj, option=option)
+        else:
+            dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+            def encode(obj: Dict[str, Any]) -> bytes:
+                return (dumps(obj) + '\n').encode('utf-8')
+        return encode
+
+    def _assignment_records(self, assignments: Iterable[Assignment], presorted: bool) -> Iterator[Dict[str, Any]]:
+        """Assignment records in export order."""
+        if not presorted:
+            # Sort by due date (assignments without due dates go to end)
+            assignments = sorted(assignments, key=due_date_key)
+        return map(self._to_row, assignments)
+
+    def _announcement_records(self, announcements: Iterable[Announcement], presorted: bool) -> Iterator[Dict[str, Any]]:
+        """Announcement records in export order."""
+        if not presorted:
+            # Sort by posted date (newest first)
+            announcements = sorted(announcements, key=posted_date_key)
+        return map(self._to_row, announcements)
+
+    def _to_row(self, item) -> Dict[str, Any]:
+        """Convert one item to its export row."""
+        columns = self._type_columns.get(type(item))
+        if columns is None:
+            return item.to_dict()
+        return item.to_dict(columns)
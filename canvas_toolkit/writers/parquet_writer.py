@@ -0,0 +1,170 @@
+"""Columnar export to Parquet or Arrow IPC (requires pyarrow)."""
+
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, List, Optional, Tuple, Union
+from ..models import Assignment
+from ..models.announcement import Announcement
+from ..models.module import ModuleItem
+from ..utils.dates import parse_canvas_datetime
+from ..utils.sorting import export_sort_key
+from ._io import OutputTarget, is_stream, output_target, target_suffix
+from ._streaming import peek
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised when pyarrow is absent
+    pa = None
+
+
+def _columns(model_type: type) -> List[Tuple[str, Any, Callable]]:
+    """Typed (name, Arrow type, getter) column spec for a model type."""
+    timestamp = pa.timestamp("us", tz="UTC")
+    # Embedded links are {"text", "url"} dicts
+    link = pa.struct([("text", pa.string()), ("url", pa.string())])
+    if issubclass(model_type, Assignment):
+        return [
+            ("id", pa.string(), lambda a: a.id),
+            ("course_id", pa.string(), lambda a: a.course_id),
+            ("course_name", pa.string(), lambda a: a.course_name),
+            ("name", pa.string(), lambda a: a.name),
+            ("due_at", timestamp, lambda a: a.due_datetime),
+            ("unlock_at", timestamp, lambda a: parse_canvas_datetime(a.unlock_at)),
+            ("lock_at", timestamp, lambda a: parse_canvas_datetime(a.lock_at)),
+            ("points_possible", pa.float64(), lambda a: a.points_possible),
+            ("submission_types", pa.list_(pa.string()), lambda a: a.submission_types),
+            ("has_submitted_submissions", pa.bool_(), lambda a: a.has_submitted_submissions),
+            ("html_url", pa.string(), lambda a: a.html_url),
+        ]
+    if issubclass(model_type, Announcement):
+        return [
+            ("id", pa.string(), lambda a: a.id),
+            ("course_id", pa.string(), lambda a: a.course_id),
+            ("course_name", pa.string(), lambda a: a.course_name),
+            ("title", pa.string(), lambda a: a.title),
+            ("posted_at", timestamp, lambda a: a.posted_datetime),
+            ("author", pa.string(), lambda a: a.author),
+            ("message_text", pa.string(), lambda a: a.message_text),
+            ("embedded_links", pa.list_(link), lambda a: a.embedded_links),
+            ("attachment_count", pa.int32(), lambda a: len(a.attachments)),
+            ("html_url", pa.string(), lambda a: a.html_url),
+        ]
+    if issubclass(model_type, ModuleItem):
+        return [
+            ("id", pa.string(), lambda m: m.id),
+            ("course_id", pa.string(), lambda m: m.course_id),
+            ("course_name", pa.string(), lambda m: m.course_name),
+            ("module_id", pa.string(), lambda m: m.module_id),
+            ("module_name", pa.string(), lambda m: m.module_name),
+            ("position", pa.int32(), lambda m: m.position),
+            ("title", pa.string(), lambda m: m.title),
+            ("type", pa.string(), lambda m: m.type),
+            ("indent", pa.int32(), lambda m: m.indent),
+            ("published", pa.bool_(), lambda m: m.published),
+            ("due_at", timestamp, lambda m: m.due_datetime),
+            ("points_possible", pa.float64(), lambda m: m.points_possible),
+            ("html_url", pa.string(), lambda m: m.html_url),
+        ]
+    raise TypeError(f"Cannot export {model_type.__name__} to a columnar file")
+
+
+class ParquetWriter:
+    """Export assignments, announcements or module items to Parquet or Arrow IPC."""
+
+    FORMATS = ("parquet", "arrow")
+
+    # File extensions that select Arrow IPC (Feather v2) output
+    ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+    # Rows converted and written per row group / record batch
+    DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        output_path: OutputTarget = "canvas_assignments.parquet",
+        format: Optional[str] = None,
+        compression: Optional[str] = "zstd",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+    ):
+        """
+        Initialize columnar writer.
+
+        Args:
+            output_path: Path for output file, or a binary stream (e.g. BytesIO)
+            format: "parquet" or "arrow" (Arrow IPC file). None (default)
+                selects Arrow for .arrow/.feather/.ipc paths, Parquet otherwise.
+            compression: Codec ("zstd", "snappy", "gzip", "lz4", ... for
+                Parquet; "zstd" or "lz4" for Arrow), or None for uncompressed
+            row_group_size: Rows buffered per row group (Parquet) or record
+                batch (Arrow); bounds memory for large exports
+        """
+        if pa is None:
+            raise ImportError(
+                "ParquetWriter requires pyarrow. Install it with: pip install canvas-toolkit[parquet]"
+            )
+        self.output_path = output_target(output_path)
+        if format is None:
+            format = "arrow" if target_suffix(self.output_path) in self.ARROW_SUFFIXES else "parquet"
+        if format not in self.FORMATS:
+            raise ValueError(f"format must be one of {self.FORMATS}, got {format!r}")
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be a positive integer")
+        self.format = format
+        self.compression = compression
+        self.row_group_size = row_group_size
+
+    def write(self, items: Iterable, presorted: bool = False) -> Union[Path, BinaryIO]:
+        """
+        Write items to a columnar file.
+
+        Columns are typed (UTC timestamps, floats, booleans, string lists)
+        and rows are converted and written one row group at a time, so module
+        items and presorted input are streamed in constant memory.
+
+        Args:
+            items: Iterable of Assignment, Announcement, or ModuleItem objects
+                (all of the same type)
+            presorted: If True, assignments (by due date) and announcements
+                (newest first) are already in export order and are not sorted
+
+        Returns:
+            Path to created file, or the stream it was written to
+        """
+        items = peek(items)
+        if items is None:
+            raise ValueError("No items to export")
+
+        first = next(items)
+        model_type = type(first)
+        items = chain([first], items)
+        if not presorted and not issubclass(model_type, ModuleItem):
+            items = iter(sorted(items, key=export_sort_key))
+
+        columns = _columns(model_type)
+        schema = pa.schema([(name, arrow_type) for name, arrow_type, _ in columns])
+
+        with self._open(schema) as writer:
+            while True:
+                batch = list(islice(items, self.row_group_size))
+                if not batch:
+                    break
+                writer.write_batch(pa.record_batch(
+                    [pa.array([getter(item) for item in batch], type=arrow_type)
+                     for _, arrow_type, getter in columns],
+                    schema=schema
+                ))
+
+        return self.output_path
+
+    def _open(self, schema):
+        """Open the Parquet or Arrow IPC file writer."""
+        sink = self.output_path if is_stream(self.output_path) else str(self.output_path)
+        if self.format == "arrow":
+            options = ipc.IpcWriteOptions(compression=self.compression)
+            return ipc.new_file(sink, schema, options=options)
+        return pq.ParquetWriter(
+            sink, schema,
+            compression=self.compression or "none"
+        )
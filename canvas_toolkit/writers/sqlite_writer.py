@@ -0,0 +1,205 @@
+"""SQLite export store with normalized, upserted tables."""
+
+import sqlite3
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+from ..models import Assignment
+from ..models.announcement import Announcement
+from ..models.module import ModuleItem
+from ..utils.dates import parse_canvas_datetime
+from ._streaming import peek
+
+# Dates are stored as UTC "YYYY-MM-DD HH:MM:SS" text, the format SQLite's own
+# date functions produce, so range queries such as
+#   WHERE due_at BETWEEN datetime('now') AND datetime('now', '+7 days')
+# compare correctly and can use the due date indexes.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS courses (
+    id TEXT PRIMARY KEY,
+    name TEXT
+);
+
+CREATE TABLE IF NOT EXISTS assignments (
+    id TEXT PRIMARY KEY,
+    course_id TEXT NOT NULL REFERENCES courses(id),
+    name TEXT,
+    due_at TEXT,
+    unlock_at TEXT,
+    lock_at TEXT,
+    points_possible REAL,
+    submission_types TEXT,
+    has_submitted_submissions INTEGER,
+    html_url TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_assignments_course ON assignments(course_id);
+CREATE INDEX IF NOT EXISTS idx_assignments_due ON assignments(due_at);
+
+CREATE TABLE IF NOT EXISTS announcements (
+    id TEXT PRIMARY KEY,
+    course_id TEXT NOT NULL REFERENCES courses(id),
+    title TEXT,
+    posted_at TEXT,
+    author TEXT,
+    message_text TEXT,
+    html_url TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_announcements_course ON announcements(course_id);
+CREATE INDEX IF NOT EXISTS idx_announcements_posted ON announcements(posted_at);
+
+CREATE TABLE IF NOT EXISTS module_items (
+    id TEXT PRIMARY KEY,
+    course_id TEXT NOT NULL REFERENCES courses(id),
+    module_id TEXT,
+    module_name TEXT,
+    position INTEGER,
+    title TEXT,
+    type TEXT,
+    indent INTEGER,
+    published INTEGER,
+    due_at TEXT,
+    points_possible REAL,
+    html_url TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_module_items_course ON module_items(course_id);
+CREATE INDEX IF NOT EXISTS idx_module_items_due ON module_items(due_at);
+"""
+
+
+def _sql_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Format a datetime as UTC text for storage (naive values are taken as UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _assignment_row(a: Assignment) -> tuple:
+    return (
+        a.id, a.course_id, a.name,
+        _sql_datetime(a.due_datetime),
+        _sql_datetime(parse_canvas_datetime(a.unlock_at)),
+        _sql_datetime(parse_canvas_datetime(a.lock_at)),
+        a.points_possible,
+        ",".join(a.submission_types) if a.submission_types else None,
+        a.has_submitted_submissions,
+        a.html_url,
+    )
+
+
+def _announcement_row(a: Announcement) -> tuple:
+    return (
+        a.id, a.course_id, a.title,
+        _sql_datetime(a.posted_datetime),
+        a.author, a.message_text, a.html_url,
+    )
+
+
+def _module_item_row(m: ModuleItem) -> tuple:
+    return (
+        m.id, m.course_id, m.module_id, m.module_name, m.position, m.title,
+        m.type, m.indent, m.published,
+        _sql_datetime(m.due_datetime),
+        m.points_possible, m.html_url,
+    )
+
+
+# (table, columns, row builder) for each content type
+_TABLES: List[Tuple[str, Sequence[str], Callable[[Any], tuple]]] = [
+    ("assignments", (
+        "id", "course_id", "name", "due_at", "unlock_at", "lock_at",
+        "points_possible", "submission_types", "has_submitted_submissions", "html_url",
+    ), _assignment_row),
+    ("announcements", (
+        "id", "course_id", "title", "posted_at", "author", "message_text", "html_url",
+    ), _announcement_row),
+    ("module_items", (
+        "id", "course_id", "module_id", "module_name", "position", "title",
+        "type", "indent", "published", "due_at", "points_possible", "html_url",
+    ), _module_item_row),
+]
+
+
+def _upsert_sql(table: str, columns: Sequence[str]) -> str:
+    """INSERT that updates the existing row with the same id."""
+    updates = ", ".join(f"{col} = excluded.{col}" for col in columns if col != "id")
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)}) "
+        f"ON CONFLICT(id) DO UPDATE SET {updates}"
+    )
+
+
+class SQLiteWriter:
+    """Export content into a SQLite database, updating rows in place."""
+
+    # Rows upserted per transaction
+    BATCH_SIZE = 5000
+
+    def __init__(self, output_path: str = "canvas_export.db", batch_size: int = BATCH_SIZE):
+        """
+        Initialize SQLite writer.
+
+        Args:
+            output_path: Path for the database file (created if missing)
+            batch_size: Rows upserted per transaction
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        self.output_path = Path(output_path)
+        self.batch_size = batch_size
+
+    def write(
+        self,
+        assignments: Optional[Iterable[Assignment]] = None,
+        announcements: Optional[Iterable[Announcement]] = None,
+        modules: Optional[Iterable[ModuleItem]] = None,
+        presorted: bool = False
+    ) -> Path:
+        """
+        Upsert content into the database.
+
+        Rows are keyed on Canvas IDs: exporting again updates existing rows
+        and adds new ones, leaving rows from other courses untouched. Courses
+        are stored once in their own table. Input is consumed in batches of
+        ``batch_size`` rows, each written with ``executemany`` in a single
+        transaction.
+
+        Args:
+            assignments: Assignment objects (list or any iterable)
+            announcements: Announcement objects (list or any iterable)
+            modules: ModuleItem objects (list or any iterable)
+            presorted: Accepted for interface parity with the other writers;
+                rows are keyed, so input order does not matter
+
+        Returns:
+            Path to the database file
+        """
+        contents = [peek(assignments), peek(announcements), peek(modules)]
+        if not any(contents):
+            raise ValueError("No content to export")
+
+        conn = sqlite3.connect(str(self.output_path))
+        try:
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.executescript(SCHEMA)
+            course_sql = _upsert_sql("courses", ("id", "name"))
+
+            for items, (table, columns, make_row) in zip(contents, _TABLES):
+                if items is None:
+                    continue
+                sql = _upsert_sql(table, columns)
+                while True:
+                    batch = list(islice(items, self.batch_size))
+                    if not batch:
+                        break
+                    courses = {item.course_id: item.course_name for item in batch}
+                    with conn:
+                        conn.executemany(course_sql, courses.items())
+                        conn.executemany(sql, [make_row(item) for item in batch])
+        finally:
+            conn.close()
+
+        return self.output_path
@@ -0,0 +1,90 @@
+"""Multi-file CSV export streamed into one zip archive."""
+
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Optional, Sequence, Union
+from ..models import Assignment
+from ..models.announcement import Announcement
+from ..models.module import ModuleItem
+from ._io import OutputTarget, is_stream, output_target
+from ._streaming import check_content_columns, peek
+from .csv_writer import CSVWriter
+
+
+class ZipBundleWriter:
+    """Export one CSV per content type into a single zip archive."""
+
+    # Deflate level: CSV exports are repetitive, higher levels gain little
+    COMPRESS_LEVEL = 6
+
+    def __init__(
+        self,
+        output_path: OutputTarget = "canvas_export.zip",
+        prefix: Optional[str] = None,
+        columns: Optional[Dict[str, Sequence[str]]] = None
+    ):
+        """
+        Initialize zip bundle writer.
+
+        Args:
+            output_path: Path for the zip file, or a binary stream (e.g.
+                BytesIO) to write the archive into
+            prefix: File name prefix inside the archive, giving
+                "<prefix>_assignments.csv", ... (default: the zip file's name
+                without extension, or "canvas_export" for streams)
+            columns: Optional mapping of content type ("assignments",
+                "announcements", "modules") to the EXPORT_COLUMNS to write
+                in its CSV
+
+        Raises:
+            ValueError: If a content type or column in ``columns`` is unknown
+        """
+        check_content_columns(columns)
+        self.columns = columns or {}
+        self.output_path = output_target(output_path)
+        if prefix is None:
+            prefix = "canvas_export" if is_stream(self.output_path) else self.output_path.stem
+        self.prefix = prefix
+
+    def write(
+        self,
+        assignments: Optional[Iterable[Assignment]] = None,
+        announcements: Optional[Iterable[Announcement]] = None,
+        modules: Optional[Iterable[ModuleItem]] = None,
+        presorted: bool = False
+    ) -> Union[Path, BinaryIO]:
+        """
+        Write each provided content type as a CSV entry in the archive.
+
+        Rows are written by CSVWriter straight into the compressed zip entry,
+        so no intermediate CSV files or buffers are created.
+
+        Args:
+            assignments: Assignment objects (list or any iterable)
+            announcements: Announcement objects (list or any iterable)
+            modules: ModuleItem objects (list or any iterable)
+            presorted: If True, assignments and announcements are already in
+                export order
+
+        Returns:
+            Path to created zip file, or the stream it was written to
+        """
+        contents = [
+            ("assignments", peek(assignments)),
+            ("announcements", peek(announcements)),
+            ("modules", peek(modules)),
+        ]
+        if not any(items for _, items in contents):
+            raise ValueError("No content to export")
+
+        target = self.output_path if is_stream(self.output_path) else str(self.output_path)
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED, compresslevel=self.COMPRESS_LEVEL) as archive:
+            for content, items in contents:
+                if items is None:
+                    continue
+                # Entry sizes aren't known up front, so allow entries over 2 GiB
+                with archive.open(f"{self.prefix}_{content}.csv", 'w', force_zip64=True) as entry:
+                    writer = CSVWriter(entry, compression=None, columns=self.columns.get(content))
+                    writer.write(items, presorted=presorted)
+
+        return self.output_path
@@ -22,6 +22,11 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.8",
+    entry_points={
+        "console_scripts": [
+            "canvas-toolkit=canvas_toolkit.cli:main",
+        ],
+    },
     install_requires=[
         "requests>=2.31.0",
         "python-dotenv>=1.0.0",
@@ -39,5 +44,15 @@ setup(
         "notion": [
             "notion-client>=2.0.0",
         ],
+        "parquet": [
+            "pyarrow>=12.0.0",
+        ],
+        "zstd": [
+            "zstandard>=0.21.0",
+        ],
+        "fast": [
+            "msgspec>=0.18.0",
+            "orjson>=3.9.0",
+        ],
     },
 )
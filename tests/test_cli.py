@@ -0,0 +1,135 @@
+"""Tests for the command-line interface."""
+
+import csv
+import gzip
+import json
+import subprocess
+import sys
+
+import pytest
+from canvas_toolkit import cli
+from canvas_toolkit.client import CanvasClient
+from canvas_toolkit.client.exceptions import CanvasAPIError
+
+
+RECORDS = {
+    "assignments": [
+        {"id": 2, "name": "Late", "due_at": "2026-03-01T10:00:00Z", "_course_id": "1", "_course_name": "Biology"},
+        {"id": 1, "name": "Early", "due_at": "2026-02-01T10:00:00Z", "_course_id": "1", "_course_name": "Biology"},
+    ],
+    "announcements": [],
+    "modules": [
+        {"id": 7, "name": "Week 1", "_course_id": "1", "_course_name": "Biology",
+         "items": [{"id": 70, "title": "Intro", "type": "Page"}]},
+    ],
+}
+
+
+@pytest.fixture
+def fake_canvas(monkeypatch):
+    """Serve iter_raw from canned records and record the calls."""
+    calls = []
+
+    def iter_raw(self, content, course_ids=None, days_back=30, include_concluded=False):
+        calls.append((content, course_ids, days_back))
+        return iter([dict(record) for record in RECORDS[content]])
+
+    monkeypatch.setattr(CanvasClient, "iter_raw", iter_raw)
+    monkeypatch.setenv("CANVAS_BASE_URL", "https://example.instructure.com")
+    monkeypatch.setenv("CANVAS_API_TOKEN", "token")
+    return calls
+
+
+class TestExport:
+    """Tests for ``canvas-toolkit export``."""
+
+    def test_csv_one_file_per_content(self, fake_canvas, tmp_path, capsys):
+        """Test that CSV writes sorted files per content type and skips empty ones."""
+        output = tmp_path / "export.csv.gz"
+        code = cli.main([
+            "export", "--courses", "1", "--format", "csv", "--output", str(output),
+            "--content", "assignments", "announcements", "modules",
+        ])
+
+        assert code == 0
+        printed = capsys.readouterr()
+        assert printed.out.split() == [
+            str(tmp_path / "export_assignments.csv.gz"),
+            str(tmp_path / "export_modules.csv.gz"),
+        ]
+        assert "No announcements found" in printed.err
+        assert fake_canvas[0] == ("assignments", ["1"], 30)
+
+        with gzip.open(tmp_path / "export_assignments.csv.gz", "rt", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["Assignment"] for row in rows] == ["Early", "Late"]
+
+    def test_raw_ndjson(self, fake_canvas, tmp_path):
+        """Test that --raw writes the API records unchanged."""
+        output = tmp_path / "backup.ndjson"
+        assert cli.main(["export", "--format", "ndjson", "--raw", "--output", str(output)]) == 0
+
+        lines = [json.loads(line) for line in output.read_text().splitlines()]
+        assert lines[0]["raw"] is True
+        assert lines[1] == {"type": "assignment", "data": RECORDS["assignments"][0]}
+
+    @pytest.mark.parametrize("fmt", ["parquet", "sqlite"])
+    def test_full_message_text(self, fake_canvas, monkeypatch, tmp_path, fmt):
+        """Test that formats storing message_text get it untruncated."""
+        message = "x" * 1999
+        monkeypatch.setitem(RECORDS, "announcements", [{
+            "id": 5, "title": "Welcome", "posted_at": "2026-01-01T10:00:00Z",
+            "message": f"<p>{message}</p>", "_course_id": "1", "_course_name": "Biology",
+        }])
+        output = tmp_path / f"out.{fmt}"
+        assert cli.main(["export", "--content", "announcements", "--format", fmt, "--output", str(output)]) == 0
+
+        if fmt == "parquet":
+            pq = pytest.importorskip("pyarrow.parquet")
+            texts = pq.read_table(output).column("message_text").to_pylist()
+        else:
+            import sqlite3
+            with sqlite3.connect(output) as conn:
+                texts = [row[0] for row in conn.execute("SELECT message_text FROM announcements")]
+        assert texts == [message]
+
+    def test_partial_course_fails(self, fake_canvas, monkeypatch, tmp_path, capsys):
+        """Test that a course failing mid-stream makes the export exit non-zero."""
+        def iter_raw(self, content, course_ids=None, days_back=30, include_concluded=False):
+            yield dict(RECORDS["assignments"][0])
+            raise CanvasAPIError("Fetching assignments from Biology failed after 1 records")
+
+        monkeypatch.setattr(CanvasClient, "iter_raw", iter_raw)
+        code = cli.main(["export", "--format", "ndjson", "--raw", "--output", str(tmp_path / "backup.ndjson")])
+
+        assert code == 1
+        assert "failed after 1 records" in capsys.readouterr().err
+
+    def test_raw_requires_ndjson(self, fake_canvas):
+        """Test that --raw is rejected for other formats."""
+        with pytest.raises(SystemExit):
+            cli.main(["export", "--format", "csv", "--raw"])
+
+    def test_missing_credentials(self, monkeypatch):
+        """Test that a missing token is a usage error."""
+        monkeypatch.delenv("CANVAS_API_TOKEN", raising=False)
+        monkeypatch.setenv("CANVAS_BASE_URL", "https://example.instructure.com")
+        with pytest.raises(SystemExit):
+            cli.main(["courses"])
+
+    def test_no_content_fails(self, fake_canvas, tmp_path, capsys):
+        """Test that an export with nothing to write exits with an error."""
+        code = cli.main(["export", "--content", "announcements", "--output", str(tmp_path / "a.csv")])
+
+        assert code == 1
+        assert "No content to export" in capsys.readouterr().err
+
+
+def test_startup_imports_stay_light():
+    """Test that loading the CLI imports neither streamlit nor the clients/writers."""
+    code = (
+        "import sys, canvas_toolkit.cli; "
+        "print(','.join(m for m in ('streamlit', 'pandas', 'requests', 'canvas_toolkit.writers') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
@@ -0,0 +1,94 @@
+"""Tests for schema-driven page decoding."""
+
+import json
+
+import pytest
+from canvas_toolkit.models import Assignment, Announcement
+from canvas_toolkit.models import decoder
+
+
+ASSIGNMENTS_PAGE = [
+    {
+        "id": 1,
+        "name": "Case Write-up",
+        "due_at": "2026-02-15T23:59:00Z",
+        "points_possible": 100,
+        "html_url": "https://example.com/a/1",
+        "submission_types": ["online_upload"],
+        "description": "<p>" + "Long description " * 50 + "</p>",
+        "rubric": [{"id": "r1", "points": 10, "description": "Clarity"}],
+        "has_submitted_submissions": True
+    },
+    {
+        "id": 2,
+        "name": None,
+        "due_at": None,
+        "points_possible": None
+    }
+]
+
+ANNOUNCEMENTS_PAGE = [
+    {
+        "id": 10,
+        "title": "Welcome",
+        "posted_at": "2026-02-10T10:00:00Z",
+        "author": {"display_name": "Professor Smith", "id": 5},
+        "html_url": "https://example.com/d/10",
+        "message": '<p>Hello <a href="https://example.com">class</a></p>',
+        "permissions": {"attach": True},
+        "attachments": []
+    },
+    {
+        "id": 11,
+        "author": None
+    }
+]
+
+
+def _expected(model_cls, page, **kwargs):
+    records = json.loads(json.dumps(page))
+    for record in records:
+        record["_course_id"] = "456"
+        record["_course_name"] = "Test Course"
+    return [model_cls.from_canvas_api(record, **kwargs) for record in records]
+
+
+@pytest.fixture(params=["fast", "fallback"])
+def decoder_mode(request, monkeypatch):
+    """Run each test with and without msgspec."""
+    if request.param == "fast":
+        if not decoder.has_fast_decoder():
+            pytest.skip("msgspec not installed")
+    else:
+        monkeypatch.setattr(decoder, "msgspec", None)
+    return request.param
+
+
+class TestDecoder:
+    """Test suite for decoding pages into models."""
+
+    def test_assignments_match_from_canvas_api(self, decoder_mode):
+        """Test that decoded assignments equal the dict-based path (minus description)."""
+        page = json.dumps(ASSIGNMENTS_PAGE).encode("utf-8")
+        decoded = decoder.decode_assignments(page, "456", "Test Course")
+        expected = _expected(Assignment, ASSIGNMENTS_PAGE)
+
+        assert len(decoded) == 2
+        for got, want in zip(decoded, expected):
+            assert got.to_dict() == want.to_dict()
+            assert got.course is want.course
+        assert decoded[0].has_submitted_submissions is True
+
+    def test_announcements_match_from_canvas_api(self, decoder_mode):
+        """Test that decoded announcements equal the dict-based path."""
+        page = json.dumps(ANNOUNCEMENTS_PAGE).encode("utf-8")
+        decoded = decoder.decode_announcements(page, "456", "Test Course", text_limit=500)
+        expected = _expected(Announcement, ANNOUNCEMENTS_PAGE, text_limit=500)
+
+        assert decoded == expected
+
+    def test_missing_id_raises_value_error(self, decoder_mode):
+        """Test that records without an id are rejected."""
+        page = json.dumps([{"name": "No id"}]).encode("utf-8")
+        with pytest.raises((ValueError, KeyError)):
+            decoder.decode_assignments(page, "456", "Test Course")
@@ -2,6 +2,7 @@
 
 import pytest
 from canvas_toolkit.utils.html_parser import HTMLTextExtractor
+from canvas_toolkit.utils.html_cache import HTMLCache
 
 
 class TestHTMLTextExtractor:
@@ -141,3 +142,83 @@ class TestHTMLTextExtractor:
         assert "café" in result
         assert "naïve" in result
         assert "日本語" in result
+
+    def test_max_chars_truncates_text(self):
+        """Test that a character budget bounds the extracted text."""
+        html = "<p>" + "word " * 1000 + "</p>"
+        result = HTMLTextExtractor.extract(html, max_chars=500)
+        assert len(result) == 500
+        assert result == HTMLTextExtractor.extract(html)[:500]
+
+    def test_max_chars_still_collects_links(self):
+        """Test that links past the text budget are still extracted."""
+        html = "<p>" + "A" * 1000 + '</p><p><a href="https://example.com">late link</a></p>'
+        text, links = HTMLTextExtractor.parse(html, max_chars=100)
+        assert text == "A" * 100
+        assert len(links) == 1
+        assert links[0]["url"] == "https://example.com"
+
+    def test_early_termination_matches_full_parse(self):
+        """Test that chunked early-terminating parsing keeps text intact."""
+        html = "".join(f"<p>Paragraph {i} with   some text</p>" for i in range(2000))
+        full = HTMLTextExtractor.extract(html)
+        assert HTMLTextExtractor.extract(html, max_chars=500) == full[:500]
+
+
+class TestHTMLCache:
+    """Test suite for the HTML parse cache."""
+
+    def setup_method(self):
+        """Install a fresh cache for each test."""
+        self._previous = HTMLTextExtractor.cache
+        HTMLTextExtractor.cache = HTMLCache(maxsize=2)
+
+    def teardown_method(self):
+        """Restore the shared cache."""
+        HTMLTextExtractor.cache = self._previous
+
+    def test_repeated_html_hits_cache(self):
+        """Test that parsing the same HTML twice is served from cache."""
+        html = '<p>Hello <a href="https://example.com">link</a></p>'
+        first = HTMLTextExtractor.parse(html)
+        second = HTMLTextExtractor.parse(html)
+
+        assert first == second
+        info = HTMLTextExtractor.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+    def test_cached_links_are_copies(self):
+        """Test that mutating returned links does not corrupt the cache."""
+        html = '<a href="https://example.com">link</a>'
+        links = HTMLTextExtractor.extract_links(html)
+        links[0]["url"] = "changed"
+        assert HTMLTextExtractor.extract_links(html)[0]["url"] == "https://example.com"
+
+    def test_options_are_part_of_key(self):
+        """Test that different budgets do not share entries."""
+        html = "<p>" + "A" * 100 + "</p>"
+        assert HTMLTextExtractor.extract(html, max_chars=10) == "A" * 10
+        assert HTMLTextExtractor.extract(html) == "A" * 100
+
+    def test_lru_eviction(self):
+        """Test that the oldest entry is evicted when full."""
+        for text in ["<p>one</p>", "<p>two</p>", "<p>three</p>"]:
+            HTMLTextExtractor.extract(text)
+        assert HTMLTextExtractor.cache_info().currsize == 2
+
+    def test_disk_backed_cache(self, tmp_path):
+        """Test that a disk-backed cache serves entries to a new instance."""
+        html = "<p>Persisted</p>"
+        HTMLTextExtractor.cache = HTMLCache(cache_dir=tmp_path)
+        HTMLTextExtractor.extract(html)
+
+        HTMLTextExtractor.cache = HTMLCache(cache_dir=tmp_path)
+        assert HTMLTextExtractor.extract(html) == "Persisted"
+        assert HTMLTextExtractor.cache_info().hits == 1
+
+    def test_cache_disabled(self):
+        """Test that parsing works with caching turned off."""
+        HTMLTextExtractor.cache = None
+        assert HTMLTextExtractor.extract("<p>Hi</p>") == "Hi"
+        assert HTMLTextExtractor.cache_info() is None
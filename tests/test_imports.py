@@ -1,6 +1,15 @@
 #!/usr/bin/env python3
 """Validation test - verify all imports work."""
 
+import subprocess
+import sys
+
+# Import-time budget (microseconds) for CSV/JSON writers; pandas alone is ~450 ms
+WRITER_IMPORT_BUDGET_US = 200_000
+
+HEAVY_MODULES = ("pandas", "xlsxwriter", "pyarrow", "streamlit")
+
+
 def test_imports():
     """Test that all modules can be imported."""
     print("Testing imports...")
@@ -19,5 +28,32 @@ def test_imports():
 
     print("\n[SUCCESS] All imports successful!")
 
+
+def test_csv_json_writers_import_fast():
+    """Test that CSV/JSON writers load lazily, without the Excel/Parquet stack."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from canvas_toolkit.writers import CSVWriter, JSONWriter"],
+        capture_output=True, text=True, check=True
+    )
+
+    # Lines look like "import time:  self | cumulative | <indent>name"
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        entries.append((name.rstrip(), int(cumulative)))
+
+    loaded = {name.strip() for name, _ in entries}
+    assert not loaded & set(HEAVY_MODULES), f"unexpected imports: {loaded & set(HEAVY_MODULES)}"
+
+    # Top-level entries after "site" are the ones triggered by the statement
+    names = [name for name, _ in entries]
+    start = names.index(" site") + 1 if " site" in names else 0
+    elapsed = sum(cumulative for name, cumulative in entries[start:] if not name.startswith("  "))
+    assert elapsed < WRITER_IMPORT_BUDGET_US, f"writer imports took {elapsed / 1000:.0f} ms"
+
+
 if __name__ == "__main__":
     test_imports()
+    test_csv_json_writers_import_fast()
@@ -1,10 +1,16 @@
 """Tests for data models."""
 
+import dataclasses
+
 import pytest
 from datetime import datetime, timedelta
 from canvas_toolkit.models.announcement import Announcement
 from canvas_toolkit.models.module import Module, ModuleItem
 from canvas_toolkit.models import Assignment
+from canvas_toolkit.models.batch import convert_batch
+from canvas_toolkit.models.context import CourseContext
+from canvas_toolkit.utils.html_cache import HTMLCache
+from canvas_toolkit.utils.html_parser import HTMLTextExtractor
 
 
 class TestAnnouncement:
@@ -119,6 +125,20 @@ class TestAnnouncement:
         assert len(announcement.message_preview) == 500
         assert announcement.message_preview == "A" * 500
 
+    def test_text_limit_bounds_message_text(self):
+        """Test that text_limit bounds message text but keeps links."""
+        api_data = {
+            "id": 123,
+            "message": "<p>" + "A" * 2000 + '</p><a href="https://example.com">link</a>',
+            "_course_id": "456",
+            "_course_name": "Test Course"
+        }
+        announcement = Announcement.from_canvas_api(api_data, text_limit=Announcement.PREVIEW_LENGTH)
+
+        assert announcement.message_text == "A" * 500
+        assert announcement.message_preview == "A" * 500
+        assert len(announcement.embedded_links) == 1
+
     def test_html_link_extraction(self):
         """Test extracting embedded links from HTML message."""
         api_data = {
@@ -151,6 +171,7 @@ class TestAnnouncement:
         assert "Title" in export_dict
         assert "Posted Date" in export_dict
         assert export_dict["Course"] == "Test Course"
+        assert tuple(export_dict) == Announcement.EXPORT_COLUMNS
 
 
 class TestModuleItem:
@@ -260,6 +281,7 @@ class TestModuleItem:
         assert "Module" in export_dict
         assert "Item Title" in export_dict
         assert export_dict["Course"] == "Test Course"
+        assert tuple(export_dict) == ModuleItem.EXPORT_COLUMNS
 
 
 class TestModule:
@@ -320,6 +342,56 @@ class TestModule:
         assert len(module.items) == 1
         assert module.items[0].title == "Valid Item"
 
+    def test_items_share_context(self):
+        """Test that items reference one shared module/course descriptor."""
+        api_data = {
+            "id": 456,
+            "name": "Week 1",
+            "_course_id": "123",
+            "items": [
+                {"id": 789, "title": "Reading 1", "type": "Page"},
+                {"id": 790, "title": "Reading 2", "type": "Page"}
+            ]
+        }
+        module = Module.from_canvas_api(api_data, course_name="Test Course")
+        first, second = module.items
+
+        assert first.module is second.module
+        assert first.module.course is CourseContext.get("123", "Test Course")
+        assert first.module_id == "456"
+        assert first.module_name == "Week 1"
+        assert first.course_id == "123"
+        assert first.course_name == "Test Course"
+
+    def test_context_keywords(self):
+        """Test that the string keywords, replace() and assignment resolve to shared contexts."""
+        item = ModuleItem(
+            id="1", module_id="456", module_name="Week 1", course_id="123", course_name="Test Course",
+            position=1, title="Reading", type="Page", html_url="", published=True
+        )
+        assert item.module.course is CourseContext.get("123", "Test Course")
+
+        renamed = dataclasses.replace(item, course_name="Renamed")
+        assert renamed.course_name == "Renamed"
+        assert renamed.module_name == "Week 1"
+        assert item.course_name == "Test Course"
+        assert dataclasses.replace(item, title="Other").module is item.module
+
+        item.module_name = "Week 2"
+        assert item.module.name == "Week 2"
+        assert item.module.course is CourseContext.get("123", "Test Course")
+
+        assignment = Assignment(
+            id="1", name="Essay", course_id="123", course_name="Test Course",
+            due_at=None, points_possible=None, html_url="", submission_types=[]
+        )
+        assert assignment.course is CourseContext.get("123", "Test Course")
+        assignment.course_id = "124"
+        assert assignment.course is CourseContext.get("124", "Test Course")
+
+        with pytest.raises(TypeError):
+            Assignment(id="1", name="Essay", due_at=None, points_possible=None, html_url="", submission_types=[])
+
     def test_empty_items_list(self):
         """Test module with no items."""
         api_data = {
@@ -368,3 +440,120 @@ class TestAssignment:
 
         # Should return the raw string instead of crashing
         assert assignment.due_date_formatted == "not-a-date"
+
+    def test_export_columns_match_to_dict(self):
+        """Test that EXPORT_COLUMNS lists the to_dict keys in order."""
+        assignment = Assignment.from_canvas_api({"id": 1, "_course_id": "456"})
+        assert tuple(assignment.to_dict()) == Assignment.EXPORT_COLUMNS
+
+
+class TestBatchConversion:
+    """Test suite for batch model conversion."""
+
+    @staticmethod
+    def _announcement_records(count):
+        return [
+            {
+                "id": i,
+                "title": f"Announcement {i}",
+                "message": f"<p>Message {i}</p>",
+                "_course_id": "456",
+                "_course_name": "Test Course"
+            }
+            for i in range(count)
+        ]
+
+    def test_small_batch_in_process(self):
+        """Test that small batches convert in order without a pool."""
+        records = self._announcement_records(5)
+        announcements = Announcement.from_canvas_api_batch(records)
+
+        assert [a.id for a in announcements] == [str(i) for i in range(5)]
+        assert announcements[3].message_text == "Message 3"
+
+    def test_parallel_batch_preserves_order(self):
+        """Test that pooled conversion returns models in input order."""
+        records = self._announcement_records(50)
+        announcements = convert_batch(Announcement.from_canvas_api, records, workers=2, min_batch=1)
+
+        assert [a.id for a in announcements] == [str(i) for i in range(50)]
+        assert announcements[49].message_text == "Message 49"
+        # Contexts returned from workers are re-interned in this process
+        assert announcements[0].course is announcements[49].course
+
+    def test_in_process_by_default(self, monkeypatch):
+        """Test that no pool is started unless workers are requested."""
+        import canvas_toolkit.models.batch as batch
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("pool started")
+
+        monkeypatch.setattr(batch, "ProcessPoolExecutor", no_pool)
+        announcements = convert_batch(Announcement.from_canvas_api, self._announcement_records(50), min_batch=1)
+
+        assert len(announcements) == 50
+
+    def test_parallel_batch_fills_parent_cache(self, monkeypatch, tmp_path):
+        """Test that workers use the runtime cache config and report entries back."""
+        cache = HTMLCache(cache_dir=tmp_path)
+        monkeypatch.setattr(HTMLTextExtractor, "cache", cache)
+
+        convert_batch(Announcement.from_canvas_api, self._announcement_records(20), workers=2, min_batch=1)
+
+        assert cache.info().currsize == 20
+        assert len(list(tmp_path.glob("*.json"))) == 20
+        # A repeated export is served from the parent's cache
+        HTMLTextExtractor.parse("<p>Message 7</p>")
+        assert cache.info().hits == 1
+
+
+class TestColumnProjection:
+    """Test suite for to_dict(columns=...)."""
+
+    @staticmethod
+    def _models():
+        assignment = Assignment.from_canvas_api({
+            "id": 1, "name": "Essay", "_course_id": "456", "_course_name": "Test Course",
+            "due_at": "2026-03-01T10:00:00Z", "points_possible": 10,
+            "submission_types": ["online_upload", "online_text_entry"],
+        })
+        announcement = Announcement.from_canvas_api({
+            "id": 2, "title": "Welcome", "_course_id": "456", "_course_name": "Test Course",
+            "posted_at": "2026-01-01T10:00:00Z", "message": "<p>Hello <a href='https://x.org'>x</a></p>",
+        })
+        item = ModuleItem.from_canvas_api(
+            {"id": 3, "title": "Reading", "type": "Page", "indent": 2, "published": False},
+            module_name="Week 1", course_id="456", course_name="Test Course",
+        )
+        return [assignment, announcement, item]
+
+    def test_projection_matches_full_row(self):
+        """Test that every column getter agrees with the full to_dict."""
+        for model in self._models():
+            full = model.to_dict()
+            assert model.to_dict(columns=type(model).EXPORT_COLUMNS) == full
+            assert tuple(model._COLUMN_GETTERS) == type(model).EXPORT_COLUMNS
+
+    def test_projection_order_and_subset(self):
+        """Test that only the requested columns are returned, in order."""
+        assignment = self._models()[0]
+        assert assignment.to_dict(columns=["Due Date", "Course"]) == {
+            "Due Date": "03/01/2026 10:00 AM",
+            "Course": "Test Course",
+        }
+
+    def test_unrequested_fields_not_computed(self, monkeypatch):
+        """Test that derived fields outside the selection are never computed."""
+        def fail(self):
+            raise AssertionError("computed an unrequested column")
+
+        monkeypatch.setattr(Assignment, "submission_types_formatted", property(fail))
+        monkeypatch.setattr(Assignment, "due_date_formatted", property(fail))
+        assert self._models()[0].to_dict(columns=["Course", "Assignment"]) == {
+            "Course": "Test Course", "Assignment": "Essay"
+        }
+
+    def test_unknown_column_rejected(self):
+        """Test that unknown columns raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown ModuleItem column"):
+            self._models()[2].to_dict(columns=["Course", "Grade"])
@@ -0,0 +1,146 @@
+"""Tests for raw passthrough export (client -> NDJSON -> models)."""
+
+import gzip
+import json
+
+import pytest
+from canvas_toolkit.client import CanvasClient
+from canvas_toolkit.client.exceptions import CanvasAPIError
+from canvas_toolkit.models import Assignment, Announcement
+from canvas_toolkit.models.decoder import decode_raw_export
+from canvas_toolkit.models.module import Module
+from canvas_toolkit.writers import JSONWriter
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests.Response page."""
+
+    def __init__(self, records):
+        self._records = records
+
+    def json(self):
+        return self._records
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client whose API calls are served from in-memory pages."""
+    client = CanvasClient("https://example.instructure.com", "token")
+    pages = {
+        "/api/v1/courses/1/assignments": [
+            [{"id": 10, "name": "Essay", "due_at": "2026-03-01T10:00:00Z", "rubric": [{"points": 5}]}],
+            [{"id": 11, "name": "Quiz"}],
+        ],
+        "/api/v1/courses/2/assignments": None,  # fails
+        "/api/v1/courses/1/modules": [
+            [{"id": 7, "name": "Week 1", "items": [{"id": 70, "title": "Intro", "type": "Page"}]}],
+        ],
+        "/api/v1/courses/1/discussion_topics": [
+            [{"id": 5, "title": "Welcome", "posted_at": "2026-01-01T10:00:00Z", "message": "<p>Hi</p>"}],
+        ],
+    }
+    requested = []
+
+    def iter_responses(endpoint, params=None):
+        requested.append((endpoint, params))
+        if pages[endpoint] is None:
+            raise CanvasAPIError("boom")
+        for page in pages[endpoint]:
+            yield FakeResponse(page)
+
+    monkeypatch.setattr(client, "_iter_responses", iter_responses)
+    monkeypatch.setattr(client, "get_courses", lambda include_concluded=False: [
+        {"id": 1, "name": "Biology"}, {"id": 2, "name": "Chemistry"},
+    ])
+    client.requested = requested
+    return client
+
+
+class TestIterRaw:
+    """Tests for CanvasClient.iter_raw."""
+
+    def test_records_enriched_and_untouched(self, client, capsys):
+        """Test that records keep all API fields plus the course fields."""
+        records = list(client.iter_raw("assignments"))
+
+        assert [r["id"] for r in records] == [10, 11]
+        assert records[0]["rubric"] == [{"points": 5}]
+        assert records[0]["_course_id"] == "1"
+        assert records[0]["_course_name"] == "Biology"
+        # Failing course is skipped with a warning
+        assert "Chemistry" in capsys.readouterr().err
+
+    def test_failure_mid_course_raises(self, client, monkeypatch):
+        """Test that a course failing after some records were yielded is not skipped."""
+        iter_responses = client._iter_responses
+
+        def fail_second_page(endpoint, params=None):
+            pages = iter_responses(endpoint, params)
+            yield next(pages)
+            raise CanvasAPIError("page 2 failed")
+
+        monkeypatch.setattr(client, "_iter_responses", fail_second_page)
+        records = client.iter_raw("assignments", course_ids=["1"])
+
+        assert next(records)["id"] == 10
+        with pytest.raises(CanvasAPIError, match="Biology failed after 1 records"):
+            next(records)
+
+    def test_announcement_params(self, client):
+        """Test that announcements use the discussion_topics filter."""
+        list(client.iter_raw("announcements", course_ids=["1"], days_back=7))
+
+        endpoint, params = client.requested[0]
+        assert endpoint == "/api/v1/courses/1/discussion_topics"
+        assert params["only_announcements"] is True
+
+    def test_unknown_content_rejected(self, client):
+        """Test that unsupported content types are rejected."""
+        with pytest.raises(ValueError):
+            next(client.iter_raw("quizzes"))
+
+
+class TestRawRoundTrip:
+    """Tests for JSONWriter.write_raw and decode_raw_export."""
+
+    def test_compressed_round_trip(self, client, tmp_path):
+        """Test raw records stream to .ndjson.gz and parse back into models."""
+        path = JSONWriter(str(tmp_path / "backup.ndjson.gz")).write_raw(
+            assignments=client.iter_raw("assignments", course_ids=["1"]),
+            announcements=client.iter_raw("announcements", course_ids=["1"]),
+            modules=client.iter_raw("modules", course_ids=["1"]),
+        )
+
+        with gzip.open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[0]["type"] == "metadata"
+        assert lines[0]["raw"] is True
+        assert lines[1] == {"type": "assignment", "data": {
+            "id": 10, "name": "Essay", "due_at": "2026-03-01T10:00:00Z",
+            "rubric": [{"points": 5}], "_course_id": "1", "_course_name": "Biology",
+        }}
+
+        with gzip.open(path) as f:
+            models = list(decode_raw_export(f))
+        assert [type(m) for m in models] == [Assignment, Assignment, Announcement, Module]
+        assert models[0].course_name == "Biology"
+        assert models[0].due_date_formatted == "03/01/2026 10:00 AM"
+        assert models[2].message_text == "Hi"
+        assert models[3].items[0].title == "Intro"
+        assert models[3].items[0].course_name == "Biology"
+
+    def test_requires_ndjson(self, tmp_path):
+        """Test that raw export refuses the indented document format."""
+        with pytest.raises(ValueError, match="NDJSON"):
+            JSONWriter(str(tmp_path / "backup.json")).write_raw(assignments=[{"id": 1}])
+
+    def test_empty_rejected(self, tmp_path):
+        """Test that empty input is rejected."""
+        with pytest.raises(ValueError, match="No content to export"):
+            JSONWriter(str(tmp_path / "backup.ndjson")).write_raw(modules=iter([]))
+
+    def test_unknown_record_type(self):
+        """Test that unknown record types are reported with their line."""
+        lines = ['{"type": "metadata"}', "", '{"type": "quiz", "data": {}}']
+        with pytest.raises(ValueError, match="line 3"):
+            list(decode_raw_export(lines))
@@ -0,0 +1,158 @@
+"""Tests for export ordering and external sorting."""
+
+import csv
+import json
+import random
+
+import pytest
+from canvas_toolkit.models import Assignment, Announcement, ModuleItem
+from canvas_toolkit.utils import sorting
+from canvas_toolkit.utils.sorting import export_sort_key, external_sort
+from canvas_toolkit.writers import CSVWriter, JSONWriter
+
+
+def make_assignment(assignment_id, due_at=None):
+    """Build an Assignment through the API conversion path."""
+    return Assignment.from_canvas_api({
+        "id": assignment_id,
+        "name": f"Assignment {assignment_id}",
+        "_course_id": "456",
+        "_course_name": "Test Course",
+        "due_at": due_at,
+        "html_url": f"https://example.com/assignments/{assignment_id}",
+    })
+
+
+def make_announcement(announcement_id, posted_at=None):
+    """Build an Announcement through the API conversion path."""
+    return Announcement.from_canvas_api({
+        "id": announcement_id,
+        "title": f"Announcement {announcement_id}",
+        "_course_id": "456",
+        "_course_name": "Test Course",
+        "posted_at": posted_at,
+        "message": "<p>Hello</p>",
+    })
+
+
+def random_assignments(count, seed=0):
+    """Assignments with shuffled (and some missing or duplicate) due dates."""
+    rng = random.Random(seed)
+    assignments = []
+    for i in range(count):
+        day = rng.randint(1, 28)
+        due_at = None if i % 7 == 0 else f"2026-02-{day:02d}T23:59:00Z"
+        assignments.append(make_assignment(str(i), due_at))
+    return assignments
+
+
+class TestExportSortKey:
+    """Tests for export_sort_key."""
+
+    def test_assignments_due_ascending_missing_last(self):
+        items = [
+            make_assignment("1", None),
+            make_assignment("2", "2026-03-01T12:00:00Z"),
+            make_assignment("3", "not a date"),
+            make_assignment("4", "2026-02-01T12:00:00+05:00"),
+        ]
+        ordered = [a.id for a in sorted(items, key=export_sort_key)]
+        assert ordered == ["4", "2", "1", "3"]
+
+    def test_announcements_newest_first_missing_last(self):
+        items = [
+            make_announcement("1", "2026-01-01T00:00:00Z"),
+            make_announcement("2", None),
+            make_announcement("3", "2026-02-01T00:00:00Z"),
+        ]
+        ordered = [a.id for a in sorted(items, key=export_sort_key)]
+        assert ordered == ["3", "1", "2"]
+
+    def test_module_items_have_no_sort_order(self):
+        item = ModuleItem.from_canvas_api({"id": "1", "title": "Page"})
+        with pytest.raises(TypeError):
+            export_sort_key(item)
+
+
+class TestExternalSort:
+    """Tests for external_sort."""
+
+    def test_matches_in_memory_sort_across_spilled_runs(self):
+        assignments = random_assignments(100)
+        expected = [a.id for a in sorted(assignments, key=export_sort_key)]
+
+        result = [a.id for a in external_sort(iter(assignments), run_size=7)]
+
+        assert result == expected
+
+    def test_single_run_does_not_spill(self, tmp_path):
+        assignments = random_assignments(20)
+
+        result = list(external_sort(assignments, run_size=100, temp_dir=str(tmp_path)))
+
+        assert [a.id for a in result] == [a.id for a in sorted(assignments, key=export_sort_key)]
+        assert result[0] in assignments
+
+    def test_custom_key(self):
+        assert list(external_sort([5, 3, 9, 1, 7], key=lambda x: -x, run_size=2)) == [9, 7, 5, 3, 1]
+
+    def test_empty_input(self):
+        assert list(external_sort([], run_size=2)) == []
+
+    def test_invalid_run_size(self):
+        with pytest.raises(ValueError):
+            list(external_sort([1], run_size=0))
+        with pytest.raises(ValueError):
+            list(external_sort([1], run_bytes=0))
+
+    def test_runs_bounded_by_size(self, monkeypatch):
+        spilled = []
+        spill_run = sorting._spill_run
+
+        def record_spill(buffer, temp_dir):
+            spilled.append(len(buffer))
+            return spill_run(buffer, temp_dir)
+
+        monkeypatch.setattr(sorting, "_spill_run", record_spill)
+        announcements = [
+            Announcement.from_canvas_api({
+                "id": str(i), "posted_at": f"2026-02-{i + 1:02d}T08:00:00Z", "message": "x" * 10_000,
+            })
+            for i in range(10)
+        ]
+
+        result = [a.id for a in external_sort(iter(announcements), run_bytes=50_000)]
+
+        assert result == [str(i) for i in reversed(range(10))]
+        # Each announcement counts its HTML and text (~21 KB), so runs hold 3 of them
+        assert spilled == [3, 3, 3]
+
+    def test_feeds_presorted_csv(self, tmp_path):
+        assignments = random_assignments(50, seed=1)
+        sorted_path = tmp_path / "sorted.csv"
+        external_path = tmp_path / "external.csv"
+
+        CSVWriter(str(sorted_path)).write(assignments)
+        CSVWriter(str(external_path)).write(external_sort(iter(assignments), run_size=8), presorted=True)
+
+        with open(sorted_path, newline="", encoding="utf-8") as f:
+            sorted_rows = [row["Canvas ID"] for row in csv.DictReader(f)]
+        with open(external_path, newline="", encoding="utf-8") as f:
+            external_rows = [row["Canvas ID"] for row in csv.DictReader(f)]
+        assert external_rows == sorted_rows
+
+    def test_feeds_presorted_json(self, tmp_path):
+        announcements = [
+            make_announcement(str(i), f"2026-02-{i + 1:02d}T08:00:00Z") for i in range(10)
+        ]
+        path = tmp_path / "out.json"
+
+        JSONWriter(str(path)).write(
+            announcements=external_sort(iter(announcements), run_size=3),
+            presorted=True,
+        )
+
+        with open(path, encoding="utf-8") as f:
+            output = json.load(f)
+        assert output["announcements"]["count"] == 10
+        assert [a["Canvas ID"] for a in output["announcements"]["data"]] == [str(i) for i in range(9, -1, -1)]
@@ -0,0 +1,853 @@
+"""Tests for export writers."""
+
+from datetime import datetime, timedelta, timezone
+
+import csv
+import zipfile
+import gzip
+import io
+import json
+import sqlite3
+
+import pytest
+from canvas_toolkit.models import Assignment, Announcement, ModuleItem
+from canvas_toolkit.writers import (
+    ExcelWriter, CSVWriter, JSONWriter, ParquetWriter, SQLiteWriter, FanOutWriter, ZipBundleWriter
+)
+from canvas_toolkit.writers import excel_writer, json_writer
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+def make_assignment(assignment_id, due_at=None, course_id="456", course_name="Test Course"):
+    """Build an Assignment through the API conversion path."""
+    return Assignment.from_canvas_api({
+        "id": assignment_id,
+        "name": f"Assignment {assignment_id}",
+        "_course_id": course_id,
+        "_course_name": course_name,
+        "due_at": due_at,
+        "points_possible": 10,
+        "html_url": f"https://example.com/assignments/{assignment_id}",
+        "submission_types": ["online_upload"],
+    })
+
+
+def make_announcement(announcement_id, posted_at=None, course_id="456", course_name="Test Course"):
+    """Build an Announcement through the API conversion path."""
+    return Announcement.from_canvas_api({
+        "id": announcement_id,
+        "title": f"Announcement {announcement_id}",
+        "_course_id": course_id,
+        "_course_name": course_name,
+        "posted_at": posted_at,
+        "html_url": f"https://example.com/announcements/{announcement_id}",
+        "message": '<p>Hello, see <a href="https://example.com/syllabus">the syllabus</a></p>',
+    })
+
+
+def make_module_item(item_id, course_id="456", course_name="Test Course"):
+    """Build a ModuleItem through the API conversion path."""
+    return ModuleItem.from_canvas_api(
+        {
+            "id": item_id,
+            "title": f"Item {item_id}",
+            "type": "Page",
+            "html_url": f"https://example.com/items/{item_id}",
+        },
+        module_name="Week 1",
+        course_id=course_id,
+        course_name=course_name,
+    )
+
+
+def iso(days):
+    """Return an ISO timestamp `days` from now (UTC)."""
+    return (datetime.now(timezone.utc) + timedelta(days=days)).isoformat().replace("+00:00", "Z")
+
+
+class TestExcelWriter:
+    """Test suite for ExcelWriter."""
+
+    def test_assignments_sorted_by_due_date(self, tmp_path):
+        """Test that assignments are sorted by due date with missing dates last."""
+        assignments = [
+            make_assignment(1, None),
+            make_assignment(2, "2026-03-01T10:00:00Z"),
+            make_assignment(3, "2025-12-01T10:00:00Z"),
+        ]
+        path = ExcelWriter(str(tmp_path / "out.xlsx")).write(assignments=assignments)
+
+        sheet = openpyxl.load_workbook(path)["All Assignments"]
+        assert [c.value for c in sheet[1]][:3] == ["Course", "Assignment", "Due Date"]
+        assert [sheet.cell(row=r, column=7).value for r in (2, 3, 4)] == ["3", "2", "1"]
+
+    def test_links_and_row_formats(self, tmp_path):
+        """Test that Canvas links are clickable and overdue rows are highlighted."""
+        assignments = [make_assignment(1, iso(-2)), make_assignment(2, iso(2))]
+        path = ExcelWriter(str(tmp_path / "out.xlsx")).write(assignments=assignments)
+
+        sheet = openpyxl.load_workbook(path)["All Assignments"]
+        link_cell = sheet.cell(row=2, column=6)
+        assert link_cell.value == "Open in Canvas"
+        assert link_cell.hyperlink.target == "https://example.com/assignments/1"
+        assert sheet.cell(row=2, column=1).fill.fgColor.rgb.endswith("FFC7CE")
+        assert sheet.cell(row=3, column=1).fill.fgColor.rgb.endswith("FFEB9C")
+
+    def test_native_date_and_number_cells(self, tmp_path):
+        """Test that dates and points are typed cells that keep the row highlight."""
+        assignments = [make_assignment(1, iso(-2)), make_assignment(2, None)]
+        assignments[1].points_possible = None
+        path = ExcelWriter(str(tmp_path / "out.xlsx")).write(
+            assignments=assignments, modules=[make_module_item(1)]
+        )
+
+        workbook = openpyxl.load_workbook(path)
+        sheet = workbook["All Assignments"]
+        due_cell = sheet.cell(row=2, column=3)
+        assert isinstance(due_cell.value, datetime)
+        assert due_cell.number_format == ExcelWriter.DATE_FORMAT
+        assert due_cell.fill.fgColor.rgb.endswith("FFC7CE")
+        assert sheet.cell(row=2, column=4).value == 10
+        assert sheet.cell(row=3, column=3).value == "No due date"
+        assert sheet.cell(row=3, column=4).value is None
+        # Module items without points are blank rather than "N/A"
+        assert workbook["All Modules"].cell(row=2, column=7).value is None
+
+    def test_dates_match_formatted_dates(self, tmp_path, monkeypatch):
+        """Test that both highlight modes write UTC dates and dynamic rules shift NOW()."""
+        import time
+        if not hasattr(time, "tzset"):
+            pytest.skip("needs time.tzset")
+
+        assignment = make_assignment(1, "2026-02-15T04:59:00Z")
+        item = make_module_item(1)
+        item.due_at = "2026-02-15T04:59:00Z"
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            static = ExcelWriter(str(tmp_path / "static.xlsx")).write(assignments=[assignment])
+            dynamic = ExcelWriter(str(tmp_path / "dynamic.xlsx"), highlight="dynamic").write(
+                assignments=[assignment], modules=[item]
+            )
+            offset = -int(datetime.now().astimezone().utcoffset().total_seconds() // 60)
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert assignment.due_date_formatted == "02/15/2026 04:59 AM"
+        expected = datetime(2026, 2, 15, 4, 59)
+        assert openpyxl.load_workbook(static)["All Assignments"]["C2"].value == expected
+        workbook = openpyxl.load_workbook(dynamic)
+        assert workbook["All Assignments"]["C2"].value == expected
+        assert workbook["All Modules"]["F2"].value == expected
+        rule = list(workbook["All Assignments"].conditional_formatting)[0].rules[0]
+        assert rule.formula[0] == f"AND(ISNUMBER($C2),$C2<(NOW()+{offset}/1440))"
+
+    def test_announcements_newest_first(self, tmp_path):
+        """Test that announcements are sorted newest first."""
+        announcements = [
+            make_announcement(1, "2026-01-01T10:00:00Z"),
+            make_announcement(2, None),
+            make_announcement(3, "2026-02-01T10:00:00Z"),
+        ]
+        path = ExcelWriter(str(tmp_path / "out.xlsx")).write(announcements=announcements)
+
+        sheet = openpyxl.load_workbook(path)["All Announcements"]
+        assert sheet.cell(row=1, column=9).value == "Canvas ID"
+        assert [sheet.cell(row=r, column=9).value for r in (2, 3, 4)] == ["3", "1", "2"]
+
+    def test_modules_keep_order(self, tmp_path):
+        """Test that module items keep their API order."""
+        items = [make_module_item(i) for i in (3, 1, 2)]
+        path = ExcelWriter(str(tmp_path / "out.xlsx")).write(modules=items)
+
+        sheet = openpyxl.load_workbook(path)["All Modules"]
+        assert [sheet.cell(row=r, column=3).value for r in (2, 3, 4)] == ["Item 3", "Item 1", "Item 2"]
+
+    def test_no_content_rejected(self, tmp_path):
+        """Test that an empty export is rejected."""
+        with pytest.raises(ValueError, match="No content to export"):
+            ExcelWriter(str(tmp_path / "out.xlsx")).write()
+
+    def test_empty_iterator_rejected(self, tmp_path):
+        """Test that empty iterators count as no content."""
+        with pytest.raises(ValueError, match="No content to export"):
+            ExcelWriter(str(tmp_path / "out.xlsx")).write(modules=iter([]))
+
+    def test_constant_memory_streams_iterators(self, tmp_path):
+        """Test constant_memory mode with generator input keeps formatting and links."""
+        assignments = (make_assignment(i, iso(i - 2)) for i in range(4))
+        modules = (make_module_item(i) for i in range(3))
+        writer = ExcelWriter(str(tmp_path / "out.xlsx"), constant_memory=True)
+        path = writer.write(assignments=assignments, modules=modules, presorted=True)
+
+        workbook = openpyxl.load_workbook(path)
+        sheet = workbook["All Assignments"]
+        assert [sheet.cell(row=r, column=7).value for r in range(2, 6)] == ["0", "1", "2", "3"]
+        assert sheet.cell(row=2, column=1).fill.fgColor.rgb.endswith("FFC7CE")
+        assert sheet.cell(row=5, column=1).fill.fgColor.rgb.endswith("FFEB9C")
+        assert sheet.cell(row=2, column=6).hyperlink.target == "https://example.com/assignments/0"
+        assert sheet.auto_filter.ref == "A1:G5"
+        assert workbook["All Modules"].max_row == 4
+
+    def test_dynamic_highlight_uses_conditional_formats(self, tmp_path):
+        """Test that dynamic mode writes date cells and range-wide formula rules."""
+        assignments = [make_assignment(1, iso(-2)), make_assignment(2, iso(2)), make_assignment(3, None)]
+        writer = ExcelWriter(str(tmp_path / "out.xlsx"), highlight="dynamic")
+        path = writer.write(assignments=assignments)
+
+        sheet = openpyxl.load_workbook(path)["All Assignments"]
+        assert isinstance(sheet.cell(row=2, column=3).value, datetime)
+        assert sheet.cell(row=4, column=3).value == "No due date"
+        # No per-row fills; highlighting comes from the rules
+        assert sheet.cell(row=2, column=1).fill.fgColor.rgb == "00000000"
+
+        ranges = list(sheet.conditional_formatting)
+        assert [str(cf.sqref) for cf in ranges] == ["A2:G4"]
+        formulas = [rule.formula[0] for rule in ranges[0].rules]
+        now = excel_writer._utc_now_formula()
+        assert formulas == [f"AND(ISNUMBER($C2),$C2<{now})", f"AND(ISNUMBER($C2),$C2>={now})"]
+
+    def test_invalid_highlight_mode_rejected(self, tmp_path):
+        """Test that unknown highlight modes are rejected."""
+        with pytest.raises(ValueError, match="highlight must be one of"):
+            ExcelWriter(str(tmp_path / "out.xlsx"), highlight="sometimes")
+
+    def test_links_past_limit_use_formulas(self, tmp_path):
+        """Test that links beyond url_limit become HYPERLINK formulas."""
+        items = [make_module_item(i) for i in range(3)]
+        writer = ExcelWriter(str(tmp_path / "out.xlsx"), url_limit=1)
+        path = writer.write(modules=items)
+
+        sheet = openpyxl.load_workbook(path)["All Modules"]
+        assert sheet.cell(row=2, column=8).hyperlink.target == "https://example.com/items/0"
+        assert sheet.cell(row=3, column=8).value == '=HYPERLINK("https://example.com/items/1","Open in Canvas")'
+        assert sheet.cell(row=4, column=8).hyperlink is None
+
+    def test_links_past_limit_as_text(self, tmp_path):
+        """Test that links beyond url_limit can be written as plain URLs."""
+        items = [make_module_item(i) for i in range(2)]
+        writer = ExcelWriter(str(tmp_path / "out.xlsx"), url_limit=0, link_overflow="text")
+        path = writer.write(modules=items)
+
+        sheet = openpyxl.load_workbook(path)["All Modules"]
+        assert sheet.cell(row=2, column=8).value == "https://example.com/items/0"
+        assert sheet.cell(row=3, column=8).value == "https://example.com/items/1"
+
+    def test_per_course_layout(self, tmp_path):
+        """Test one sheet per course, each sorted on its own."""
+        assignments = [
+            make_assignment(1, "2026-03-01T10:00:00Z", course_id="1", course_name="Finance"),
+            make_assignment(2, "2026-02-01T10:00:00Z", course_id="2", course_name="Marketing"),
+            make_assignment(3, "2026-01-01T10:00:00Z", course_id="1", course_name="Finance"),
+        ]
+        writer = ExcelWriter(str(tmp_path / "out.xlsx"), layout="per_course")
+        path = writer.write(assignments=assignments)
+
+        workbook = openpyxl.load_workbook(path)
+        assert workbook.sheetnames == ["Finance", "Marketing"]
+        finance = workbook["Finance"]
+        assert [finance.cell(row=r, column=7).value for r in (2, 3)] == ["3", "1"]
+        assert finance.auto_filter.ref == "A1:G3"
+
+    def test_per_course_names_unique_after_truncation(self, tmp_path):
+        """Test that long course names colliding after truncation get suffixes."""
+        long_name = "Strategic Management and Competitive Advantage"
+        assignments = [
+            make_assignment(1, course_id="1", course_name=long_name + " Section 1"),
+            make_assignment(2, course_id="2", course_name=long_name + " Section 2"),
+        ]
+        modules = [make_module_item(1, course_id="1", course_name="Finance: Intro [A]")]
+        writer = ExcelWriter(str(tmp_path / "out.xlsx"), layout="per_course")
+        path = writer.write(assignments=assignments, modules=modules)
+
+        names = openpyxl.load_workbook(path).sheetnames
+        assert len(set(n.casefold() for n in names)) == 3
+        assert all(len(n) <= 31 for n in names)
+        assert names[0].endswith(" - Assignments")
+        assert names[1].endswith("(2) - Assignments")
+        assert names[2] == "Finance Intro A - Modules"
+
+
+class TestCSVWriter:
+    """Test suite for CSVWriter."""
+
+    @staticmethod
+    def _read(path):
+        with open(path, newline='', encoding='utf-8') as f:
+            return list(csv.reader(f))
+
+    def test_assignments_sorted_with_model_headers(self, tmp_path):
+        """Test headers come from the model and rows are sorted by due date."""
+        assignments = [
+            make_assignment(1, None),
+            make_assignment(2, "2026-03-01T10:00:00Z"),
+            make_assignment(3, "2025-12-01T10:00:00Z"),
+        ]
+        path = CSVWriter(str(tmp_path / "out.csv")).write(assignments)
+
+        rows = self._read(path)
+        assert tuple(rows[0]) == Assignment.EXPORT_COLUMNS
+        assert [row[-1] for row in rows[1:]] == ["3", "2", "1"]
+
+    def test_streams_generator_in_order(self, tmp_path):
+        """Test that generators of module items are written in input order."""
+        items = (make_module_item(i) for i in (2, 0, 1))
+        path = CSVWriter(str(tmp_path / "out.csv")).write(items)
+
+        rows = self._read(path)
+        assert [row[2] for row in rows[1:]] == ["Item 2", "Item 0", "Item 1"]
+
+    def test_presorted_input_not_resorted(self, tmp_path):
+        """Test that presorted input keeps its order."""
+        announcements = iter([
+            make_announcement(1, "2026-01-01T10:00:00Z"),
+            make_announcement(2, "2026-02-01T10:00:00Z"),
+        ])
+        path = CSVWriter(str(tmp_path / "out.csv")).write(announcements, presorted=True)
+
+        assert [row[-1] for row in self._read(path)[1:]] == ["1", "2"]
+
+    def test_each_item_converted_once(self, tmp_path, monkeypatch):
+        """Test that to_dict is called exactly once per item."""
+        calls = []
+        original = Assignment.to_dict
+        monkeypatch.setattr(Assignment, "to_dict", lambda self: calls.append(self.id) or original(self))
+
+        CSVWriter(str(tmp_path / "out.csv")).write([make_assignment(i) for i in range(3)])
+        assert sorted(calls) == ["0", "1", "2"]
+
+    def test_empty_rejected(self, tmp_path):
+        """Test that empty input is rejected."""
+        with pytest.raises(ValueError, match="No items to export"):
+            CSVWriter(str(tmp_path / "out.csv")).write(iter([]))
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder_mode(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param == "orjson":
+        if json_writer.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_writer, "orjson", None)
+    return request.param
+
+
+class TestJSONWriter:
+    """Test suite for JSONWriter."""
+
+    @staticmethod
+    def _read_lines(path):
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_document_sections(self, tmp_path):
+        """Test that the default mode writes one document with counts."""
+        path = JSONWriter(str(tmp_path / "out.json")).write(
+            assignments=[make_assignment(1)],
+            modules=iter([make_module_item(1), make_module_item(2)]),
+        )
+
+        with open(path, encoding='utf-8') as f:
+            output = json.load(f)
+        assert "exported_at" in output
+        assert output["assignments"]["count"] == 1
+        assert output["modules"]["count"] == 2
+        assert "announcements" not in output
+
+    @pytest.mark.parametrize("suffix", [".ndjson", ".jsonl", ".JSONL"])
+    def test_ndjson_inferred_from_extension(self, tmp_path, suffix):
+        """Test that line-delimited extensions select NDJSON."""
+        assert JSONWriter(str(tmp_path / f"out{suffix}")).ndjson
+        assert not JSONWriter(str(tmp_path / "out.json")).ndjson
+        assert JSONWriter(str(tmp_path / "out.json"), ndjson=True).ndjson
+
+    def test_ndjson_lines(self, tmp_path, encoder_mode):
+        """Test the metadata line and tagged record lines."""
+        path = JSONWriter(str(tmp_path / "out.ndjson")).write(
+            assignments=[make_assignment(1, "2026-03-01T10:00:00Z"), make_assignment(2, None)],
+            announcements=[make_announcement(3, "2026-02-01T10:00:00Z")],
+            modules=(make_module_item(i) for i in (5, 4)),
+        )
+
+        lines = self._read_lines(path)
+        assert lines[0]["type"] == "metadata"
+        assert lines[0]["content"] == ["assignment", "announcement", "module_item"]
+        assert [line["type"] for line in lines[1:]] == [
+            "assignment", "assignment", "announcement", "module_item", "module_item"
+        ]
+        assert lines[1]["data"] == make_assignment(1, "2026-03-01T10:00:00Z").to_dict()
+        assert [line["data"]["Item Title"] for line in lines[4:]] == ["Item 5", "Item 4"]
+
+    def test_ndjson_without_metadata(self, tmp_path, encoder_mode):
+        """Test that include_metadata=False omits the header line."""
+        path = JSONWriter(str(tmp_path / "out.jsonl")).write(
+            modules=[make_module_item(1)], include_metadata=False
+        )
+
+        lines = self._read_lines(path)
+        assert len(lines) == 1
+        assert lines[0]["type"] == "module_item"
+
+    def test_ndjson_keeps_unicode(self, tmp_path, encoder_mode):
+        """Test that non-ASCII text is written as UTF-8."""
+        item = make_module_item(1, course_name="Économie")
+        path = JSONWriter(str(tmp_path / "out.ndjson")).write(modules=[item], include_metadata=False)
+
+        assert "Économie" in path.read_text(encoding='utf-8')
+
+    def test_empty_rejected(self, tmp_path):
+        """Test that empty input is rejected."""
+        with pytest.raises(ValueError, match="No content to export"):
+            JSONWriter(str(tmp_path / "out.ndjson")).write(assignments=iter([]))
+
+    def test_sorted_chronologically_across_years(self, tmp_path):
+        """Test that sorting uses timestamps, not formatted date strings."""
+        assignments = [
+            make_assignment(1, "2026-01-15T10:00:00Z"),
+            make_assignment(2, None),
+            make_assignment(3, "2025-12-15T10:00:00Z"),
+        ]
+        announcements = [
+            make_announcement(4, "2025-12-15T10:00:00Z"),
+            make_announcement(5, "2026-01-15T10:00:00Z"),
+            make_announcement(6, None),
+        ]
+        path = JSONWriter(str(tmp_path / "out.json")).write(
+            assignments=assignments, announcements=announcements
+        )
+
+        with open(path, encoding='utf-8') as f:
+            output = json.load(f)
+        assert [a["Canvas ID"] for a in output["assignments"]["data"]] == ["3", "1", "2"]
+        assert [a["Canvas ID"] for a in output["announcements"]["data"]] == ["5", "4", "6"]
+
+    def test_each_item_converted_once(self, tmp_path, monkeypatch):
+        """Test that sorting happens on models, converting each item once."""
+        calls = []
+        original = Assignment.to_dict
+        monkeypatch.setattr(Assignment, "to_dict", lambda self: calls.append(self.id) or original(self))
+
+        JSONWriter(str(tmp_path / "out.ndjson")).write(assignments=[make_assignment(i) for i in range(3)])
+        assert sorted(calls) == ["0", "1", "2"]
+
+
+class TestParquetWriter:
+    """Test suite for ParquetWriter."""
+
+    def test_typed_columns_sorted(self, tmp_path):
+        """Test typed columns and due-date order for assignments."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        assignments = [
+            make_assignment(1, None),
+            make_assignment(2, "2026-03-01T10:00:00Z"),
+            make_assignment(3, "2025-12-01T10:00:00Z"),
+        ]
+        path = ParquetWriter(str(tmp_path / "out.parquet")).write(assignments)
+
+        table = pq.read_table(path)
+        assert str(table.schema.field("due_at").type) == "timestamp[us, tz=UTC]"
+        assert str(table.schema.field("points_possible").type) == "double"
+        assert str(table.schema.field("has_submitted_submissions").type) == "bool"
+        rows = table.to_pylist()
+        assert [row["id"] for row in rows] == ["3", "2", "1"]
+        assert rows[0]["due_at"] == datetime(2025, 12, 1, 10, tzinfo=timezone.utc)
+        assert rows[0]["points_possible"] == 10.0
+        assert rows[0]["submission_types"] == ["online_upload"]
+        assert rows[2]["due_at"] is None
+
+    def test_streams_in_row_groups(self, tmp_path):
+        """Test that generator input is written in row groups, in order."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        items = (make_module_item(i) for i in range(5))
+        path = ParquetWriter(str(tmp_path / "out.parquet"), row_group_size=2).write(items)
+
+        parquet_file = pq.ParquetFile(path)
+        assert parquet_file.metadata.num_row_groups == 3
+        assert parquet_file.read().column("title").to_pylist() == [f"Item {i}" for i in range(5)]
+
+    @pytest.mark.parametrize("suffix", [".arrow", ".feather"])
+    def test_arrow_ipc_inferred_from_extension(self, tmp_path, suffix):
+        """Test that Arrow extensions write an Arrow IPC file."""
+        ipc = pytest.importorskip("pyarrow.ipc")
+        announcements = [
+            make_announcement(1, "2026-01-01T10:00:00Z"),
+            make_announcement(2, "2026-02-01T10:00:00Z"),
+        ]
+        writer = ParquetWriter(str(tmp_path / f"out{suffix}"))
+        assert writer.format == "arrow"
+
+        table = ipc.open_file(writer.write(announcements)).read_all()
+        assert table.column("id").to_pylist() == ["2", "1"]
+        assert table.column("attachment_count").to_pylist() == [0, 0]
+        assert table.column("embedded_links").to_pylist()[0] == [
+            {"text": "the syllabus", "url": "https://example.com/syllabus"}
+        ]
+
+    def test_invalid_options_rejected(self, tmp_path):
+        """Test that unknown formats and row group sizes are rejected."""
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError):
+            ParquetWriter(str(tmp_path / "out.parquet"), format="orc")
+        with pytest.raises(ValueError):
+            ParquetWriter(str(tmp_path / "out.parquet"), row_group_size=0)
+
+    def test_empty_rejected(self, tmp_path):
+        """Test that empty input is rejected."""
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError, match="No items to export"):
+            ParquetWriter(str(tmp_path / "out.parquet")).write(iter([]))
+
+
+class TestSQLiteWriter:
+    """Test suite for SQLiteWriter."""
+
+    @staticmethod
+    def _query(path, sql, *params):
+        conn = sqlite3.connect(str(path))
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def test_normalized_tables(self, tmp_path):
+        """Test that courses are stored once and content references them."""
+        path = SQLiteWriter(str(tmp_path / "out.db")).write(
+            assignments=[make_assignment(1, "2026-03-01T10:00:00Z"), make_assignment(2, course_id="789", course_name="Other")],
+            announcements=[make_announcement(3, "2026-02-01T10:00:00-05:00")],
+            modules=iter([make_module_item(4)]),
+        )
+
+        assert self._query(path, "SELECT id, name FROM courses ORDER BY id") == [
+            ("456", "Test Course"), ("789", "Other")
+        ]
+        assert self._query(path, "SELECT id, course_id, due_at, points_possible, submission_types FROM assignments ORDER BY id") == [
+            ("1", "456", "2026-03-01 10:00:00", 10.0, "online_upload"),
+            ("2", "789", None, 10.0, "online_upload"),
+        ]
+        assert self._query(path, "SELECT posted_at FROM announcements") == [("2026-02-01 15:00:00",)]
+        assert self._query(path, "SELECT module_name, published FROM module_items") == [("Week 1", 1)]
+
+    def test_repeated_export_updates_in_place(self, tmp_path):
+        """Test that rows are upserted on Canvas ID across exports."""
+        path = tmp_path / "out.db"
+        SQLiteWriter(str(path), batch_size=2).write(assignments=[make_assignment(i) for i in range(5)])
+
+        updated = make_assignment(1, "2026-03-01T10:00:00Z", course_name="Renamed")
+        SQLiteWriter(str(path)).write(assignments=[make_assignment(9), updated])
+
+        assert self._query(path, "SELECT COUNT(*) FROM assignments") == [(6,)]
+        assert self._query(path, "SELECT due_at FROM assignments WHERE id = '1'") == [("2026-03-01 10:00:00",)]
+        assert self._query(path, "SELECT name FROM courses") == [("Renamed",)]
+
+    def test_due_date_range_query_uses_index(self, tmp_path):
+        """Test that due dates compare with SQLite datetimes via the index."""
+        path = SQLiteWriter(str(tmp_path / "out.db")).write(
+            assignments=[make_assignment(1, iso(2)), make_assignment(2, iso(10)), make_assignment(3, iso(-2))]
+        )
+
+        sql = "SELECT id FROM assignments WHERE due_at BETWEEN datetime('now') AND datetime('now', '+7 days')"
+        assert self._query(path, sql) == [("1",)]
+        plan = " ".join(row[-1] for row in self._query(path, "EXPLAIN QUERY PLAN " + sql))
+        assert "idx_assignments_due" in plan
+
+    def test_empty_rejected(self, tmp_path):
+        """Test that empty input is rejected."""
+        with pytest.raises(ValueError, match="No content to export"):
+            SQLiteWriter(str(tmp_path / "out.db")).write(modules=iter([]))
+
+
+class TestStreamOutput:
+    """Test writing to binary streams instead of paths."""
+
+    def test_excel_to_bytesio(self):
+        """Test that the workbook is written into the buffer and returned."""
+        buffer = io.BytesIO()
+        result = ExcelWriter(buffer).write(assignments=[make_assignment(1)])
+
+        assert result is buffer
+        assert not buffer.closed
+        buffer.seek(0)
+        assert openpyxl.load_workbook(buffer).sheetnames == ["All Assignments"]
+
+    def test_csv_to_bytesio(self):
+        """Test that CSV is written as UTF-8 and the buffer stays open."""
+        buffer = io.BytesIO()
+        result = CSVWriter(buffer).write([make_module_item(1, course_name="Économie")])
+
+        assert result is buffer
+        assert not buffer.closed
+        rows = list(csv.reader(io.StringIO(buffer.getvalue().decode('utf-8'), newline='')))
+        assert tuple(rows[0]) == ModuleItem.EXPORT_COLUMNS
+        assert rows[1][0] == "Économie"
+
+    @pytest.mark.parametrize("ndjson", [False, True])
+    def test_json_to_bytesio(self, ndjson):
+        """Test both JSON modes write into the buffer."""
+        buffer = io.BytesIO()
+        result = JSONWriter(buffer, ndjson=ndjson).write(modules=[make_module_item(1)])
+
+        assert result is buffer
+        assert not buffer.closed
+        text = buffer.getvalue().decode('utf-8')
+        if ndjson:
+            assert json.loads(text.splitlines()[1])["type"] == "module_item"
+        else:
+            assert json.loads(text)["modules"]["count"] == 1
+
+    def test_json_stream_defaults_to_document(self):
+        """Test that streams have no extension to infer NDJSON from."""
+        assert not JSONWriter(io.BytesIO()).ndjson
+
+    def test_parquet_to_bytesio(self):
+        """Test that Parquet can be written into a buffer."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        buffer = io.BytesIO()
+        result = ParquetWriter(buffer).write([make_assignment(1)])
+
+        assert result is buffer
+        assert not buffer.closed
+        buffer.seek(0)
+        assert pq.read_table(buffer).column("id").to_pylist() == ["1"]
+
+
+class TestCompressedOutput:
+    """Test streaming gzip / zstd compression in the CSV and JSON writers."""
+
+    @staticmethod
+    def _zstd_decompress(data):
+        zstandard = pytest.importorskip("zstandard")
+        return zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)).read()
+
+    def test_csv_gzip_inferred_from_extension(self, tmp_path):
+        """Test that .csv.gz paths are gzip-compressed while written."""
+        plain = CSVWriter(str(tmp_path / "out.csv")).write([make_assignment(i) for i in range(20)])
+        path = CSVWriter(str(tmp_path / "out.csv.gz")).write([make_assignment(i) for i in range(20)])
+
+        assert gzip.decompress(path.read_bytes()) == plain.read_bytes()
+
+    def test_csv_zstd_to_stream(self):
+        """Test explicit zstd compression into a binary stream."""
+        buffer = io.BytesIO()
+        CSVWriter(buffer, compression="zstd").write([make_module_item(1)])
+
+        assert not buffer.closed
+        text = self._zstd_decompress(buffer.getvalue()).decode('utf-8')
+        assert text.splitlines()[0] == ",".join(ModuleItem.EXPORT_COLUMNS)
+
+    def test_json_document_gzip(self, tmp_path):
+        """Test that JSON documents can be gzip-compressed."""
+        path = JSONWriter(str(tmp_path / "out.json"), compression="gzip").write(modules=[make_module_item(1)])
+
+        assert json.loads(gzip.decompress(path.read_bytes()))["modules"]["count"] == 1
+
+    @pytest.mark.parametrize("suffix", [".ndjson.gz", ".jsonl.zst"])
+    def test_ndjson_compressed_inferred(self, tmp_path, suffix):
+        """Test that compressed NDJSON paths keep NDJSON mode."""
+        writer = JSONWriter(str(tmp_path / f"out{suffix}"))
+        assert writer.ndjson
+        path = writer.write(modules=[make_module_item(1), make_module_item(2)])
+
+        data = path.read_bytes()
+        data = gzip.decompress(data) if suffix.endswith(".gz") else self._zstd_decompress(data)
+        lines = [json.loads(line) for line in data.decode('utf-8').splitlines()]
+        assert [line["type"] for line in lines] == ["metadata", "module_item", "module_item"]
+
+    def test_uncompressed_by_default(self, tmp_path):
+        """Test that plain extensions and compression=None write plain text."""
+        assert CSVWriter(str(tmp_path / "out.csv")).compression is None
+        assert JSONWriter(str(tmp_path / "out.json.gz"), compression=None).compression is None
+        assert CSVWriter(io.BytesIO()).compression is None
+
+    def test_unknown_codec_rejected(self, tmp_path):
+        """Test that unsupported codecs are rejected."""
+        with pytest.raises(ValueError, match="compression"):
+            CSVWriter(str(tmp_path / "out.csv"), compression="bz2")
+
+
+class TestFanOutWriter:
+    """Test suite for FanOutWriter."""
+
+    @staticmethod
+    def _content():
+        return {
+            "assignments": [make_assignment(1, None), make_assignment(2, "2026-03-01T10:00:00Z"), make_assignment(3, "2025-12-01T10:00:00Z")],
+            "announcements": iter([make_announcement(4, "2026-01-01T10:00:00Z"), make_announcement(5, "2026-02-01T10:00:00Z")]),
+            "modules": (make_module_item(i) for i in (7, 6)),
+        }
+
+    def test_matches_individual_writers(self, tmp_path):
+        """Test that every sink gets the same output as writing on its own."""
+        sinks = [
+            JSONWriter(str(tmp_path / "fan.ndjson")),
+            (CSVWriter(str(tmp_path / "fan_assignments.csv")), "assignments"),
+            (CSVWriter(str(tmp_path / "fan_modules.csv")), "modules"),
+            ExcelWriter(str(tmp_path / "fan.xlsx")),
+        ]
+        results = FanOutWriter(sinks).write(**self._content())
+
+        assert results == [tmp_path / "fan.ndjson", tmp_path / "fan_assignments.csv", tmp_path / "fan_modules.csv", tmp_path / "fan.xlsx"]
+
+        content = self._content()
+        content["announcements"] = list(content["announcements"])
+        content["modules"] = list(content["modules"])
+        JSONWriter(str(tmp_path / "solo.ndjson")).write(**content)
+        CSVWriter(str(tmp_path / "solo_assignments.csv")).write(content["assignments"])
+        CSVWriter(str(tmp_path / "solo_modules.csv")).write(content["modules"])
+
+        strip_metadata = lambda path: path.read_text(encoding='utf-8').splitlines()[1:]
+        assert strip_metadata(tmp_path / "fan.ndjson") == strip_metadata(tmp_path / "solo.ndjson")
+        assert (tmp_path / "fan_assignments.csv").read_bytes() == (tmp_path / "solo_assignments.csv").read_bytes()
+        assert (tmp_path / "fan_modules.csv").read_bytes() == (tmp_path / "solo_modules.csv").read_bytes()
+
+        sheet = openpyxl.load_workbook(tmp_path / "fan.xlsx")["All Assignments"]
+        assert [sheet.cell(row=r, column=7).value for r in (2, 3, 4)] == ["3", "2", "1"]
+
+    def test_each_item_converted_once(self, tmp_path, monkeypatch):
+        """Test that rows are computed once and shared by all sinks."""
+        calls = []
+        original = Assignment.to_dict
+        monkeypatch.setattr(Assignment, "to_dict", lambda self: calls.append(self.id) or original(self))
+
+        sinks = [
+            (CSVWriter(str(tmp_path / "a.csv")), "assignments"),
+            JSONWriter(str(tmp_path / "a.json")),
+            ExcelWriter(str(tmp_path / "a.xlsx")),
+            SQLiteWriter(str(tmp_path / "a.db")),
+        ]
+        FanOutWriter(sinks).write(assignments=[make_assignment(i) for i in range(3)])
+
+        assert sorted(calls) == ["0", "1", "2"]
+
+    def test_same_writer_in_two_sinks(self):
+        """Test that one writer instance can be used by concurrent sinks."""
+        writer = CSVWriter(io.BytesIO())
+        assignments = [make_assignment(i) for i in range(3)]
+        FanOutWriter([(writer, "assignments"), (writer, "assignments")]).write(assignments=assignments)
+
+        assert "_to_row" not in vars(writer)
+
+    def test_rows_require_presorted(self, tmp_path):
+        """Test that precomputed rows are only accepted with presorted input."""
+        items = [make_assignment(1)]
+        with pytest.raises(ValueError, match="presorted"):
+            CSVWriter(str(tmp_path / "a.csv")).write(items, rows=[items[0].to_dict()])
+
+    def test_sequential_mode(self, tmp_path):
+        """Test that max_workers=1 writes the sinks in order."""
+        results = FanOutWriter(
+            [(CSVWriter(str(tmp_path / f"{i}.csv")), "modules") for i in range(3)],
+            max_workers=1
+        ).write(modules=[make_module_item(1)])
+
+        assert all(path.exists() for path in results)
+
+    def test_single_type_writer_needs_content(self, tmp_path):
+        """Test that CSV sinks must name their content type."""
+        with pytest.raises(ValueError, match="one content type"):
+            FanOutWriter([CSVWriter(str(tmp_path / "a.csv"))])
+        with pytest.raises(ValueError, match="content must be one of"):
+            FanOutWriter([(CSVWriter(str(tmp_path / "a.csv")), "quizzes")])
+
+    def test_empty_rejected(self, tmp_path):
+        """Test that empty input is rejected."""
+        with pytest.raises(ValueError, match="No content to export"):
+            FanOutWriter([JSONWriter(str(tmp_path / "a.json"))]).write(modules=[])
+
+
+class TestZipBundleWriter:
+    """Test suite for ZipBundleWriter."""
+
+    def test_one_csv_per_content_type(self, tmp_path):
+        """Test that each content type becomes a CSV entry matching CSVWriter."""
+        assignments = [make_assignment(1, None), make_assignment(2, "2026-03-01T10:00:00Z")]
+        modules = [make_module_item(1), make_module_item(2)]
+        path = ZipBundleWriter(str(tmp_path / "export.zip")).write(
+            assignments=assignments, modules=iter(modules)
+        )
+
+        CSVWriter(str(tmp_path / "assignments.csv")).write(assignments)
+        CSVWriter(str(tmp_path / "modules.csv")).write(modules)
+        with zipfile.ZipFile(path) as archive:
+            assert archive.namelist() == ["export_assignments.csv", "export_modules.csv"]
+            assert archive.getinfo("export_modules.csv").compress_type == zipfile.ZIP_DEFLATED
+            assert archive.read("export_assignments.csv") == (tmp_path / "assignments.csv").read_bytes()
+            assert archive.read("export_modules.csv") == (tmp_path / "modules.csv").read_bytes()
+
+    def test_to_bytesio_with_prefix(self):
+        """Test writing the archive into a buffer."""
+        buffer = io.BytesIO()
+        result = ZipBundleWriter(buffer, prefix="spring").write(announcements=[make_announcement(1)])
+
+        assert result is buffer
+        assert not buffer.closed
+        with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as archive:
+            assert archive.namelist() == ["spring_announcements.csv"]
+
+    def test_stream_default_prefix(self):
+        """Test the default entry prefix for streams."""
+        assert ZipBundleWriter(io.BytesIO()).prefix == "canvas_export"
+
+    def test_empty_rejected(self, tmp_path):
+        """Test that empty input is rejected."""
+        with pytest.raises(ValueError, match="No content to export"):
+            ZipBundleWriter(str(tmp_path / "export.zip")).write(assignments=iter([]))
+
+
+class TestColumnSelection:
+    """Test column selection in the row-based writers."""
+
+    def test_csv_columns(self, tmp_path):
+        """Test that CSV writes only the selected columns, in order."""
+        path = CSVWriter(str(tmp_path / "out.csv"), columns=["Due Date", "Course", "Assignment"]).write(
+            [make_assignment(1, "2026-03-01T10:00:00Z")]
+        )
+
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows == [["Due Date", "Course", "Assignment"], ["03/01/2026 10:00 AM", "Test Course", "Assignment 1"]]
+
+    def test_csv_unknown_column_rejected_before_writing(self, tmp_path):
+        """Test that unknown columns fail before the file is created."""
+        path = tmp_path / "out.csv"
+        with pytest.raises(ValueError, match="Unknown Assignment column"):
+            CSVWriter(str(path), columns=["Course", "Title"]).write([make_assignment(1)])
+        assert not path.exists()
+
+    def test_json_columns_per_content_type(self, tmp_path):
+        """Test that JSON selects columns per content type."""
+        path = JSONWriter(str(tmp_path / "out.ndjson"), columns={"modules": ["Item Title"]}).write(
+            assignments=[make_assignment(1)], modules=[make_module_item(1)], include_metadata=False
+        )
+
+        lines = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+        assert tuple(lines[0]["data"]) == Assignment.EXPORT_COLUMNS
+        assert lines[1]["data"] == {"Item Title": "Item 1"}
+
+    def test_json_columns_validated(self, tmp_path):
+        """Test that JSON column selections are validated up front."""
+        with pytest.raises(ValueError, match="columns keys"):
+            JSONWriter(str(tmp_path / "out.json"), columns={"quizzes": ["Title"]})
+        with pytest.raises(ValueError, match="Unknown Announcement column"):
+            JSONWriter(str(tmp_path / "out.json"), columns={"announcements": ["Assignment"]})
+
+    def test_zip_bundle_columns(self, tmp_path):
+        """Test that the zip bundle passes selections to each CSV."""
+        path = ZipBundleWriter(str(tmp_path / "export.zip"), columns={"assignments": ["Course"]}).write(
+            assignments=[make_assignment(1)], modules=[make_module_item(1)]
+        )
+
+        with zipfile.ZipFile(path) as archive:
+            assert archive.read("export_assignments.csv").decode('utf-8').splitlines() == ["Course", "Test Course"]
+            assert archive.read("export_modules.csv").decode('utf-8').splitlines()[0] == ",".join(ModuleItem.EXPORT_COLUMNS)
+
+    def test_fan_out_with_selected_columns(self, tmp_path):
+        """Test that sinks with a column selection convert their own rows."""
+        narrow = (CSVWriter(str(tmp_path / "narrow.csv"), columns=["Canvas ID"]), "assignments")
+        full = (CSVWriter(str(tmp_path / "full.csv")), "assignments")
+        FanOutWriter([narrow, full]).write(assignments=[make_assignment(1)])
+
+        assert (tmp_path / "narrow.csv").read_text(encoding='utf-8').splitlines() == ["Canvas ID", "1"]
+        assert (tmp_path / "full.csv").read_text(encoding='utf-8').splitlines()[0] == ",".join(Assignment.EXPORT_COLUMNS)